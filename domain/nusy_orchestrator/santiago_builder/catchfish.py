@@ -33,15 +33,30 @@ Provenance Tracking:
 import asyncio
 import hashlib
 import json
+import mmap
+import os
 import re
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 from uuid import uuid4
 
+from domain.nusy_orchestrator.santiago_builder.extraction_cache import ExtractionCache, make_cache_key
+
+# Bump whenever extraction output changes so cached results are not reused
+EXTRACTOR_VERSION = "2"
+
+# Streaming extraction: sources at least this large are processed in chunks
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+CHUNK_SIZE_BYTES = 1024 * 1024
+CHUNK_OVERLAP_BYTES = 4096  # Context on each side so matches aren't cut at boundaries
+HASH_BLOCK_BYTES = 1024 * 1024
+STREAMED_TEXT_ISSUE = "Raw text streamed in chunks and not retained"
+
 
 class ExtractionLayer(Enum):
     """4 extraction layers"""
@@ -126,6 +141,253 @@ class ExtractionResult:
     issues: List[str] = field(default_factory=list)
 
 
+@dataclass
+class SourceExtraction:
+    """Outcome for one source of a batch extraction"""
+    source_path: Path
+    results: List[ExtractionResult] = field(default_factory=list)
+    error: Optional[str] = None
+    from_cache: bool = False
+
+
+@dataclass
+class SourceChunk:
+    """A window of a source file; matches are owned by the chunk they start in"""
+    offset: int  # Absolute byte offset of data[0]
+    data: bytes
+    owned_start: int  # Owned region within data (excludes the overlap context)
+    owned_end: int
+
+
+CONCEPT_REGEX = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b'
+RELATIONSHIP_REGEX = r'(\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(involves?|includes?|requires?)\s+(\b[a-z]+(?:\s+[a-z]+)*)'
+
+CONCEPT_PATTERN = re.compile(CONCEPT_REGEX)
+RELATIONSHIP_PATTERN = re.compile(RELATIONSHIP_REGEX, re.IGNORECASE)
+
+# Byte patterns for streaming, applied directly to file windows without decoding
+CONCEPT_PATTERN_BYTES = re.compile(CONCEPT_REGEX.encode())
+RELATIONSHIP_PATTERN_BYTES = re.compile(RELATIONSHIP_REGEX.encode(), re.IGNORECASE)
+
+
+def read_raw_text(source_path: Path) -> str:
+    """Read a source file as text"""
+    # TODO: Add PDF parsing, API fetching, etc.
+    if source_path.suffix == ".md":
+        with open(source_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    # For demo, just read as text
+    with open(source_path, 'r', encoding='utf-8', errors='ignore') as f:
+        return f.read()
+
+
+def find_entities(raw_text: str, metadata: SourceMetadata) -> Tuple[List[Entity], List[Relationship]]:
+    """Pattern-match concepts and relationships in raw text"""
+    # TODO: Implement actual NLP extraction (spaCy, LLM, etc.)
+    # For now, simple pattern matching
+    entities = []
+    relationships = []
+    
+    # Extract concepts (capitalized words)
+    concepts = set(CONCEPT_PATTERN.findall(raw_text))
+    
+    for concept in list(concepts)[:10]:  # Limit for demo
+        entities.append(Entity(
+            entity_id=f"entity_{uuid4().hex[:8]}",
+            entity_type="concept",
+            name=concept,
+            description=f"Concept extracted from {metadata.file_path.name}",
+            confidence=0.8,
+            source_references=[metadata.source_id],
+        ))
+    
+    # Extract simple relationships (X involves Y pattern)
+    matches = RELATIONSHIP_PATTERN.findall(raw_text)
+    
+    for subject, predicate, obj in matches[:5]:  # Limit for demo
+        relationships.append(Relationship(
+            relationship_id=f"rel_{uuid4().hex[:8]}",
+            subject_id=subject,
+            predicate=predicate.lower(),
+            object_id=obj,
+            confidence=0.7,
+            source_references=[metadata.source_id],
+        ))
+    
+    return entities, relationships
+
+
+def hash_file(source_path: Path, block_size: int = HASH_BLOCK_BYTES) -> str:
+    """SHA-256 of a file, read incrementally"""
+    digest = hashlib.sha256()
+    with open(source_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def iter_source_chunks(
+    source_path: Path,
+    chunk_size: int = CHUNK_SIZE_BYTES,
+    overlap: int = CHUNK_OVERLAP_BYTES,
+) -> Iterator[SourceChunk]:
+    """
+    Yield overlapping fixed-size windows of a file.
+    
+    Files larger than one chunk are memory-mapped, so only the current
+    window is copied into memory.
+    """
+    size = source_path.stat().st_size
+    if size == 0:
+        return
+    
+    with open(source_path, 'rb') as f:
+        if size <= chunk_size:
+            data = f.read()
+            yield SourceChunk(offset=0, data=data, owned_start=0, owned_end=len(data))
+            return
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for start in range(0, size, chunk_size):
+                window_start = max(0, start - overlap)
+                window_end = min(size, start + chunk_size + overlap)
+                yield SourceChunk(
+                    offset=window_start,
+                    data=mapped[window_start:window_end],
+                    owned_start=start - window_start,
+                    owned_end=min(size, start + chunk_size) - window_start,
+                )
+
+
+def iter_entities(
+    chunks: Iterator[SourceChunk],
+    metadata: SourceMetadata,
+    max_entities: int = 10,
+    max_relationships: int = 5,
+) -> Iterator[Union[Entity, Relationship]]:
+    """
+    Emit entities and relationships as they are found in a chunk stream.
+    
+    A match counts only in the chunk where it starts, so the overlap never
+    produces duplicates or partial matches. Stops reading once both limits
+    are reached.
+    """
+    seen_concepts = set()
+    seen_relationships = set()
+    
+    for chunk in chunks:
+        if len(seen_concepts) < max_entities:
+            for match in CONCEPT_PATTERN_BYTES.finditer(chunk.data):
+                if not chunk.owned_start <= match.start() < chunk.owned_end:
+                    continue
+                concept = match.group(1).decode('utf-8', errors='ignore')
+                if concept in seen_concepts:
+                    continue
+                seen_concepts.add(concept)
+                yield Entity(
+                    entity_id=f"entity_{uuid4().hex[:8]}",
+                    entity_type="concept",
+                    name=concept,
+                    description=f"Concept extracted from {metadata.file_path.name}",
+                    confidence=0.8,
+                    source_references=[metadata.source_id],
+                    attributes={"offset": chunk.offset + match.start()},
+                )
+                if len(seen_concepts) >= max_entities:
+                    break
+        
+        if len(seen_relationships) < max_relationships:
+            for match in RELATIONSHIP_PATTERN_BYTES.finditer(chunk.data):
+                if not chunk.owned_start <= match.start() < chunk.owned_end:
+                    continue
+                subject, predicate, obj = (g.decode('utf-8', errors='ignore') for g in match.groups())
+                key = (subject, predicate.lower(), obj)
+                if key in seen_relationships:
+                    continue
+                seen_relationships.add(key)
+                yield Relationship(
+                    relationship_id=f"rel_{uuid4().hex[:8]}",
+                    subject_id=subject,
+                    predicate=predicate.lower(),
+                    object_id=obj,
+                    confidence=0.7,
+                    source_references=[metadata.source_id],
+                    attributes={"offset": chunk.offset + match.start()},
+                )
+                if len(seen_relationships) >= max_relationships:
+                    break
+        
+        if len(seen_concepts) >= max_entities and len(seen_relationships) >= max_relationships:
+            return
+
+
+def stream_entities(source_path: Path, metadata: SourceMetadata) -> Tuple[List[Entity], List[Relationship]]:
+    """Chunked equivalent of find_entities for sources too large to load"""
+    entities = []
+    relationships = []
+    for item in iter_entities(iter_source_chunks(source_path), metadata):
+        if isinstance(item, Entity):
+            entities.append(item)
+        else:
+            relationships.append(item)
+    return entities, relationships
+
+
+def _average_confidence(entities: List[Entity], relationships: List[Relationship]) -> float:
+    all_confidences = [e.confidence for e in entities] + [r.confidence for r in relationships]
+    return sum(all_confidences) / len(all_confidences) if all_confidences else 0.0
+
+
+def run_text_layers(
+    source_path: Path,
+    metadata: SourceMetadata,
+    method: ExtractionMethod,
+    target_layer: ExtractionLayer,
+    stream_threshold_bytes: int = STREAM_THRESHOLD_BYTES,
+) -> List[ExtractionResult]:
+    """
+    Run Layers 1-2 synchronously. Module-level so it can run in a worker process.
+    
+    Returns:
+        ExtractionResults for the text layers up to target_layer
+    """
+    results = []
+    streaming = metadata.file_size_bytes >= stream_threshold_bytes
+    
+    start_time = time.time()
+    raw_text = None if streaming else read_raw_text(source_path)
+    results.append(ExtractionResult(
+        layer=ExtractionLayer.RAW_TEXT,
+        source_metadata=metadata,
+        method=method,
+        started_at=datetime.fromtimestamp(start_time),
+        completed_at=datetime.now(),
+        extraction_time_seconds=time.time() - start_time,
+        raw_text=raw_text,
+        issues=[STREAMED_TEXT_ISSUE] if streaming else [],
+    ))
+    
+    if target_layer.value >= ExtractionLayer.ENTITIES.value:
+        start_time = time.time()
+        if streaming:
+            entities, relationships = stream_entities(source_path, metadata)
+        else:
+            entities, relationships = find_entities(raw_text, metadata)
+        results.append(ExtractionResult(
+            layer=ExtractionLayer.ENTITIES,
+            source_metadata=metadata,
+            method=method,
+            started_at=datetime.fromtimestamp(start_time),
+            completed_at=datetime.now(),
+            extraction_time_seconds=time.time() - start_time,
+            entities=entities,
+            relationships=relationships,
+            confidence_avg=_average_confidence(entities, relationships),
+        ))
+    
+    return results
+
+
 class Catchfish:
     """
     Performs 4-layer domain knowledge extraction from raw sources.
@@ -142,6 +404,10 @@ class Catchfish:
             source_path=Path("safe_agile.pdf"),
             target_layer=ExtractionLayer.KG_TRIPLES
         )
+        
+        # Many sources across a process pool, results as they complete
+        async for extraction in catchfish.extract_many(sources):
+            ...
     """
     
     def __init__(
@@ -149,10 +415,15 @@ class Catchfish:
         workspace_path: Path,
         default_method: ExtractionMethod = ExtractionMethod.LLM_SUMMARIZATION,
         target_time_per_source: int = 900,  # 15 minutes
+        cache_enabled: bool = True,
+        max_workers: Optional[int] = None,
+        stream_threshold_bytes: int = STREAM_THRESHOLD_BYTES,
     ):
         self.workspace_path = Path(workspace_path)
         self.default_method = default_method
         self.target_time_per_source = target_time_per_source
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.stream_threshold_bytes = stream_threshold_bytes
         
         # Setup directories
         self.catches_dir = self.workspace_path / "knowledge" / "catches"
@@ -160,12 +431,16 @@ class Catchfish:
         
         self.catches_dir.mkdir(parents=True, exist_ok=True)
         self.provenance_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Results of unchanged sources are reused across cycles and runs
+        self.cache = ExtractionCache(self.catches_dir / ".extraction-cache", enabled=cache_enabled)
     
     async def extract_from_source(
         self,
         source_path: Path,
         target_layer: ExtractionLayer = ExtractionLayer.KG_TRIPLES,
         method: Optional[ExtractionMethod] = None,
+        use_cache: bool = True,
     ) -> List[ExtractionResult]:
         """
         Extract knowledge from source through all layers up to target.
@@ -174,6 +449,7 @@ class Catchfish:
             source_path: Path to source file
             target_layer: Stop at this layer (default: KG_TRIPLES)
             method: Extraction method (default: from __init__)
+            use_cache: Return cached results if the source is unchanged
             
         Returns:
             List of ExtractionResult for each layer processed
@@ -190,6 +466,13 @@ class Catchfish:
         # Create source metadata
         source_metadata = self._create_source_metadata(source_path)
         
+        cache_key = make_cache_key(source_metadata.file_hash, method.value, target_layer.value, EXTRACTOR_VERSION)
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                print(f"   ♻️  Cache hit: source unchanged (hash {source_metadata.file_hash[:12]}...)")
+                return cached
+        
         # Process through layers
         results = []
         
@@ -197,54 +480,152 @@ class Catchfish:
         if target_layer.value >= ExtractionLayer.RAW_TEXT.value:
             result = await self._layer1_extract_raw_text(source_path, source_metadata, method)
             results.append(result)
-            print(f"   ✅ Layer 1: Extracted {len(result.raw_text)} characters")
+            if result.raw_text is None:
+                print(f"   ✅ Layer 1: Streaming {source_metadata.file_size_bytes} bytes in chunks")
+            else:
+                print(f"   ✅ Layer 1: Extracted {len(result.raw_text)} characters")
         
         # Layer 2: Entities
         if target_layer.value >= ExtractionLayer.ENTITIES.value:
-            raw_text = results[0].raw_text if results else ""
+            raw_text = results[0].raw_text if results else None
             result = await self._layer2_extract_entities(raw_text, source_metadata, method)
             results.append(result)
             print(f"   ✅ Layer 2: Extracted {len(result.entities)} entities, {len(result.relationships)} relationships")
         
+        return await self._finish_extraction(results, source_metadata, target_layer, method, cache_key)
+    
+    async def extract_many(
+        self,
+        sources: List[Path],
+        target_layer: ExtractionLayer = ExtractionLayer.KG_TRIPLES,
+        method: Optional[ExtractionMethod] = None,
+        max_concurrency: Optional[int] = None,
+        use_cache: bool = True,
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[SourceExtraction]:
+        """
+        Extract many sources in parallel, yielding each as soon as it completes.
+        
+        Layers 1-2 (file reading and pattern matching) run in a process pool so
+        throughput scales with cores; Layers 3-4, provenance and caching run
+        here. Each source keeps its own SourceMetadata and provenance file.
+        
+        Args:
+            sources: Source files to process
+            target_layer: Stop at this layer (default: KG_TRIPLES)
+            method: Extraction method (default: from __init__)
+            max_concurrency: Maximum sources in flight (default: max_workers)
+            use_cache: Return cached results for unchanged sources
+            executor: Executor for Layers 1-2 (default: a ProcessPoolExecutor)
+            
+        Yields:
+            SourceExtraction per source, in completion order. Failures are
+            reported via SourceExtraction.error rather than raised.
+        """
+        method = method or self.default_method
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_workers)
+        pool: Optional[Executor] = executor
+        owns_pool = executor is None
+        
+        def get_pool() -> Executor:
+            # Created on first cache miss so fully cached batches never start workers
+            nonlocal pool
+            if pool is None:
+                pool = ProcessPoolExecutor(max_workers=min(self.max_workers, max(1, len(sources))))
+            return pool
+        
+        async def extract_one(source_path: Path) -> SourceExtraction:
+            async with semaphore:
+                try:
+                    if not source_path.exists():
+                        raise FileNotFoundError(f"Source not found: {source_path}")
+                    
+                    loop = asyncio.get_running_loop()
+                    source_metadata = await loop.run_in_executor(None, self._create_source_metadata, source_path)
+                    cache_key = make_cache_key(
+                        source_metadata.file_hash, method.value, target_layer.value, EXTRACTOR_VERSION
+                    )
+                    if use_cache:
+                        cached = self.cache.get(cache_key)
+                        if cached is not None:
+                            return SourceExtraction(source_path=source_path, results=cached, from_cache=True)
+                    
+                    results = await loop.run_in_executor(
+                        get_pool(), run_text_layers, source_path, source_metadata, method, target_layer,
+                        self.stream_threshold_bytes,
+                    )
+                    results = await self._finish_extraction(
+                        results, source_metadata, target_layer, method, cache_key, verbose=False
+                    )
+                    return SourceExtraction(source_path=source_path, results=results)
+                except Exception as e:
+                    return SourceExtraction(source_path=source_path, error=str(e))
+        
+        tasks = [asyncio.ensure_future(extract_one(Path(source))) for source in sources]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                extraction = await next_done
+                status = "♻️  cached" if extraction.from_cache else ("❌ " + extraction.error if extraction.error else "✅")
+                print(f"   🎣 {extraction.source_path.name}: {status}")
+                yield extraction
+        finally:
+            for task in tasks:
+                task.cancel()
+            if owns_pool and pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+    
+    async def _finish_extraction(
+        self,
+        results: List[ExtractionResult],
+        source_metadata: SourceMetadata,
+        target_layer: ExtractionLayer,
+        method: ExtractionMethod,
+        cache_key: str,
+        verbose: bool = True,
+    ) -> List[ExtractionResult]:
+        """Run Layers 3-4 on text-layer results, then save provenance and cache"""
+        entities = results[1].entities if len(results) > 1 else []
+        relationships = results[1].relationships if len(results) > 1 else []
+        
         # Layer 3: Structured Docs
         if target_layer.value >= ExtractionLayer.STRUCTURED_DOCS.value:
-            entities = results[1].entities if len(results) > 1 else []
-            relationships = results[1].relationships if len(results) > 1 else []
             result = await self._layer3_create_structured_docs(
                 entities, relationships, source_metadata, method
             )
             results.append(result)
-            print(f"   ✅ Layer 3: Created structured doc at {result.structured_doc_path}")
+            if verbose:
+                print(f"   ✅ Layer 3: Created structured doc at {result.structured_doc_path}")
         
         # Layer 4: KG Triples
         if target_layer.value >= ExtractionLayer.KG_TRIPLES.value:
-            entities = results[1].entities if len(results) > 1 else []
-            relationships = results[1].relationships if len(results) > 1 else []
             result = await self._layer4_generate_kg_triples(
                 entities, relationships, source_metadata, method
             )
             results.append(result)
-            print(f"   ✅ Layer 4: Generated {len(result.kg_triples)} KG triples")
+            if verbose:
+                print(f"   ✅ Layer 4: Generated {len(result.kg_triples)} KG triples")
         
         # Calculate total extraction time
         total_time = sum(r.extraction_time_seconds for r in results)
-        print(f"   ⏱️  Total Extraction Time: {total_time:.2f}s ({total_time / 60:.1f}m)")
-        
-        if total_time > self.target_time_per_source:
-            print(f"   ⚠️  Above target {self.target_time_per_source}s, optimization needed")
-        else:
-            print(f"   🎯 Under target {self.target_time_per_source}s!")
+        if verbose:
+            print(f"   ⏱️  Total Extraction Time: {total_time:.2f}s ({total_time / 60:.1f}m)")
+            
+            if total_time > self.target_time_per_source:
+                print(f"   ⚠️  Above target {self.target_time_per_source}s, optimization needed")
+            else:
+                print(f"   🎯 Under target {self.target_time_per_source}s!")
         
         # Save provenance
-        self._save_provenance(source_metadata, results, total_time)
+        self._save_provenance(source_metadata, results, total_time, verbose=verbose)
+        
+        self.cache.put(cache_key, results)
         
         return results
     
     def _create_source_metadata(self, source_path: Path) -> SourceMetadata:
         """Create metadata for source file"""
-        # Calculate SHA-256 hash
-        with open(source_path, 'rb') as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()
+        # Calculate SHA-256 hash without loading the whole file
+        file_hash = hash_file(source_path)
         
         return SourceMetadata(
             source_id=str(uuid4()),
@@ -261,18 +642,11 @@ class Catchfish:
         metadata: SourceMetadata,
         method: ExtractionMethod,
     ) -> ExtractionResult:
-        """Layer 1: Extract raw text from source file"""
+        """Layer 1: Extract raw text from source file (large files are left for Layer 2 to stream)"""
         start_time = time.time()
         
-        # Read file content
-        # TODO: Add PDF parsing, API fetching, etc.
-        if source_path.suffix == ".md":
-            with open(source_path, 'r', encoding='utf-8') as f:
-                raw_text = f.read()
-        else:
-            # For demo, just read as text
-            with open(source_path, 'r', encoding='utf-8', errors='ignore') as f:
-                raw_text = f.read()
+        streaming = metadata.file_size_bytes >= self.stream_threshold_bytes
+        raw_text = None if streaming else read_raw_text(source_path)
         
         # Simulate processing time
         await asyncio.sleep(0.1)
@@ -287,52 +661,25 @@ class Catchfish:
             completed_at=datetime.now(),
             extraction_time_seconds=extraction_time,
             raw_text=raw_text,
+            issues=[STREAMED_TEXT_ISSUE] if streaming else [],
         )
     
     async def _layer2_extract_entities(
         self,
-        raw_text: str,
+        raw_text: Optional[str],
         metadata: SourceMetadata,
         method: ExtractionMethod,
     ) -> ExtractionResult:
-        """Layer 2: Extract entities and relationships from raw text"""
+        """Layer 2: Extract entities and relationships from raw text (streamed from the file if None)"""
         start_time = time.time()
         
-        entities = []
-        relationships = []
-        
-        # TODO: Implement actual NLP extraction (spaCy, LLM, etc.)
-        # For now, simple pattern matching
-        
-        # Extract concepts (capitalized words)
-        concept_pattern = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b'
-        concepts = set(re.findall(concept_pattern, raw_text))
-        
-        for concept in list(concepts)[:10]:  # Limit for demo
-            entity = Entity(
-                entity_id=f"entity_{uuid4().hex[:8]}",
-                entity_type="concept",
-                name=concept,
-                description=f"Concept extracted from {metadata.file_path.name}",
-                confidence=0.8,
-                source_references=[metadata.source_id],
+        if raw_text is None:
+            # Large source: read it in bounded chunks off the event loop
+            entities, relationships = await asyncio.get_running_loop().run_in_executor(
+                None, stream_entities, metadata.file_path, metadata
             )
-            entities.append(entity)
-        
-        # Extract simple relationships (X involves Y pattern)
-        relationship_pattern = r'(\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(involves?|includes?|requires?)\s+(\b[a-z]+(?:\s+[a-z]+)*)'
-        matches = re.findall(relationship_pattern, raw_text, re.IGNORECASE)
-        
-        for subject, predicate, obj in matches[:5]:  # Limit for demo
-            relationship = Relationship(
-                relationship_id=f"rel_{uuid4().hex[:8]}",
-                subject_id=subject,
-                predicate=predicate.lower(),
-                object_id=obj,
-                confidence=0.7,
-                source_references=[metadata.source_id],
-            )
-            relationships.append(relationship)
+        else:
+            entities, relationships = find_entities(raw_text, metadata)
         
         # Simulate processing time
         await asyncio.sleep(0.15)
@@ -340,8 +687,7 @@ class Catchfish:
         extraction_time = time.time() - start_time
         
         # Calculate average confidence
-        all_confidences = [e.confidence for e in entities] + [r.confidence for r in relationships]
-        confidence_avg = sum(all_confidences) / len(all_confidences) if all_confidences else 0.0
+        confidence_avg = _average_confidence(entities, relationships)
         
         return ExtractionResult(
             layer=ExtractionLayer.ENTITIES,
@@ -503,6 +849,7 @@ relationship_count: {len(relationships)}
         metadata: SourceMetadata,
         results: List[ExtractionResult],
         total_time: float,
+        verbose: bool = True,
     ) -> None:
         """Save extraction provenance to ships-logs"""
         provenance_file = self.provenance_dir / f"{metadata.source_id[:8]}_provenance.json"
@@ -540,4 +887,5 @@ relationship_count: {len(relationships)}
         with open(provenance_file, 'w') as f:
             json.dump(provenance_data, f, indent=2)
         
-        print(f"   💾 Provenance saved: {provenance_file}")
+        if verbose:
+            print(f"   💾 Provenance saved: {provenance_file}")
@@ -0,0 +1,110 @@
+"""Extraction Cache - Persistent Catchfish Results
+
+Navigator re-runs Catchfish on every source in each of its 3-5 validation
+cycles. Sources rarely change between cycles, so results are cached on disk
+keyed by (file hash, extraction method, target layer, extractor version).
+An unchanged source returns its cached ExtractionResults immediately; editing
+the file, switching method/layer or bumping the extractor version misses.
+
+Cache entries are pickled result lists, one file per key, written atomically.
+"""
+
+import hashlib
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def make_cache_key(file_hash: str, method: str, layer: int, extractor_version: str) -> str:
+    """Build the cache key for one extraction"""
+    raw = f"{file_hash}:{method}:{layer}:{extractor_version}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ExtractionCache:
+    """On-disk cache of Catchfish extraction results"""
+
+    def __init__(self, cache_dir: Path, enabled: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        if enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "invalid_entries": 0,
+            "time_saved_seconds": 0.0,  # Extraction time the hits would have cost
+        }
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[List[Any]]:
+        """
+        Look up cached results.
+
+        Returns:
+            The cached ExtractionResult list, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        path = self._entry_path(key)
+        if not path.exists():
+            self.stats["misses"] += 1
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                results = pickle.load(f)
+        except Exception:
+            # Truncated or written by an incompatible version; extract again
+            self.stats["invalid_entries"] += 1
+            self.stats["misses"] += 1
+            path.unlink(missing_ok=True)
+            return None
+
+        # Layer 3 points at a generated document; if it was removed, the entry is stale
+        for result in results:
+            doc_path = getattr(result, "structured_doc_path", None)
+            if doc_path is not None and not Path(doc_path).exists():
+                self.stats["invalid_entries"] += 1
+                self.stats["misses"] += 1
+                path.unlink(missing_ok=True)
+                return None
+
+        self.stats["hits"] += 1
+        self.stats["time_saved_seconds"] += sum(r.extraction_time_seconds for r in results)
+        return results
+
+    def put(self, key: str, results: List[Any]) -> None:
+        """Store results for a key"""
+        if not self.enabled:
+            return
+
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+        self.stats["stores"] += 1
+
+    def clear(self) -> int:
+        """Remove every cached entry; returns the number removed"""
+        removed = 0
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.pkl"):
+                path.unlink()
+                removed += 1
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "enabled": self.enabled,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            "entries": len(list(self.cache_dir.glob("*.pkl"))) if self.cache_dir.exists() else 0,
+        }
@@ -4,9 +4,12 @@ Generates behavior-driven development tests and service manifests from domain kn
 
 1. BDD Feature Files (.feature)
    - Gherkin scenarios for each behavior/tool
-   - Linked to knowledge nodes for traceability
+   - Linked to knowledge nodes for traceability (# Knowledge: comments)
    - Contract acceptance tests
    - Coverage tracking
+   - Only behaviors whose KG evidence changed since the last cycle are
+     regenerated (off the event loop); files whose content is unchanged
+     are not rewritten
 
 2. MCP Manifest (mcp-manifest.json)
    - Service contract with tools
@@ -33,16 +36,31 @@ Knowledge Scope:
 - Ocean: Cross-domain scope (multi-domain integration)
 """
 
+import asyncio
+import hashlib
 import json
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 from uuid import uuid4
 
 
+_WORD = re.compile(r"[a-z0-9]{3,}")
+
+
+def _tokens(text: Any) -> Set[str]:
+    """Lowercase words of 3+ characters, used to match behaviors to evidence"""
+    return set(_WORD.findall(str(text).lower()))
+
+
+def content_hash(content: str) -> str:
+    """Hash used to detect unchanged generated files"""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
 class CapabilityLevel(Enum):
     """Agent capability maturity levels"""
     APPRENTICE = "apprentice"
@@ -137,8 +155,26 @@ class Fishnet:
         )
     """
     
-    def __init__(self, workspace_path: Path):
+    def __init__(self, workspace_path: Path, incremental: bool = True):
+        """
+        Args:
+            workspace_path: Root path for workspace
+            incremental: Reuse features whose KG evidence is unchanged since the last call
+        """
         self.workspace_path = Path(workspace_path)
+        self.incremental = incremental
+        
+        # Incremental state: evidence digest and feature per .feature file,
+        # content hash per written .feature file
+        self._evidence_hashes: Dict[Path, str] = {}
+        self._features: Dict[Path, BDDFeature] = {}
+        self._file_hashes: Dict[Path, str] = {}
+        self.stats = {
+            "features_generated": 0,
+            "features_reused": 0,
+            "files_written": 0,
+            "files_unchanged": 0,
+        }
         
         # Setup directories
         self.catches_dir = self.workspace_path / "knowledge" / "catches"
@@ -153,6 +189,7 @@ class Fishnet:
         behaviors: List[str],
         entities: List[Any],
         relationships: List[Any],
+        incremental: Optional[bool] = None,
     ) -> List[BDDFeature]:
         """
         Generate BDD feature files from behaviors and knowledge.
@@ -162,6 +199,7 @@ class Fishnet:
             behaviors: List of behavior/tool names
             entities: Extracted entities from Catchfish
             relationships: Extracted relationships from Catchfish
+            incremental: Override the instance setting for this call
             
         Returns:
             List of BDDFeature objects
@@ -170,21 +208,49 @@ class Fishnet:
         print(f"   Domain: {domain_name}")
         print(f"   Behaviors: {len(behaviors)}")
         
-        features = []
-        
-        for behavior in behaviors:
-            feature = await self._generate_feature_for_behavior(
-                domain_name, behavior, entities, relationships
-            )
-            features.append(feature)
-        
-        # Save features to files
-        for feature in features:
-            self._save_feature_file(domain_name, feature)
-        
-        print(f"   ✅ Generated {len(features)} feature files")
+        incremental = self.incremental if incremental is None else incremental
+        evidence_index = self._index_evidence(entities, relationships)
+        
+        # Behaviors that differ only in case or separators share one file
+        paths = [self._feature_path(domain_name, self._feature_name(behavior)) for behavior in behaviors]
+        stale: Dict[Path, Tuple[str, List[str], str]] = {}
+        reused: Set[Path] = set()
+        for behavior, path in zip(behaviors, paths):
+            if path in stale or path in reused:
+                continue
+            knowledge_refs, digest = self._behavior_evidence(behavior, evidence_index)
+            if incremental and path in self._features and self._evidence_hashes.get(path) == digest \
+                    and path.exists():
+                reused.add(path)
+            else:
+                stale[path] = (behavior, knowledge_refs, digest)
+        
+        # Generate, render and write stale features off the event loop, in one
+        # executor call (the work holds the GIL, so splitting it gains nothing)
+        results = []
+        if stale:
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(None, self._build_features, domain_name, list(stale.items()))
+        
+        written = 0
+        for path, digest, feature, was_written in results:
+            self._evidence_hashes[path] = digest
+            self._features[path] = feature
+            written += was_written
+        self.stats["features_reused"] += len(reused)
+        self.stats["features_generated"] += len(stale)
+        self.stats["files_written"] += written
+        self.stats["files_unchanged"] += len(stale) - written
+        
+        features = [self._features[path] for path in paths]
+        print(f"   ✅ Generated {len(stale) + len(reused)} feature files "
+              f"({len(stale)} regenerated, {written} written)")
         return features
     
+    def get_stats(self) -> Dict[str, Any]:
+        """Get generation statistics"""
+        return {**self.stats, "tracked_features": len(self._features)}
+    
     async def generate_mcp_manifest(
         self,
         domain_name: str,
@@ -297,16 +363,63 @@ class Fishnet:
         
         return report
     
-    async def _generate_feature_for_behavior(
+    def _build_features(
+        self, domain_name: str, jobs: List[Tuple[Path, Tuple[str, List[str], str]]]
+    ) -> List[Tuple[Path, str, BDDFeature, bool]]:
+        """Generate and save features (runs in an executor thread)"""
+        results = []
+        (self.catches_dir / domain_name / "bdd-tests").mkdir(parents=True, exist_ok=True)
+        for path, (behavior, knowledge_refs, digest) in jobs:
+            feature = self._generate_feature_for_behavior(domain_name, behavior, knowledge_refs)
+            results.append((path, digest, feature, self._save_feature_file(path, feature)))
+        return results
+    
+    def _index_evidence(
+        self, entities: Iterable[Any], relationships: Iterable[Any]
+    ) -> Dict[str, Tuple[FrozenSet[str], str]]:
+        """Map each word to the refs of entities/relationships mentioning it and a digest of them"""
+        by_word: Dict[str, List[Tuple[str, str]]] = {}
+        for entity in entities:
+            name = getattr(entity, "name", "")
+            description = getattr(entity, "description", "") or ""
+            ref = str(getattr(entity, "entity_id", name))
+            fingerprint = f"E|{ref}|{name}|{getattr(entity, 'entity_type', '')}|{description}"
+            for word in _tokens(name) | _tokens(description):
+                by_word.setdefault(word, []).append((ref, fingerprint))
+        for rel in relationships:
+            parts = [str(getattr(rel, attr, "")) for attr in ("subject_id", "predicate", "object_id")]
+            ref = str(getattr(rel, "relationship_id", "|".join(parts)))
+            fingerprint = "R|" + "|".join(parts)
+            for word in _tokens(" ".join(parts)):
+                by_word.setdefault(word, []).append((ref, fingerprint))
+        return {
+            word: (frozenset(ref for ref, _ in matches),
+                   content_hash("\n".join(sorted(fingerprint for _, fingerprint in matches))))
+            for word, matches in by_word.items()
+        }
+    
+    def _behavior_evidence(
+        self, behavior: str, evidence_index: Dict[str, Tuple[FrozenSet[str], str]]
+    ) -> Tuple[List[str], str]:
+        """Knowledge refs supporting a behavior and a digest of that evidence"""
+        refs: Set[str] = set()
+        digests = []
+        for word in sorted(_tokens(behavior.replace("_", " "))):
+            if word in evidence_index:
+                word_refs, word_digest = evidence_index[word]
+                refs.update(word_refs)
+                digests.append(f"{word}:{word_digest}")
+        return sorted(refs), "\n".join(digests)
+    
+    def _generate_feature_for_behavior(
         self,
         domain_name: str,
         behavior: str,
-        entities: List[Any],
-        relationships: List[Any],
+        knowledge_refs: Optional[List[str]] = None,
     ) -> BDDFeature:
         """Generate BDD feature for single behavior"""
         
-        feature_name = behavior.replace("_", " ").title()
+        feature_name = self._feature_name(behavior)
         
         # Create 3 scenarios per behavior: basic, edge case, error
         scenarios = [
@@ -314,6 +427,8 @@ class Fishnet:
             self._create_edge_case_scenario(behavior),
             self._create_error_scenario(behavior),
         ]
+        for scenario in scenarios:
+            scenario.knowledge_refs = list(knowledge_refs or [])
         
         feature = BDDFeature(
             feature_id=str(uuid4()),
@@ -409,19 +524,37 @@ class Fishnet:
             mutates_kg=mutates_kg,
         )
     
-    def _save_feature_file(self, domain_name: str, feature: BDDFeature) -> None:
-        """Save BDD feature to .feature file"""
-        
-        catch_dir = self.catches_dir / domain_name / "bdd-tests"
-        catch_dir.mkdir(parents=True, exist_ok=True)
-        
-        feature_file = catch_dir / f"{feature.name.lower().replace(' ', '_')}.feature"
+    def _feature_name(self, behavior: str) -> str:
+        """Feature title for a behavior name"""
+        return behavior.replace("_", " ").title()
+    
+    def _feature_path(self, domain_name: str, feature_name: str) -> Path:
+        """Path of a feature's .feature file"""
+        return self.catches_dir.joinpath(domain_name, "bdd-tests", f"{feature_name.lower().replace(' ', '_')}.feature")
+    
+    def _save_feature_file(self, feature_file: Path, feature: BDDFeature) -> bool:
+        """
+        Save BDD feature to .feature file.
         
+        Returns:
+            False if the file already had identical content (not rewritten)
+        """
         # Generate Gherkin content
         content = self._generate_gherkin(feature)
+        digest = content_hash(content)
+        
+        if feature_file.exists():
+            existing = self._file_hashes.get(feature_file)
+            if existing is None:
+                existing = content_hash(feature_file.read_text())
+            if existing == digest:
+                self._file_hashes[feature_file] = digest
+                return False
         
         with open(feature_file, 'w') as f:
             f.write(content)
+        self._file_hashes[feature_file] = digest
+        return True
     
     def _generate_gherkin(self, feature: BDDFeature) -> str:
         """Generate Gherkin text from BDDFeature"""
@@ -444,6 +577,8 @@ class Fishnet:
         
         # Scenarios
         for scenario in feature.scenarios:
+            if scenario.knowledge_refs:
+                lines.append(f"  # Knowledge: {', '.join(scenario.knowledge_refs)}")
             if scenario.tags:
                 lines.append("  @" + " @".join(scenario.tags))
             lines.append(f"  Scenario: {scenario.name}")
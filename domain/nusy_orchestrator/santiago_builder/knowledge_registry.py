@@ -0,0 +1,133 @@
+"""Knowledge Registry - Deduplicated Entities and Relationships
+
+Navigator runs Catchfish on the same sources in every validation cycle, so
+the same concepts come back again and again. The registry keeps one canonical
+Entity per (normalized name, type) and one Relationship per normalized
+(subject, predicate, object), merging confidence and source references of
+duplicates. It also tracks which items changed since the last KG flush so
+step 6 only writes the delta.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+
+def normalize_name(name: str) -> str:
+    """Case- and whitespace-insensitive form of a name"""
+    return " ".join(str(name).split()).lower()
+
+
+EntityKey = Tuple[str, str]
+RelationshipKey = Tuple[str, str, str]
+
+
+class KnowledgeRegistry:
+    """Canonical entities/relationships with a pending-flush delta"""
+
+    def __init__(self):
+        self.entities: Dict[EntityKey, Any] = {}
+        self.relationships: Dict[RelationshipKey, Any] = {}
+        self._pending_entities: Dict[EntityKey, None] = {}  # Ordered sets
+        self._pending_relationships: Dict[RelationshipKey, None] = {}
+        self.stats = {
+            "entities_added": 0,
+            "entities_merged": 0,
+            "relationships_added": 0,
+            "relationships_merged": 0,
+            "flushes": 0,
+        }
+
+    @staticmethod
+    def entity_key(entity: Any) -> EntityKey:
+        name = getattr(entity, "name", None) or getattr(entity, "entity_id", "Unknown")
+        return normalize_name(name), normalize_name(getattr(entity, "entity_type", "Entity"))
+
+    @staticmethod
+    def relationship_key(rel: Any) -> RelationshipKey:
+        return (
+            normalize_name(getattr(rel, "subject_id", "Unknown")),
+            normalize_name(getattr(rel, "predicate", "relatedTo")),
+            normalize_name(getattr(rel, "object_id", "Unknown")),
+        )
+
+    def add_entity(self, entity: Any) -> bool:
+        """
+        Register an entity, merging it into an existing one with the same key.
+
+        Returns:
+            True if the entity was new
+        """
+        key = self.entity_key(entity)
+        existing = self.entities.get(key)
+        if existing is None:
+            self.entities[key] = entity
+            self._pending_entities[key] = None
+            self.stats["entities_added"] += 1
+            return True
+
+        self.stats["entities_merged"] += 1
+        self._merge(existing, entity)
+        # A description is the only merged field that changes the entity's triples
+        if not getattr(existing, "description", None) and getattr(entity, "description", None):
+            existing.description = entity.description
+            self._pending_entities[key] = None
+        return False
+
+    def add_relationship(self, rel: Any) -> bool:
+        """
+        Register a relationship, merging it into an existing one with the same key.
+
+        Returns:
+            True if the relationship was new
+        """
+        key = self.relationship_key(rel)
+        existing = self.relationships.get(key)
+        if existing is None:
+            self.relationships[key] = rel
+            self._pending_relationships[key] = None
+            self.stats["relationships_added"] += 1
+            return True
+
+        self.stats["relationships_merged"] += 1
+        self._merge(existing, rel)
+        return False
+
+    def _merge(self, existing: Any, duplicate: Any) -> None:
+        """Keep the highest confidence and the union of source references"""
+        if hasattr(existing, "confidence") and hasattr(duplicate, "confidence"):
+            existing.confidence = max(existing.confidence, duplicate.confidence)
+        if hasattr(existing, "source_references") and hasattr(duplicate, "source_references"):
+            for ref in duplicate.source_references:
+                if ref not in existing.source_references:
+                    existing.source_references.append(ref)
+
+    def all_entities(self) -> List[Any]:
+        """Canonical entities in registration order"""
+        return list(self.entities.values())
+
+    def all_relationships(self) -> List[Any]:
+        """Canonical relationships in registration order"""
+        return list(self.relationships.values())
+
+    def pending_entities(self) -> List[Any]:
+        """Entities added or changed since the last flush"""
+        return [self.entities[key] for key in self._pending_entities]
+
+    def pending_relationships(self) -> List[Any]:
+        """Relationships added since the last flush"""
+        return [self.relationships[key] for key in self._pending_relationships]
+
+    def mark_flushed(self) -> None:
+        """Record that the pending delta has been written to the KG"""
+        self._pending_entities.clear()
+        self._pending_relationships.clear()
+        self.stats["flushes"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get registry statistics"""
+        return {
+            **self.stats,
+            "entities": len(self.entities),
+            "relationships": len(self.relationships),
+            "pending_entities": len(self._pending_entities),
+            "pending_relationships": len(self._pending_relationships),
+        }
@@ -35,6 +35,7 @@ from uuid import uuid4
 # Import Santiago Builder components
 from domain.nusy_orchestrator.santiago_builder.catchfish import Catchfish, ExtractionLayer
 from domain.nusy_orchestrator.santiago_builder.fishnet import Fishnet
+from domain.nusy_orchestrator.santiago_builder.knowledge_registry import KnowledgeRegistry
 
 # Import KG Store
 import sys
@@ -118,6 +119,8 @@ class Navigator:
         max_cycles: int = 5,
         target_bdd_pass_rate: float = 0.95,
         target_extraction_time: int = 900,  # 15 minutes in seconds
+        extraction_cache: bool = True,
+        extraction_workers: Optional[int] = None,
     ):
         self.workspace_path = Path(workspace_path)
         self.min_cycles = min_cycles
@@ -136,7 +139,11 @@ class Navigator:
         self.ships_logs_dir.mkdir(parents=True, exist_ok=True)
         
         # Initialize Catchfish and Fishnet
-        self.catchfish = Catchfish(workspace_path=self.workspace_path)
+        self.catchfish = Catchfish(
+            workspace_path=self.workspace_path,
+            cache_enabled=extraction_cache,
+            max_workers=extraction_workers,
+        )
         self.fishnet = Fishnet(workspace_path=self.workspace_path)
         
         # Initialize KG Store
@@ -145,9 +152,18 @@ class Navigator:
         # Current expedition tracking
         self.current_expedition: Optional[ExpeditionLog] = None
         
-        # Storage for extracted knowledge (used across cycles)
-        self.extracted_entities: List[Any] = []
-        self.extracted_relationships: List[Any] = []
+        # Deduplicated knowledge accumulated across cycles
+        self.knowledge_registry = KnowledgeRegistry()
+    
+    @property
+    def extracted_entities(self) -> List[Any]:
+        """Canonical entities extracted so far"""
+        return self.knowledge_registry.all_entities()
+    
+    @property
+    def extracted_relationships(self) -> List[Any]:
+        """Canonical relationships extracted so far"""
+        return self.knowledge_registry.all_relationships()
     
     async def run_expedition(
         self,
@@ -201,8 +217,10 @@ class Navigator:
                 )
                 
                 # Step 3: Catchfish Extraction
+                cache_hits_before = self.catchfish.cache.stats["hits"]
                 extraction_time = await self._step3_catchfish_extraction(sources)
                 cycle.extraction_time_seconds = extraction_time
+                cycle.metrics["extraction_cache_hits"] = self.catchfish.cache.stats["hits"] - cache_hits_before
                 
                 # Step 4: Indexing
                 await self._step4_indexing()
@@ -214,8 +232,12 @@ class Navigator:
                 await self._step6_kg_building()
                 
                 # Step 7: Fishnet BDD Generation
+                features_generated_before = self.fishnet.stats["features_generated"]
                 bdd_pass_rate = await self._step7_fishnet_bdd_generation(domain_name, target_behaviors)
                 cycle.bdd_pass_rate = bdd_pass_rate
+                cycle.metrics["bdd_features_regenerated"] = (
+                    self.fishnet.stats["features_generated"] - features_generated_before
+                )
                 
                 # Check cycle status
                 cycle.completed_at = datetime.now()
@@ -263,6 +285,9 @@ class Navigator:
                 "sources_processed": len(sources),
                 "behaviors_implemented": len(target_behaviors),
                 "quality_gate_met": final_pass_rate >= self.target_bdd_pass_rate,
+                "extraction_cache": self.catchfish.cache.get_stats(),
+                "knowledge_registry": self.knowledge_registry.get_stats(),
+                "fishnet": self.fishnet.get_stats(),
             }
             
             # Save expedition log
@@ -273,6 +298,7 @@ class Navigator:
             print(f"🔄 Cycles: {len(expedition.cycles)}")
             print(f"✅ Final BDD Pass Rate: {final_pass_rate * 100:.1f}%")
             print(f"⚡ Avg Extraction Time: {avg_extraction_time / 60:.1f} minutes")
+            print(f"♻️  Extraction Cache Hit Rate: {expedition.final_metrics['extraction_cache']['hit_rate'] * 100:.1f}%")
             
             return expedition
             
@@ -332,37 +358,33 @@ class Navigator:
         
         start_time = time.time()
         
-        # Use real Catchfish extraction
         cycle_entities = []
         cycle_relationships = []
         
-        for source in sources:
-            if source.exists():
-                print(f"  📄 Extracting: {source.name}")
-                try:
-                    # Extract through all 4 layers
-                    results = await self.catchfish.extract_from_source(
-                        source,
-                        target_layer=ExtractionLayer.KG_TRIPLES
-                    )
-                    
-                    # Collect entities and relationships from Layer 2
-                    if len(results) >= 2:  # Layer 2 is second result
-                        cycle_entities.extend(results[1].entities)
-                        cycle_relationships.extend(results[1].relationships)
-                        
-                except Exception as e:
-                    print(f"  ⚠️  Extraction failed for {source.name}: {e}")
-        
-        # Accumulate knowledge across cycles
-        self.extracted_entities.extend(cycle_entities)
-        self.extracted_relationships.extend(cycle_relationships)
+        # Sources fan out across worker processes; collect them as they finish
+        async for extraction in self.catchfish.extract_many(
+            [s for s in sources if s.exists()],
+            target_layer=ExtractionLayer.KG_TRIPLES,
+        ):
+            if extraction.error:
+                print(f"  ⚠️  Extraction failed for {extraction.source_path.name}: {extraction.error}")
+                continue
+            
+            # Collect entities and relationships from Layer 2
+            if len(extraction.results) >= 2:  # Layer 2 is second result
+                cycle_entities.extend(extraction.results[1].entities)
+                cycle_relationships.extend(extraction.results[1].relationships)
+        
+        # Accumulate knowledge across cycles, merging repeats
+        new_entities = sum(self.knowledge_registry.add_entity(e) for e in cycle_entities)
+        new_relationships = sum(self.knowledge_registry.add_relationship(r) for r in cycle_relationships)
         
         extraction_time = time.time() - start_time
         
+        registry_stats = self.knowledge_registry.get_stats()
         print(f"✅ Extraction complete: {extraction_time:.2f}s")
-        print(f"   📊 Entities: {len(cycle_entities)} this cycle, {len(self.extracted_entities)} total")
-        print(f"   📊 Relationships: {len(cycle_relationships)} this cycle, {len(self.extracted_relationships)} total")
+        print(f"   📊 Entities: {len(cycle_entities)} this cycle ({new_entities} new), {registry_stats['entities']} total")
+        print(f"   📊 Relationships: {len(cycle_relationships)} this cycle ({new_relationships} new), {registry_stats['relationships']} total")
         
         if extraction_time > self.target_extraction_time:
             print(f"⚠️  Above target {self.target_extraction_time}s, optimization needed")
@@ -392,11 +414,11 @@ class Navigator:
         print(f"\n📍 Step 6: KG Building - Store to Knowledge Graph")
         self.current_expedition.current_step = NavigationStep.KG_BUILDING
         
-        # Convert extracted entities/relationships to KG triples
+        # Convert entities/relationships new since the last flush to KG triples
         triples = []
         
         # Add entity triples
-        for entity in self.extracted_entities:
+        for entity in self.knowledge_registry.pending_entities():
             # Handle Entity objects (dataclass)
             entity_id = getattr(entity, 'entity_id', getattr(entity, 'name', 'Unknown'))
             entity_type = getattr(entity, 'entity_type', 'Entity')
@@ -432,7 +454,7 @@ class Navigator:
                 ))
         
         # Add relationship triples
-        for rel in self.extracted_relationships:
+        for rel in self.knowledge_registry.pending_relationships():
             # Handle Relationship objects (dataclass)
             subject_id = getattr(rel, 'subject_id', 'Unknown')
             predicate = getattr(rel, 'predicate', 'relatedTo')
@@ -454,6 +476,7 @@ class Navigator:
         if triples:
             count = self.kg_store.add_triples(triples)
             self.kg_store.save()
+            self.knowledge_registry.mark_flushed()
             print(f"✅ Knowledge graph updated: {count} triples added")
         else:
             print(f"ℹ️  No new triples to add")
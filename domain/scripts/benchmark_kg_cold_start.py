@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark KG Store Ingest and Cold Start
+========================================
+Compares per-triple vs bulk ingest, and Turtle vs snapshot vs SQLite startup.
+
+Usage:
+    python domain/scripts/benchmark_kg_cold_start.py [--triples 50000]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from domain.src.nusy_pm_core.adapters.kg_store import KGStore, KGTriple
+
+
+def make_triples(count: int):
+    """Synthetic entities with a type, label and relation each"""
+    triples = []
+    for i in range(count // 3):
+        subject = f"pm:Entity_{i}"
+        source = f"source_{i % 50}.md"
+        triples.append(KGTriple(subject, "rdf:type", f"pm:Type_{i % 20}", source=source, confidence=0.9))
+        triples.append(KGTriple(subject, "rdfs:label", f"Entity number {i}", source=source, confidence=0.8))
+        triples.append(KGTriple(subject, "pm:relatedTo", f"pm:Entity_{(i * 7) % (count // 3)}", source=source))
+    return triples
+
+
+def timed(fn, repeat: int = 3) -> float:
+    """Median wall time of fn() in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--triples", type=int, default=30000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    triples = make_triples(args.triples)
+
+    with tempfile.TemporaryDirectory() as workspace:
+        def per_triple():
+            kg = KGStore(workspace_path=workspace)
+            kg.clear()
+            for t in triples:
+                kg.add_triple(t.subject, t.predicate, t.object, source=t.source, confidence=t.confidence)
+
+        def bulk():
+            kg = KGStore(workspace_path=workspace)
+            kg.clear()
+            kg.add_triples(triples)
+
+        ingest_single = timed(per_triple, args.repeat)
+        ingest_bulk = timed(bulk, args.repeat)
+
+        kg = KGStore(workspace_path=workspace)
+        kg.clear()
+        kg.add_triples(triples)
+        kg.save()
+
+        load_turtle = timed(lambda: KGStore(workspace_path=workspace, use_snapshot=False), args.repeat)
+        load_snapshot = timed(lambda: KGStore(workspace_path=workspace), args.repeat)
+
+        turtle_size = kg.kg_file.stat().st_size
+        snapshot_size = kg.snapshot_file.stat().st_size
+
+        # First open imports the Turtle file; later opens read nothing up front
+        KGStore(workspace_path=workspace, backend="sqlite")
+        load_sqlite = timed(lambda: KGStore(workspace_path=workspace, backend="sqlite"), args.repeat)
+
+    print("=" * 60)
+    print(f"KG Store benchmark: {len(triples)} triples")
+    print("=" * 60)
+    print(f"Ingest per-triple:   {ingest_single:8.3f}s")
+    print(f"Ingest bulk:         {ingest_bulk:8.3f}s  ({ingest_single / ingest_bulk:.1f}x)")
+    print(f"Cold start Turtle:   {load_turtle:8.3f}s  ({turtle_size / 1024:.0f} KB)")
+    print(f"Cold start snapshot: {load_snapshot:8.3f}s  ({snapshot_size / 1024:.0f} KB, "
+          f"{load_turtle / load_snapshot:.1f}x)")
+    print(f"Cold start SQLite:   {load_sqlite:8.3f}s  ({load_turtle / load_sqlite:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,24 +4,37 @@ Knowledge Graph Storage Adapter
 Provides persistent RDF triple storage for Santiago's knowledge accumulation.
 
 Architecture:
-- RDFLib backend (pure Python, serializable)
-- Turtle format for human-readable storage
-- SPARQL query interface
-- Provenance tracking via named graphs
-- Thread-safe operations
+- RDFLib graph on a pluggable backend: in-memory (default) or SQLite
+  triple table (KG_STORE_BACKEND=sqlite) for graphs larger than RAM
+- Turtle format for human-readable storage and interchange
+- Binary snapshot (term dictionary + integer triples) for fast startup
+- SPARQL query interface, plus direct triple-pattern lookups for
+  single-pattern questions (entity properties, entities by type)
+- LRU cache of hot entities' properties, invalidated per subject on write
+- Provenance tracking in a compact side table (not reified into the graph)
+- Thread-safe operations: concurrent readers, exclusive (batchable) writers
 
 Usage:
     kg = KGStore(workspace_path=".")
     kg.add_triples([(subject, predicate, object)])
     results = kg.query("SELECT ?s ?p ?o WHERE { ?s ?p ?o }")
+    sources = kg.get_provenance(subject, predicate, object)
     kg.save()
     kg.load()
+
+    with kg.batch():  # One write-lock acquisition for many updates
+        kg.add_triple(...)
 """
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Iterable
 from datetime import datetime
+from array import array
+import hashlib
 import json
+import pickle
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 import threading
 
@@ -29,6 +42,12 @@ from rdflib import Graph, Namespace, URIRef, Literal, BNode
 from rdflib.namespace import RDF, RDFS, XSD, OWL
 from rdflib.plugins.sparql import prepareQuery
 
+from domain.src.nusy_pm_core.adapters.read_write_lock import ReadWriteLock
+from domain.src.nusy_pm_core.adapters.sqlite_triple_store import create_graph, encode_term, get_default_backend
+
+# rdflib's SPARQL parser (pyparsing) is not thread-safe; evaluation is
+_SPARQL_PARSE_LOCK = threading.Lock()
+
 
 @dataclass
 class KGTriple:
@@ -50,6 +69,86 @@ class KGStats:
     unique_objects: int
     namespaces: List[str]
     last_updated: str
+    provenance_records: int = 0
+
+
+def triple_hash(subject, predicate, obj) -> str:
+    """Stable 64-bit hex key for an RDF triple"""
+    key = "\x00".join(encode_term(term) for term in (subject, predicate, obj))
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class ProvenanceTable:
+    """
+    Provenance side table keyed by triple hash.
+    
+    Each (triple, source) pair is stored once; repeated additions keep the
+    first generation time and the highest confidence. Source strings are
+    interned and the on-disk form is columnar JSON.
+    """
+    
+    def __init__(self):
+        self.sources: List[str] = []
+        self._source_ids: Dict[str, int] = {}
+        # triple hash -> source id -> (generated_at, confidence)
+        self.records: Dict[str, Dict[int, Tuple[str, float]]] = {}
+        self.duplicates_skipped = 0
+    
+    def __len__(self) -> int:
+        return sum(len(by_source) for by_source in self.records.values())
+    
+    def add(self, key: str, source: str, confidence: float, generated_at: Optional[str] = None) -> bool:
+        """
+        Record that a triple came from a source.
+        
+        Returns:
+            True if the (triple, source) pair was new
+        """
+        source_id = self._source_ids.get(source)
+        if source_id is None:
+            source_id = len(self.sources)
+            self.sources.append(source)
+            self._source_ids[source] = source_id
+        
+        by_source = self.records.setdefault(key, {})
+        existing = by_source.get(source_id)
+        if existing is not None:
+            self.duplicates_skipped += 1
+            if confidence > existing[1]:
+                by_source[source_id] = (existing[0], confidence)
+            return False
+        
+        by_source[source_id] = (generated_at or datetime.now().isoformat(), confidence)
+        return True
+    
+    def get(self, key: str) -> List[Dict[str, Any]]:
+        """Provenance records for a triple"""
+        return [
+            {"source": self.sources[source_id], "generated_at": generated_at, "confidence": confidence}
+            for source_id, (generated_at, confidence) in self.records.get(key, {}).items()
+        ]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Columnar representation for persistence"""
+        columns = {"triple_hash": [], "source": [], "generated_at": [], "confidence": []}
+        for key, by_source in self.records.items():
+            for source_id, (generated_at, confidence) in by_source.items():
+                columns["triple_hash"].append(key)
+                columns["source"].append(source_id)
+                columns["generated_at"].append(generated_at)
+                columns["confidence"].append(confidence)
+        return {"version": 1, "sources": self.sources, **columns}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProvenanceTable":
+        table = cls()
+        sources = data.get("sources", [])
+        for key, source_id, generated_at, confidence in zip(
+            data.get("triple_hash", []), data.get("source", []),
+            data.get("generated_at", []), data.get("confidence", []),
+        ):
+            table.add(key, sources[source_id], confidence, generated_at)
+        return table
 
 
 class KGStore:
@@ -58,48 +157,83 @@ class KGStore:
     
     Features:
     - Triple storage and retrieval
+    - Bulk ingest
     - SPARQL query interface
     - Turtle serialization
+    - Snapshot startup
     - Provenance tracking
     - Incremental updates
     """
     
-    def __init__(self, workspace_path: str = "."):
+    SNAPSHOT_VERSION = 1
+    
+    def __init__(
+        self,
+        workspace_path: str = ".",
+        use_snapshot: bool = True,
+        backend: Optional[str] = None,
+        entity_cache_size: int = 1024,
+    ):
         """
         Initialize KG store.
         
         Args:
             workspace_path: Root path for workspace (stores KG in knowledge/kg/)
+            use_snapshot: Write a binary snapshot on save and prefer it on load (memory backend)
+            backend: "memory" or "sqlite" (default: KG_STORE_BACKEND env, else memory)
+            entity_cache_size: Entities whose properties are cached (0 disables;
+                always disabled for sqlite, where other processes commit writes)
         """
         self.workspace_path = Path(workspace_path)
         self.kg_dir = self.workspace_path / "knowledge" / "kg"
         self.kg_dir.mkdir(parents=True, exist_ok=True)
         
         # Primary knowledge graph
-        self.graph = Graph()
+        self.backend = (backend or get_default_backend()).lower()
+        self.db_file = self.kg_dir / "santiago_kg.sqlite"
+        self.graph = create_graph(self.backend, self.db_file)
         
         # Define namespaces
         self.SANTIAGO = Namespace("https://nusy.dev/santiago/")
         self.PM = Namespace("https://nusy.dev/pm/")
         self.PROV = Namespace("http://www.w3.org/ns/prov#")
         
-        self.graph.bind("santiago", self.SANTIAGO)
-        self.graph.bind("pm", self.PM)
-        self.graph.bind("prov", self.PROV)
-        self.graph.bind("rdf", RDF)
-        self.graph.bind("rdfs", RDFS)
-        self.graph.bind("owl", OWL)
+        # Prefix -> namespace, used for binding and for resolving "prefix:local" terms
+        self.namespaces: Dict[str, Namespace] = {
+            "santiago": self.SANTIAGO,
+            "pm": self.PM,
+            "prov": self.PROV,
+            "rdf": RDF,
+            "rdfs": RDFS,
+            "owl": OWL,
+        }
+        for prefix, namespace in self.namespaces.items():
+            self.graph.bind(prefix, namespace)
         
-        # Thread safety
-        self.lock = threading.RLock()
+        # Thread safety: queries share the read lock, updates take the write lock
+        self.lock = ReadWriteLock()
+        self._save_lock = threading.Lock()  # save() only reads the graph, but writes files
+        self._prepared_queries: Dict[str, Any] = {}
+        
+        # Hot entity properties; readers fill it concurrently, writers invalidate.
+        # A shared SQLite file can change under us, so only the memory backend caches.
+        self.entity_cache_size = entity_cache_size if self.backend == "memory" else 0
+        self._entity_cache: "OrderedDict[URIRef, Dict[str, Any]]" = OrderedDict()
+        self._entity_cache_lock = threading.Lock()
+        self.cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
         
         # Paths
         self.kg_file = self.kg_dir / "santiago_kg.ttl"
         self.stats_file = self.kg_dir / "kg_stats.json"
         self.provenance_file = self.kg_dir / "provenance.json"
+        self.snapshot_file = self.kg_dir / "santiago_kg.snapshot"
+        self.use_snapshot = use_snapshot
+        
+        # Triple provenance, kept beside the graph rather than reified into it
+        self.provenance = ProvenanceTable()
         
         # Load existing data if available
-        if self.kg_file.exists():
+        if self.kg_file.exists() or (self.backend == "sqlite" and len(self.graph) > 0):
             self.load()
     
     def add_triple(
@@ -120,7 +254,7 @@ class KGStore:
             source: Source document/file (for provenance)
             confidence: Confidence score (0.0-1.0)
         """
-        with self.lock:
+        with self.lock.write():
             # Convert to RDF terms
             s = self._to_uri_ref(subject)
             p = self._to_uri_ref(predicate)
@@ -128,6 +262,7 @@ class KGStore:
             
             # Add triple
             self.graph.add((s, p, o))
+            self._invalidate_entities((s,))
             
             # Add provenance if source provided
             if source:
@@ -143,18 +278,34 @@ class KGStore:
         Returns:
             Number of triples added
         """
-        with self.lock:
-            count = 0
+        with self.lock.write():
+            # Resolve each distinct string once per batch
+            uri_cache: Dict[str, URIRef] = {}
+            term_cache: Dict[str, Any] = {}
+            quads = []
+            sourced = []
+            
             for triple in triples:
-                self.add_triple(
-                    subject=triple.subject,
-                    predicate=triple.predicate,
-                    obj=triple.object,
-                    source=triple.source,
-                    confidence=triple.confidence
-                )
-                count += 1
-            return count
+                s = uri_cache.get(triple.subject)
+                if s is None:
+                    s = uri_cache[triple.subject] = self._to_uri_ref(triple.subject)
+                p = uri_cache.get(triple.predicate)
+                if p is None:
+                    p = uri_cache[triple.predicate] = self._to_uri_ref(triple.predicate)
+                o = term_cache.get(triple.object)
+                if o is None:
+                    o = term_cache[triple.object] = self._to_term(triple.object)
+                
+                quads.append((s, p, o, self.graph))
+                if triple.source:
+                    sourced.append((s, p, o, triple.source, triple.confidence))
+            
+            self.graph.addN(quads)
+            self._invalidate_entities({quad[0] for quad in quads})
+            for s, p, o, source, confidence in sourced:
+                self._add_provenance(s, p, o, source, confidence)
+            
+            return len(quads)
     
     def query(self, sparql_query: str) -> List[Dict[str, Any]]:
         """
@@ -166,9 +317,9 @@ class KGStore:
         Returns:
             List of result bindings as dictionaries
         """
-        with self.lock:
+        with self.lock.read():
             results = []
-            qres = self.graph.query(sparql_query)
+            qres = self.graph.query(self._prepare(sparql_query))
             
             for row in qres:
                 result_dict = {}
@@ -189,13 +340,9 @@ class KGStore:
         Returns:
             List of entity URIs
         """
-        query = f"""
-        SELECT ?entity WHERE {{
-            ?entity rdf:type {entity_type} .
-        }}
-        """
-        results = self.query(query)
-        return [r["entity"] for r in results]
+        type_ref = self._to_uri_ref(entity_type.strip("<>"))
+        with self.lock.read():
+            return [str(s) for s in self.graph.subjects(RDF.type, type_ref, unique=True)]
     
     def get_entity_properties(self, entity_uri: str) -> Dict[str, Any]:
         """
@@ -207,69 +354,140 @@ class KGStore:
         Returns:
             Dictionary of property-value pairs
         """
-        query = f"""
-        SELECT ?property ?value WHERE {{
-            <{entity_uri}> ?property ?value .
-        }}
+        with self.lock.read():
+            return self._entity_properties(entity_uri)
+    
+    def get_entities_properties(self, entity_uris: Iterable[str]) -> Dict[str, Dict[str, Any]]:
         """
-        results = self.query(query)
+        Get all properties of several entities under one read lock.
         
-        properties = {}
-        for r in results:
-            prop = r["property"]
-            val = r["value"]
+        Args:
+            entity_uris: Entity URIs
             
-            # Group multiple values for same property
-            if prop in properties:
-                if not isinstance(properties[prop], list):
-                    properties[prop] = [properties[prop]]
-                properties[prop].append(val)
-            else:
-                properties[prop] = val
+        Returns:
+            Entity URI -> dictionary of property-value pairs
+        """
+        with self.lock.read():
+            return {uri: self._entity_properties(uri) for uri in entity_uris}
+    
+    def invalidate_entity_cache(self) -> None:
+        """Drop all cached entity properties (call after changing self.graph directly)."""
+        with self._entity_cache_lock:
+            self._entity_cache.clear()
+            self.cache_stats["invalidations"] += 1
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get entity property cache statistics."""
+        with self._entity_cache_lock:
+            lookups = self.cache_stats["hits"] + self.cache_stats["misses"]
+            return {
+                **self.cache_stats,
+                "entries": len(self._entity_cache),
+                "hit_rate": self.cache_stats["hits"] / lookups if lookups else 0.0,
+            }
+    
+    @contextmanager
+    def batch(self):
+        """
+        Hold the write lock across several updates.
         
-        return properties
+        Readers wait once for the whole batch instead of interleaving with
+        (and re-queuing behind) each individual add.
+        """
+        with self.lock.write():
+            yield self
+    
+    def get_lock_stats(self) -> Dict[str, Any]:
+        """Get read/write lock acquisition and contention statistics."""
+        return self.lock.get_stats()
+    
+    def get_provenance(self, subject: str, predicate: str, obj: str) -> List[Dict[str, Any]]:
+        """
+        Get the recorded sources of a triple.
+        
+        Args:
+            subject: Subject URI or identifier
+            predicate: Predicate URI or identifier
+            obj: Object URI, identifier, or literal value
+            
+        Returns:
+            List of {"source", "generated_at", "confidence"} records
+        """
+        with self.lock.read():
+            key = triple_hash(self._to_uri_ref(subject), self._to_uri_ref(predicate), self._to_term(obj))
+            return self.provenance.get(key)
     
     def save(self) -> None:
-        """Persist knowledge graph to disk (Turtle format)."""
-        with self.lock:
+        """Persist knowledge graph to disk (Turtle plus snapshot, or a SQLite commit)."""
+        # Read lock first: a batch() holder calling save() must never wait on a
+        # _save_lock taken by a thread that is itself waiting for the batch
+        with self.lock.read(), self._save_lock:
             # Save graph
-            self.graph.serialize(destination=str(self.kg_file), format="turtle")
+            if self.backend == "sqlite":
+                self.graph.commit()
+            else:
+                self.graph.serialize(destination=str(self.kg_file), format="turtle")
+                if self.use_snapshot:
+                    self._write_snapshot()
+            
+            # Save provenance
+            with open(self.provenance_file, "w") as f:
+                json.dump(self.provenance.to_dict(), f)
             
             # Save statistics
             stats = self.get_statistics()
             with open(self.stats_file, "w") as f:
                 json.dump(asdict(stats), f, indent=2)
             
-            print(f"✅ KG saved: {self.kg_file}")
+            print(f"✅ KG saved: {self.db_file if self.backend == 'sqlite' else self.kg_file}")
             print(f"   📊 Triples: {stats.total_triples}")
     
     def load(self) -> None:
         """Load knowledge graph from disk."""
-        with self.lock:
-            if self.kg_file.exists():
-                self.graph.parse(str(self.kg_file), format="turtle")
-                stats = self.get_statistics()
-                print(f"✅ KG loaded: {self.kg_file}")
-                print(f"   📊 Triples: {stats.total_triples}")
+        with self.lock.write():
+            if self.backend == "sqlite" and len(self.graph) > 0:
+                source = self.db_file  # Triples are already on disk
+            elif self.kg_file.exists():
+                source = self.kg_file
+                if not (self.backend == "memory" and self.use_snapshot and self._load_snapshot()):
+                    self.graph.parse(str(self.kg_file), format="turtle")
             else:
                 print("ℹ️  No existing KG found, starting fresh")
+                return
+            self.invalidate_entity_cache()
+            
+            if self.provenance_file.exists():
+                with open(self.provenance_file) as f:
+                    self.provenance = ProvenanceTable.from_dict(json.load(f))
+            self._migrate_reified_provenance()
+            if self.backend == "sqlite":
+                self.graph.commit()  # Keep Turtle imports and migrations
+            print(f"✅ KG loaded: {source}")
+            print(f"   📊 Triples: {len(self.graph)}")
     
     def get_statistics(self) -> KGStats:
         """Get knowledge graph statistics."""
-        with self.lock:
+        with self.lock.read():
             total = len(self.graph)
-            subjects = set(s for s, _, _ in self.graph)
-            predicates = set(p for _, p, _ in self.graph)
-            objects = set(o for _, _, o in self.graph)
+            if hasattr(self.graph.store, "distinct_counts"):
+                unique_subjects, unique_predicates, unique_objects = self.graph.store.distinct_counts()
+            else:
+                subjects, predicates, objects = set(), set(), set()
+                for s, p, o in self.graph:
+                    subjects.add(s)
+                    predicates.add(p)
+                    objects.add(o)
+                unique_subjects, unique_predicates, unique_objects = len(subjects), len(predicates), len(objects)
             namespaces = [str(ns) for _, ns in self.graph.namespaces()]
             
             return KGStats(
                 total_triples=total,
-                unique_subjects=len(subjects),
-                unique_predicates=len(predicates),
-                unique_objects=len(objects),
+                unique_subjects=unique_subjects,
+                unique_predicates=unique_predicates,
+                unique_objects=unique_objects,
                 namespaces=namespaces,
-                last_updated=datetime.now().isoformat()
+                last_updated=datetime.now().isoformat(),
+                provenance_records=len(self.provenance),
             )
     
     def export_domain_knowledge(self, domain_name: str, output_path: Optional[Path] = None) -> str:
@@ -283,7 +501,7 @@ class KGStore:
         Returns:
             Path to exported file
         """
-        with self.lock:
+        with self.lock.read():
             # Query all triples related to domain
             query = f"""
             SELECT ?s ?p ?o WHERE {{
@@ -298,7 +516,7 @@ class KGStore:
             for prefix, namespace in self.graph.namespaces():
                 domain_graph.bind(prefix, namespace)
             
-            results = self.graph.query(query)
+            results = self.graph.query(self._prepare(query))
             for row in results:
                 domain_graph.add((row.s, row.p, row.o))
             
@@ -312,19 +530,32 @@ class KGStore:
             
             return str(output_path)
     
+    def export_turtle(self, output_path: Optional[Path] = None) -> str:
+        """
+        Export the whole graph as Turtle (the interchange format for any backend).
+        
+        Args:
+            output_path: Optional output file path (default: the store's .ttl file)
+            
+        Returns:
+            Path to exported file
+        """
+        with self.lock.read():
+            output_path = output_path or self.kg_file
+            self.graph.serialize(destination=str(output_path), format="turtle")
+            return str(output_path)
+    
     def clear(self) -> None:
         """Clear all triples from knowledge graph."""
-        with self.lock:
-            self.graph = Graph()
-            for prefix, namespace in [
-                ("santiago", self.SANTIAGO),
-                ("pm", self.PM),
-                ("prov", self.PROV),
-                ("rdf", RDF),
-                ("rdfs", RDFS),
-                ("owl", OWL)
-            ]:
+        with self.lock.write():
+            if self.backend == "sqlite":
+                self.graph.remove((None, None, None))  # Keep the store; deletion is persisted on save()
+            else:
+                self.graph = Graph()
+            for prefix, namespace in self.namespaces.items():
                 self.graph.bind(prefix, namespace)
+            self.provenance = ProvenanceTable()
+            self.invalidate_entity_cache()
             print("🗑️  KG cleared")
     
     # Private helper methods
@@ -336,18 +567,9 @@ class KGStore:
         elif ":" in value:
             # Handle namespace prefix
             prefix, local = value.split(":", 1)
-            if prefix == "pm":
-                return self.PM[local]
-            elif prefix == "santiago":
-                return self.SANTIAGO[local]
-            elif prefix == "prov":
-                return self.PROV[local]
-            elif prefix == "rdf":
-                return RDF[local]
-            elif prefix == "rdfs":
-                return RDFS[local]
-            elif prefix == "owl":
-                return OWL[local]
+            namespace = self.namespaces.get(prefix)
+            if namespace is not None:
+                return namespace[local]
         
         # Default to santiago namespace
         return self.SANTIAGO[value]
@@ -381,19 +603,139 @@ class KGStore:
         confidence: float
     ) -> None:
         """Add provenance metadata for a triple."""
-        # Create a blank node for the provenance statement
-        stmt = BNode()
+        self.provenance.add(triple_hash(subject, predicate, obj), source, confidence)
+    
+    def _entity_properties(self, entity_uri: str) -> Dict[str, Any]:
+        """Properties of one entity from the cache or a single (s, ?, ?) lookup; caller holds the read lock."""
+        subject = self._to_uri_ref(entity_uri)
+        with self._entity_cache_lock:
+            properties = self._entity_cache.get(subject)
+            if properties is not None:
+                self._entity_cache.move_to_end(subject)
+                self.cache_stats["hits"] += 1
         
-        # Statement about the triple
-        self.graph.add((stmt, RDF.type, RDF.Statement))
-        self.graph.add((stmt, RDF.subject, subject))
-        self.graph.add((stmt, RDF.predicate, predicate))
-        self.graph.add((stmt, RDF.object, obj))
+        if properties is None:
+            properties = {}
+            for predicate, value in self.graph.predicate_objects(subject):
+                prop = self._term_to_value(predicate)
+                val = self._term_to_value(value)
+                
+                # Group multiple values for same property
+                if prop in properties:
+                    if not isinstance(properties[prop], list):
+                        properties[prop] = [properties[prop]]
+                    properties[prop].append(val)
+                else:
+                    properties[prop] = val
+            
+            with self._entity_cache_lock:
+                self.cache_stats["misses"] += 1
+                if self.entity_cache_size > 0:
+                    self._entity_cache[subject] = properties
+                    if len(self._entity_cache) > self.entity_cache_size:
+                        self._entity_cache.popitem(last=False)
         
-        # Provenance info
-        self.graph.add((stmt, self.PROV.wasDerivedFrom, Literal(source)))
-        self.graph.add((stmt, self.PROV.generatedAtTime, Literal(datetime.now().isoformat(), datatype=XSD.dateTime)))
-        self.graph.add((stmt, self.SANTIAGO.confidence, Literal(confidence, datatype=XSD.float)))
+        # Callers may mutate the result; the cached copy must stay intact
+        return {prop: list(val) if isinstance(val, list) else val for prop, val in properties.items()}
+    
+    def _invalidate_entities(self, subjects: Iterable[URIRef]) -> None:
+        """Drop cached properties of subjects that were just written."""
+        with self._entity_cache_lock:
+            if not self._entity_cache:
+                return
+            for subject in subjects:
+                self._entity_cache.pop(subject, None)
+            self.cache_stats["invalidations"] += 1
+    
+    def _prepare(self, sparql_query: str):
+        """Parse a query once, serialized across threads; evaluation runs concurrently."""
+        prepared = self._prepared_queries.get(sparql_query)
+        if prepared is None:
+            with _SPARQL_PARSE_LOCK:
+                prepared = prepareQuery(sparql_query, initNs=dict(self.graph.namespaces()))
+            if len(self._prepared_queries) >= 256:
+                self._prepared_queries.clear()
+            self._prepared_queries[sparql_query] = prepared
+        return prepared
+    
+    def _turtle_signature(self) -> List[int]:
+        """Size and mtime of the Turtle file, used to detect stale snapshots."""
+        stat = self.kg_file.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+    
+    def _write_snapshot(self) -> None:
+        """Write the graph as a term dictionary plus an integer triple array."""
+        term_ids: Dict[Any, int] = {}
+        triple_ids = array("L")
+        for triple in self.graph:
+            for term in triple:
+                term_id = term_ids.get(term)
+                if term_id is None:
+                    term_id = term_ids[term] = len(term_ids)
+                triple_ids.append(term_id)
+        
+        payload = {
+            "version": self.SNAPSHOT_VERSION,
+            "turtle_signature": self._turtle_signature(),
+            "namespaces": [(prefix, str(ns)) for prefix, ns in self.graph.namespaces()],
+            "terms": list(term_ids),
+            "triples": triple_ids,
+        }
+        tmp_file = self.snapshot_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_file.replace(self.snapshot_file)
+    
+    def _load_snapshot(self) -> bool:
+        """Load the snapshot if it matches the current Turtle file; returns False to fall back."""
+        if not self.snapshot_file.exists():
+            return False
+        try:
+            with open(self.snapshot_file, "rb") as f:
+                payload = pickle.load(f)
+            if payload.get("version") != self.SNAPSHOT_VERSION:
+                return False
+            if payload.get("turtle_signature") != self._turtle_signature():
+                return False  # Turtle was written or edited by something else
+        except Exception as e:
+            print(f"⚠️  Ignoring unreadable KG snapshot: {e}")
+            return False
+        
+        terms = payload["terms"]
+        ids = payload["triples"]
+        graph = self.graph
+        graph.addN(
+            (terms[ids[i]], terms[ids[i + 1]], terms[ids[i + 2]], graph)
+            for i in range(0, len(ids), 3)
+        )
+        for prefix, namespace in payload["namespaces"]:
+            graph.bind(prefix, namespace, override=False)
+        return True
+    
+    def _migrate_reified_provenance(self) -> None:
+        """Move rdf:Statement provenance written by older versions into the side table."""
+        statements = list(self.graph.subjects(RDF.type, RDF.Statement))
+        migrated = 0
+        for stmt in statements:
+            source = self.graph.value(stmt, self.PROV.wasDerivedFrom)
+            if source is None:
+                continue  # Not one of ours
+            s = self.graph.value(stmt, RDF.subject)
+            p = self.graph.value(stmt, RDF.predicate)
+            o = self.graph.value(stmt, RDF.object)
+            generated_at = self.graph.value(stmt, self.PROV.generatedAtTime)
+            confidence = self.graph.value(stmt, self.SANTIAGO.confidence)
+            if s is not None and p is not None and o is not None:
+                self.provenance.add(
+                    triple_hash(s, p, o),
+                    str(source),
+                    float(confidence) if confidence is not None else 1.0,
+                    str(generated_at) if generated_at is not None else None,
+                )
+            self.graph.remove((stmt, None, None))
+            migrated += 1
+        if migrated:
+            print(f"   🔄 Migrated {migrated} reified provenance statements")
 
 
 # Factory function
@@ -0,0 +1,154 @@
+"""
+Read-Write Lock
+===============
+Lock that lets any number of readers in at once while writers get exclusive
+access, with contention metrics.
+
+Semantics:
+- Writer preference: once a writer is waiting, new readers queue behind it,
+  so a steady stream of queries cannot starve ingest
+- Writers are reentrant, and a writer may take the read lock (e.g. save()
+  calling get_statistics())
+- Readers are reentrant; upgrading read -> write raises instead of deadlocking
+- Used directly as a context manager it takes the write lock, so existing
+  ``with store.lock:`` callers stay exclusive
+
+Usage:
+    lock = ReadWriteLock()
+    with lock.read():
+        ...
+    with lock.write():
+        ...
+    lock.get_stats()
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+
+class ReadWriteLock:
+    """Writer-preferring reader-writer lock"""
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None  # Owning thread ident
+        self._write_depth = 0
+        self._writers_waiting = 0
+        self._local = threading.local()
+        self.stats = {
+            "read_acquires": 0,
+            "write_acquires": 0,
+            "read_contended": 0,
+            "write_contended": 0,
+            "read_wait_seconds": 0.0,
+            "write_wait_seconds": 0.0,
+            "max_concurrent_readers": 0,
+        }
+
+    def _held_reads(self) -> List[bool]:
+        """Per-thread stack of read acquisitions (True = the outermost, counted one)"""
+        held = getattr(self._local, "reads", None)
+        if held is None:
+            held = self._local.reads = []
+        return held
+
+    def acquire_read(self) -> None:
+        me = threading.get_ident()
+        held = self._held_reads()
+        with self._cond:
+            if self._writer == me or any(held):
+                # Already exclusive, or already a reader (which must not queue
+                # behind a waiting writer)
+                held.append(False)
+                return
+            if self._writer is not None or self._writers_waiting:
+                self.stats["read_contended"] += 1
+                start = time.perf_counter()
+                while self._writer is not None or self._writers_waiting:
+                    self._cond.wait()
+                self.stats["read_wait_seconds"] += time.perf_counter() - start
+            self._readers += 1
+            held.append(True)
+            self.stats["read_acquires"] += 1
+            self.stats["max_concurrent_readers"] = max(self.stats["max_concurrent_readers"], self._readers)
+
+    def release_read(self) -> None:
+        counted = self._held_reads().pop()
+        if not counted:
+            return
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            if any(self._held_reads()):
+                raise RuntimeError("Cannot upgrade a read lock to a write lock")
+            if self._writer is not None or self._readers:
+                self.stats["write_contended"] += 1
+                start = time.perf_counter()
+                self._writers_waiting += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._cond.wait()
+                finally:
+                    self._writers_waiting -= 1
+                self.stats["write_wait_seconds"] += time.perf_counter() - start
+            self._writer = me
+            self._write_depth = 1
+            self.stats["write_acquires"] += 1
+
+    def release_write(self) -> None:
+        with self._cond:
+            if self._writer != threading.get_ident():
+                raise RuntimeError("Write lock released by a thread that does not hold it")
+            self._write_depth -= 1
+            if self._write_depth == 0:
+                self._writer = None
+                self._cond.notify_all()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Shared access"""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Exclusive access"""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+    def __enter__(self) -> "ReadWriteLock":
+        self.acquire_write()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release_write()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get acquisition and contention statistics"""
+        with self._cond:
+            acquires = self.stats["read_acquires"] + self.stats["write_acquires"]
+            contended = self.stats["read_contended"] + self.stats["write_contended"]
+            return {
+                **self.stats,
+                "active_readers": self._readers,
+                "writer_active": self._writer is not None,
+                "writers_waiting": self._writers_waiting,
+                "contention_rate": contended / acquires if acquires else 0.0,
+            }
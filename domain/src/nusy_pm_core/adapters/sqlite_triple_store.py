@@ -0,0 +1,292 @@
+"""
+SQLite Triple Store
+===================
+rdflib Store backed by a SQLite triple table, selectable as the storage
+backend for KGStore and SantiagoKnowledgeGraph.
+
+Architecture:
+- Term dictionary (id <-> encoded term) keeps the triple table integer-only
+- Triple table with SPO primary key plus POS and OSP indexes, so every
+  single-pattern lookup is an index range scan
+- WAL journal: one writer and any number of readers, including other processes
+- Bounded decode cache; the graph itself stays on disk
+
+Writes accumulate in a transaction until commit() (called by the owners'
+save methods), matching the save-to-persist semantics of the Turtle backend.
+
+Usage:
+    graph = create_graph("sqlite", Path("knowledge/kg/santiago_kg.sqlite"))
+    graph.add((s, p, o))
+    graph.commit()
+"""
+
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.store import Store
+
+KG_BACKENDS = ("memory", "sqlite")
+DEFAULT_BACKEND_ENV = "KG_STORE_BACKEND"
+
+_SEPARATOR = "\x1f"
+
+
+def encode_term(term: Any) -> str:
+    """
+    Encode an RDF term as a string that round-trips through decode_term.
+
+    Unlike term.n3(), this accepts URIs that are not valid for serialization
+    (e.g. containing spaces), which the stores do create.
+    """
+    if isinstance(term, Literal):
+        return f"L{term.language or ''}{_SEPARATOR}{term.datatype or ''}{_SEPARATOR}{term}"
+    if isinstance(term, BNode):
+        return f"B{term}"
+    return f"U{term}"
+
+
+def decode_term(encoded: str) -> Any:
+    """Inverse of encode_term"""
+    kind, body = encoded[0], encoded[1:]
+    if kind == "L":
+        language, datatype, lexical = body.split(_SEPARATOR, 2)
+        return Literal(lexical, lang=language or None, datatype=URIRef(datatype) if datatype else None)
+    if kind == "B":
+        return BNode(body)
+    return URIRef(body)
+
+
+def get_default_backend() -> str:
+    """Backend from the KG_STORE_BACKEND environment variable (default: memory)"""
+    return os.getenv(DEFAULT_BACKEND_ENV, "memory").lower()
+
+
+def create_graph(backend: Optional[str], path: Path) -> Graph:
+    """
+    Create an rdflib Graph on the selected backend.
+
+    Args:
+        backend: "memory" or "sqlite" (default: from KG_STORE_BACKEND)
+        path: Database file for the sqlite backend
+
+    Returns:
+        Graph instance
+    """
+    backend = (backend or get_default_backend()).lower()
+    if backend == "memory":
+        return Graph()
+    if backend == "sqlite":
+        return Graph(store=SQLiteTripleStore(path))
+    raise ValueError(f"Unknown KG backend '{backend}', expected one of {KG_BACKENDS}")
+
+
+class SQLiteTripleStore(Store):
+    """rdflib Store persisting triples in an indexed SQLite table"""
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = True
+    graph_aware = False
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS terms (
+            id INTEGER PRIMARY KEY,
+            term TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS triples (
+            s INTEGER NOT NULL,
+            p INTEGER NOT NULL,
+            o INTEGER NOT NULL,
+            PRIMARY KEY (s, p, o)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS triples_pos ON triples (p, o, s);
+        CREATE INDEX IF NOT EXISTS triples_osp ON triples (o, s, p);
+        CREATE TABLE IF NOT EXISTS namespaces (
+            prefix TEXT PRIMARY KEY,
+            uri TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, path: Path, cache_size: int = 100000):
+        """
+        Args:
+            path: SQLite database file (created if missing)
+            cache_size: Maximum decoded terms kept in memory
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_size = cache_size
+        self._lock = threading.RLock()
+        self._term_cache: "OrderedDict[int, Any]" = OrderedDict()
+
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self.conn.commit()
+
+        self._namespace: Dict[str, URIRef] = {}
+        self._prefix: Dict[URIRef, str] = {}
+        for prefix, uri in self.conn.execute("SELECT prefix, uri FROM namespaces"):
+            self._namespace[prefix] = URIRef(uri)
+            self._prefix[URIRef(uri)] = prefix
+
+    # Term dictionary
+
+    def _term_id(self, term: Any, create: bool = False) -> Optional[int]:
+        encoded = encode_term(term)
+        row = self.conn.execute("SELECT id FROM terms WHERE term = ?", (encoded,)).fetchone()
+        if row is not None:
+            return row[0]
+        if not create:
+            return None
+        return self.conn.execute("INSERT INTO terms (term) VALUES (?)", (encoded,)).lastrowid
+
+    def _decode(self, term_id: int) -> Any:
+        term = self._term_cache.get(term_id)
+        if term is not None:
+            self._term_cache.move_to_end(term_id)
+            return term
+        (encoded,) = self.conn.execute("SELECT term FROM terms WHERE id = ?", (term_id,)).fetchone()
+        term = decode_term(encoded)
+        self._term_cache[term_id] = term
+        if len(self._term_cache) > self.cache_size:
+            self._term_cache.popitem(last=False)
+        return term
+
+    def _where(self, triple_pattern) -> Optional[Tuple[str, List[int]]]:
+        """WHERE clause for a pattern; None if a bound term is unknown (no matches)"""
+        clauses = []
+        params = []
+        for column, term in zip(("s", "p", "o"), triple_pattern):
+            if term is None:
+                continue
+            term_id = self._term_id(term)
+            if term_id is None:
+                return None
+            clauses.append(f"{column} = ?")
+            params.append(term_id)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    # Store API
+
+    def add(self, triple, context, quoted: bool = False) -> None:
+        with self._lock:
+            s, p, o = (self._term_id(term, create=True) for term in triple)
+            self.conn.execute("INSERT OR IGNORE INTO triples (s, p, o) VALUES (?, ?, ?)", (s, p, o))
+        super().add(triple, context, quoted)
+
+    def addN(self, quads: Iterable) -> None:  # noqa: N802
+        with self._lock:
+            ids: Dict[str, int] = {}
+            rows = []
+            for s, p, o, _ in quads:
+                row = []
+                for term in (s, p, o):
+                    encoded = encode_term(term)
+                    term_id = ids.get(encoded)
+                    if term_id is None:
+                        term_id = ids[encoded] = self._term_id(term, create=True)
+                    row.append(term_id)
+                rows.append(tuple(row))
+            self.conn.executemany("INSERT OR IGNORE INTO triples (s, p, o) VALUES (?, ?, ?)", rows)
+
+    def remove(self, triple_pattern, context=None) -> None:
+        with self._lock:
+            where = self._where(triple_pattern)
+            if where is None:
+                return
+            clause, params = where
+            self.conn.execute(f"DELETE FROM triples{clause}", params)
+
+    def triples(self, triple_pattern, context=None) -> Iterator:
+        with self._lock:
+            where = self._where(triple_pattern)
+            if where is None:
+                return
+            clause, params = where
+            # Materialize ids so callers may modify the graph while iterating
+            rows = self.conn.execute(f"SELECT s, p, o FROM triples{clause}", params).fetchall()
+        for s, p, o in rows:
+            with self._lock:
+                triple = (self._decode(s), self._decode(p), self._decode(o))
+            yield triple, iter(())
+
+    def __len__(self, context=None) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM triples").fetchone()[0]
+
+    def distinct_counts(self) -> Tuple[int, int, int]:
+        """Distinct subjects, predicates and objects, counted in SQL"""
+        with self._lock:
+            return tuple(
+                self.conn.execute(f"SELECT COUNT(DISTINCT {column}) FROM triples").fetchone()[0]
+                for column in ("s", "p", "o")
+            )
+
+    def contexts(self, triple=None) -> Iterator:
+        return iter(())
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        # Same semantics as rdflib's Memory.bind
+        with self._lock:
+            before = dict(self._namespace)
+            bound_namespace = self._namespace.get(prefix)
+            bound_prefix = self._prefix.get(namespace)
+            if bound_prefix is None and bound_namespace is not None:
+                bound_prefix = self._prefix.get(bound_namespace)
+            if override:
+                if bound_prefix is not None:
+                    self._namespace.pop(bound_prefix, None)
+                if bound_namespace is not None:
+                    self._prefix.pop(bound_namespace, None)
+                self._prefix[namespace] = prefix
+                self._namespace[prefix] = namespace
+            else:
+                final_namespace = bound_namespace if bound_namespace is not None else namespace
+                final_prefix = bound_prefix if bound_prefix is not None else prefix
+                self._prefix[final_namespace] = final_prefix
+                self._namespace[final_prefix] = final_namespace
+
+            if self._namespace == before:
+                return
+            # A bind outside a pending transaction commits at once, so opening a
+            # store never leaves the database write-locked for other processes
+            standalone = not self.conn.in_transaction
+            self.conn.execute("DELETE FROM namespaces")
+            self.conn.executemany(
+                "INSERT INTO namespaces (prefix, uri) VALUES (?, ?)",
+                [(p, str(ns)) for p, ns in self._namespace.items()],
+            )
+            if standalone:
+                self.conn.commit()
+
+    def namespace(self, prefix: str) -> Optional[URIRef]:
+        return self._namespace.get(prefix)
+
+    def prefix(self, namespace: URIRef) -> Optional[str]:
+        return self._prefix.get(namespace)
+
+    def namespaces(self) -> Iterator[Tuple[str, URIRef]]:
+        return iter(list(self._namespace.items()))
+
+    def commit(self) -> None:
+        with self._lock:
+            self.conn.commit()
+
+    def rollback(self) -> None:
+        with self._lock:
+            self.conn.rollback()
+            self._term_cache.clear()
+
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        with self._lock:
+            if commit_pending_transaction:
+                self.conn.commit()
+            self.conn.close()
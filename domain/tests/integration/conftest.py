@@ -0,0 +1,18 @@
+"""
+Shared fixtures for domain integration tests
+"""
+
+import pytest
+
+from domain.nusy_orchestrator.santiago_builder.catchfish import Entity
+
+
+@pytest.fixture
+def make_entity():
+    """Factory for test entities"""
+    def make(name, entity_id="entity_1", source="src-1", confidence=0.8, description=""):
+        return Entity(
+            entity_id=entity_id, entity_type="concept", name=name, description=description,
+            confidence=confidence, source_references=[source],
+        )
+    return make
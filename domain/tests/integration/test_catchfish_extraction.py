@@ -0,0 +1,209 @@
+"""
+Tests for Catchfish extraction performance features
+"""
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from domain.nusy_orchestrator.santiago_builder import catchfish as catchfish_module
+from domain.nusy_orchestrator.santiago_builder.catchfish import Catchfish, ExtractionLayer
+
+SOURCE_TEXT = """# Agile Planning
+
+Sprint Planning involves backlog refinement with the whole team.
+Product Owner requires clear acceptance criteria.
+Kanban Board includes work in progress limits.
+"""
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Small markdown source"""
+    path = tmp_path / "agile_planning.md"
+    path.write_text(SOURCE_TEXT)
+    return path
+
+
+class TestExtractionCache:
+    """Test the persistent extraction cache"""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_source_hits_cache(self, tmp_path, source):
+        """A second extraction of the same file returns the cached results"""
+        catchfish = Catchfish(workspace_path=tmp_path)
+
+        first = await catchfish.extract_from_source(source)
+        second = await catchfish.extract_from_source(source)
+
+        assert [e.name for e in second[1].entities] == [e.name for e in first[1].entities]
+        assert second[0].source_metadata.source_id == first[0].source_metadata.source_id
+        stats = catchfish.cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["time_saved_seconds"] > 0
+
+    @pytest.mark.asyncio
+    async def test_cache_persists_across_instances(self, tmp_path, source):
+        """A new Catchfish on the same workspace reuses earlier results"""
+        await Catchfish(workspace_path=tmp_path).extract_from_source(source)
+
+        catchfish = Catchfish(workspace_path=tmp_path)
+        await catchfish.extract_from_source(source)
+
+        assert catchfish.cache.stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_source_misses(self, tmp_path, source):
+        """Editing the source invalidates its cached results"""
+        catchfish = Catchfish(workspace_path=tmp_path)
+        await catchfish.extract_from_source(source)
+
+        source.write_text(SOURCE_TEXT + "\nRelease Train requires cadence.\n")
+        await catchfish.extract_from_source(source)
+
+        assert catchfish.cache.stats["hits"] == 0
+        assert catchfish.cache.stats["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_key_includes_layer_and_version(self, tmp_path, source, monkeypatch):
+        """Different target layers and extractor versions are cached separately"""
+        catchfish = Catchfish(workspace_path=tmp_path)
+        await catchfish.extract_from_source(source, target_layer=ExtractionLayer.ENTITIES)
+        await catchfish.extract_from_source(source, target_layer=ExtractionLayer.KG_TRIPLES)
+
+        monkeypatch.setattr(catchfish_module, "EXTRACTOR_VERSION", "test-next")
+        await catchfish.extract_from_source(source, target_layer=ExtractionLayer.KG_TRIPLES)
+
+        assert catchfish.cache.stats["hits"] == 0
+        assert catchfish.cache.get_stats()["entries"] == 3
+
+    @pytest.mark.asyncio
+    async def test_corrupt_entry_is_discarded(self, tmp_path, source):
+        """Unreadable cache files fall back to a fresh extraction"""
+        catchfish = Catchfish(workspace_path=tmp_path)
+        await catchfish.extract_from_source(source)
+        for entry in catchfish.cache.cache_dir.glob("*.pkl"):
+            entry.write_bytes(b"not a pickle")
+
+        results = await catchfish.extract_from_source(source)
+
+        assert len(results) == 4
+        assert catchfish.cache.stats["invalid_entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, tmp_path, source):
+        """Disabled caches never return results"""
+        catchfish = Catchfish(workspace_path=tmp_path, cache_enabled=False)
+        await catchfish.extract_from_source(source)
+        await catchfish.extract_from_source(source)
+
+        assert catchfish.cache.stats["hits"] == 0
+
+
+def make_sources(tmp_path, count):
+    """Write several distinct sources"""
+    sources = []
+    for i in range(count):
+        path = tmp_path / f"source_{i}.md"
+        path.write_text(SOURCE_TEXT + f"\nTopic Number{i} requires review.\n")
+        sources.append(path)
+    return sources
+
+
+class TestExtractMany:
+    """Test parallel batch extraction"""
+
+    @pytest.mark.asyncio
+    async def test_process_pool_extracts_every_source(self, tmp_path):
+        """Each source yields its own results and provenance"""
+        catchfish = Catchfish(workspace_path=tmp_path, max_workers=2)
+        sources = make_sources(tmp_path, 4)
+
+        extractions = [e async for e in catchfish.extract_many(sources)]
+
+        assert sorted(e.source_path for e in extractions) == sorted(sources)
+        assert all(e.error is None and len(e.results) == 4 for e in extractions)
+        source_ids = {e.results[0].source_metadata.source_id for e in extractions}
+        assert len(source_ids) == 4
+        assert len(list(catchfish.provenance_dir.glob("*_provenance.json"))) == 4
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported_per_source(self, tmp_path):
+        """A missing source does not stop the rest of the batch"""
+        catchfish = Catchfish(workspace_path=tmp_path)
+        sources = make_sources(tmp_path, 2) + [tmp_path / "missing.md"]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            extractions = [e async for e in catchfish.extract_many(sources, executor=executor)]
+
+        errors = [e for e in extractions if e.error]
+        assert len(extractions) == 3
+        assert [e.source_path.name for e in errors] == ["missing.md"]
+
+    @pytest.mark.asyncio
+    async def test_cached_sources_skip_workers(self, tmp_path):
+        """Unchanged sources come back from the cache"""
+        catchfish = Catchfish(workspace_path=tmp_path)
+        sources = make_sources(tmp_path, 2)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            [e async for e in catchfish.extract_many(sources, executor=executor)]
+            second = [e async for e in catchfish.extract_many(sources, executor=executor)]
+
+        assert all(e.from_cache for e in second)
+        assert catchfish.cache.stats["hits"] == 2
+
+
+class TestStreamingExtraction:
+    """Test chunked extraction of large sources"""
+
+    def test_chunks_overlap_and_cover_file(self, tmp_path):
+        """Owned regions tile the file exactly; windows carry overlap context"""
+        path = tmp_path / "large.txt"
+        path.write_bytes(bytes(range(256)) * 40)
+
+        chunks = list(catchfish_module.iter_source_chunks(path, chunk_size=1000, overlap=100))
+
+        owned = b"".join(c.data[c.owned_start:c.owned_end] for c in chunks)
+        assert owned == path.read_bytes()
+        assert chunks[1].offset == 900
+        assert len(chunks[1].data) == 1200
+
+    def test_matches_across_boundaries_are_not_split_or_duplicated(self, tmp_path):
+        """Entities straddling a chunk boundary are found once, whole"""
+        path = tmp_path / "large.txt"
+        filler = "x " * 245
+        path.write_text((filler + "Sprint Planning requires backlog. ") * 8)
+        metadata = catchfish_module.SourceMetadata(
+            source_id="src", file_path=path, file_hash="", file_size_bytes=path.stat().st_size,
+            file_type=".txt", extracted_at=None,
+        )
+
+        items = list(catchfish_module.iter_entities(
+            catchfish_module.iter_source_chunks(path, chunk_size=512, overlap=64), metadata
+        ))
+
+        names = [i.name for i in items if isinstance(i, catchfish_module.Entity)]
+        relationships = [(r.subject_id, r.predicate, r.object_id)
+                         for r in items if isinstance(r, catchfish_module.Relationship)]
+        assert names == ["Sprint Planning"]
+        assert relationships == [("Sprint Planning", "requires", "backlog")]
+
+    def test_hash_matches_full_read(self, tmp_path, source):
+        """Incremental hashing gives the same digest"""
+        assert catchfish_module.hash_file(source, block_size=7) == hashlib.sha256(source.read_bytes()).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_large_sources_are_streamed(self, tmp_path, source):
+        """Sources over the threshold skip loading raw text"""
+        catchfish = Catchfish(workspace_path=tmp_path, stream_threshold_bytes=10)
+
+        results = await catchfish.extract_from_source(source)
+        batch = [e async for e in catchfish.extract_many([source], use_cache=False)]
+
+        assert results[0].raw_text is None
+        assert "Kanban Board" in {e.name for e in results[1].entities}
+        assert batch[0].results[0].raw_text is None
+        assert {e.name for e in batch[0].results[1].entities} == {e.name for e in results[1].entities}
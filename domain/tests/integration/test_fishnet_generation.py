@@ -0,0 +1,83 @@
+"""
+Tests for Fishnet's incremental BDD feature generation
+"""
+
+import pytest
+
+from domain.nusy_orchestrator.santiago_builder.fishnet import Fishnet
+
+BEHAVIORS = ["create_backlog", "prioritize_stories", "plan_sprint"]
+
+
+class TestFishnetGeneration:
+    """Test feature reuse and unchanged-file skipping"""
+
+    @pytest.mark.asyncio
+    async def test_features_keep_behavior_order_and_evidence(self, tmp_path, make_entity):
+        """Features come back in input order with knowledge refs"""
+        fishnet = Fishnet(workspace_path=tmp_path)
+        entities = [make_entity("Product Backlog", "e1"), make_entity("Sprint Goal", "e2")]
+
+        features = await fishnet.generate_bdd_features("test-domain", BEHAVIORS, entities, [])
+
+        assert [f.name for f in features] == ["Create Backlog", "Prioritize Stories", "Plan Sprint"]
+        assert features[0].scenarios[0].knowledge_refs == ["e1"]
+        assert features[2].scenarios[0].knowledge_refs == ["e2"]
+        assert len(list((tmp_path / "knowledge" / "catches" / "test-domain" / "bdd-tests").glob("*.feature"))) == 3
+
+    @pytest.mark.asyncio
+    async def test_knowledge_refs_are_rendered(self, tmp_path, make_entity):
+        """Each scenario in the .feature file names its supporting knowledge"""
+        fishnet = Fishnet(workspace_path=tmp_path)
+        entities = [make_entity("Product Backlog", "e1"), make_entity("Backlog Item", "e3")]
+
+        await fishnet.generate_bdd_features("test-domain", BEHAVIORS, entities, [])
+
+        bdd_dir = tmp_path / "knowledge" / "catches" / "test-domain" / "bdd-tests"
+        lines = (bdd_dir / "create_backlog.feature").read_text().splitlines()
+        assert lines.count("  # Knowledge: e1, e3") == 3
+        assert lines[lines.index("  # Knowledge: e1, e3") + 2].startswith("  Scenario:")
+        assert "# Knowledge" not in (bdd_dir / "plan_sprint.feature").read_text()
+
+    @pytest.mark.asyncio
+    async def test_behaviors_sharing_a_file_are_generated_once(self, tmp_path):
+        """Spellings of one behavior map to a single feature and file"""
+        fishnet = Fishnet(workspace_path=tmp_path)
+
+        features = await fishnet.generate_bdd_features(
+            "test-domain", ["create_task", "Create Task", "plan_sprint"], [], []
+        )
+
+        assert features[0] is features[1]
+        assert fishnet.stats["features_generated"] == 2
+        assert fishnet.stats["files_written"] == 2
+
+    @pytest.mark.asyncio
+    async def test_only_changed_evidence_is_regenerated(self, tmp_path, make_entity):
+        """A second cycle reuses features whose evidence did not change"""
+        fishnet = Fishnet(workspace_path=tmp_path)
+        entities = [make_entity("Product Backlog", "e1")]
+        first = await fishnet.generate_bdd_features("test-domain", BEHAVIORS, entities, [])
+
+        entities.append(make_entity("Sprint Goal", "e2"))
+        second = await fishnet.generate_bdd_features("test-domain", BEHAVIORS, entities, [])
+
+        assert second[0] is first[0]
+        assert second[2] is not first[2]
+        assert fishnet.stats["features_generated"] == 4
+        assert fishnet.stats["features_reused"] == 2
+
+    @pytest.mark.asyncio
+    async def test_identical_files_are_not_rewritten(self, tmp_path):
+        """Regenerated features with the same Gherkin leave the file untouched"""
+        fishnet = Fishnet(workspace_path=tmp_path)
+        await fishnet.generate_bdd_features("test-domain", BEHAVIORS, [], [])
+        feature_file = tmp_path / "knowledge" / "catches" / "test-domain" / "bdd-tests" / "create_backlog.feature"
+        mtime = feature_file.stat().st_mtime_ns
+
+        fresh = Fishnet(workspace_path=tmp_path)
+        await fresh.generate_bdd_features("test-domain", BEHAVIORS, [], [], incremental=False)
+
+        assert feature_file.stat().st_mtime_ns == mtime
+        assert fresh.stats["files_unchanged"] == 3
+        assert fresh.stats["files_written"] == 0
@@ -0,0 +1,331 @@
+"""
+Tests for KGStore storage and provenance
+"""
+
+import threading
+import time
+
+import pytest
+from rdflib import BNode, Graph, Literal
+from rdflib.namespace import RDF
+
+from domain.src.nusy_pm_core.adapters.kg_store import KGStore, KGTriple
+
+
+def make_triples(source="doc.md"):
+    """Two feature triples from one source"""
+    return [
+        KGTriple(subject="pm:Feature_1", predicate="rdf:type", object="pm:Feature", source=source, confidence=0.9),
+        KGTriple(subject="pm:Feature_1", predicate="rdfs:label", object="Backlog", source=source, confidence=0.8),
+    ]
+
+
+class TestProvenance:
+    """Test the provenance side table"""
+
+    def test_provenance_is_not_reified_into_graph(self, tmp_path):
+        """Only data triples are stored in the graph"""
+        kg = KGStore(workspace_path=str(tmp_path))
+        kg.add_triples(make_triples())
+
+        assert len(kg.graph) == 2
+        assert list(kg.graph.subjects(RDF.type, RDF.Statement)) == []
+        assert kg.get_provenance("pm:Feature_1", "rdfs:label", "Backlog")[0]["source"] == "doc.md"
+
+    def test_repeated_source_is_deduplicated(self, tmp_path):
+        """Re-adding a triple from the same source keeps one record"""
+        kg = KGStore(workspace_path=str(tmp_path))
+        kg.add_triples(make_triples())
+        kg.add_triples(make_triples())
+        kg.add_triples(make_triples(source="other.md"))
+
+        records = kg.get_provenance("pm:Feature_1", "rdf:type", "pm:Feature")
+        assert sorted(r["source"] for r in records) == ["doc.md", "other.md"]
+        assert kg.get_statistics().provenance_records == 4
+        assert kg.provenance.duplicates_skipped == 2
+
+    def test_provenance_persists(self, tmp_path):
+        """Provenance survives save/load"""
+        kg = KGStore(workspace_path=str(tmp_path))
+        kg.add_triples(make_triples())
+        kg.save()
+
+        reloaded = KGStore(workspace_path=str(tmp_path))
+
+        records = reloaded.get_provenance("pm:Feature_1", "rdf:type", "pm:Feature")
+        assert records[0]["source"] == "doc.md"
+        assert records[0]["confidence"] == 0.9
+
+    def test_legacy_reified_provenance_is_migrated(self, tmp_path):
+        """rdf:Statement provenance from older files moves into the side table"""
+        kg = KGStore(workspace_path=str(tmp_path))
+        s, p, o = kg.PM["Feature_1"], RDF.type, kg.PM["Feature"]
+        legacy = Graph()
+        stmt = BNode()
+        legacy.add((s, p, o))
+        legacy.add((stmt, RDF.type, RDF.Statement))
+        legacy.add((stmt, RDF.subject, s))
+        legacy.add((stmt, RDF.predicate, p))
+        legacy.add((stmt, RDF.object, o))
+        legacy.add((stmt, kg.PROV.wasDerivedFrom, Literal("legacy.md")))
+        legacy.serialize(destination=str(kg.kg_file), format="turtle")
+
+        reloaded = KGStore(workspace_path=str(tmp_path))
+
+        assert len(reloaded.graph) == 1
+        assert reloaded.get_provenance("pm:Feature_1", "rdf:type", "pm:Feature")[0]["source"] == "legacy.md"
+
+
+class TestBulkLoadAndSnapshot:
+    """Test bulk ingest and snapshot startup"""
+
+    def test_bulk_ingest_matches_single_adds(self, tmp_path):
+        """add_triples produces the same graph as add_triple"""
+        bulk = KGStore(workspace_path=str(tmp_path / "bulk"))
+        single = KGStore(workspace_path=str(tmp_path / "single"))
+        triples = make_triples() + [KGTriple(subject="Local", predicate="unknown:rel", object="plain text")]
+
+        count = bulk.add_triples(triples)
+        for t in triples:
+            single.add_triple(t.subject, t.predicate, t.object, source=t.source, confidence=t.confidence)
+
+        assert count == 3
+        assert set(bulk.graph) == set(single.graph)
+        assert len(bulk.provenance) == len(single.provenance) == 2
+
+    def test_snapshot_round_trip(self, tmp_path):
+        """A fresh store starts from the snapshot with identical triples"""
+        kg = KGStore(workspace_path=str(tmp_path))
+        kg.add_triples(make_triples())
+        kg.save()
+
+        reloaded = KGStore(workspace_path=str(tmp_path))
+
+        assert kg.snapshot_file.exists()
+        assert set(reloaded.graph) == set(kg.graph)
+        assert reloaded.get_entities_by_type("pm:Feature") == ["https://nusy.dev/pm/Feature_1"]
+
+    def test_stale_snapshot_falls_back_to_turtle(self, tmp_path):
+        """Turtle edited after the snapshot was written wins"""
+        kg = KGStore(workspace_path=str(tmp_path))
+        kg.add_triples(make_triples())
+        kg.save()
+
+        other = KGStore(workspace_path=str(tmp_path), use_snapshot=False)
+        other.add_triple("pm:Feature_2", "rdf:type", "pm:Feature")
+        other.save()
+
+        reloaded = KGStore(workspace_path=str(tmp_path))
+
+        assert len(reloaded.get_entities_by_type("pm:Feature")) == 2
+
+
+class TestSQLiteBackend:
+    """Test the SQLite triple-table backend"""
+
+    def test_sqlite_backend_persists_on_save(self, tmp_path):
+        """Committed triples are visible to a new store without Turtle"""
+        kg = KGStore(workspace_path=str(tmp_path), backend="sqlite")
+        kg.add_triples(make_triples())
+        kg.add_triple("pm:Feature_2", "pm:title", "Title with spaces")
+        kg.save()
+
+        reloaded = KGStore(workspace_path=str(tmp_path), backend="sqlite")
+
+        assert not kg.kg_file.exists()
+        assert set(reloaded.graph) == set(kg.graph)
+        assert reloaded.get_entity_properties("https://nusy.dev/pm/Feature_1")[
+            "http://www.w3.org/2000/01/rdf-schema#label"] == "Backlog"
+        assert reloaded.get_statistics().unique_subjects == 2
+
+    def test_two_stores_share_one_file(self, tmp_path):
+        """Opening a store does not hold the database write lock"""
+        first = KGStore(workspace_path=str(tmp_path), backend="sqlite")
+        second = KGStore(workspace_path=str(tmp_path), backend="sqlite")
+
+        second.add_triples(make_triples())
+        second.save()
+
+        assert len(first.graph) == 2
+
+    def test_pattern_lookups_and_removal(self, tmp_path):
+        """Bound-term patterns use the indexes; unknown terms match nothing"""
+        kg = KGStore(workspace_path=str(tmp_path), backend="sqlite")
+        kg.add_triples(make_triples())
+        feature = kg.PM["Feature_1"]
+
+        assert list(kg.graph.subjects(RDF.type, kg.PM["Feature"])) == [feature]
+        assert list(kg.graph.objects(feature, kg.PM["missing"])) == []
+
+        kg.graph.remove((feature, None, None))
+        assert len(kg.graph) == 0
+
+    def test_imports_existing_turtle_once(self, tmp_path):
+        """Switching a workspace to SQLite imports its Turtle file"""
+        memory = KGStore(workspace_path=str(tmp_path), backend="memory")
+        memory.add_triples(make_triples())
+        memory.save()
+
+        kg = KGStore(workspace_path=str(tmp_path), backend="sqlite")
+
+        assert len(kg.graph) == 2
+        assert kg.get_provenance("pm:Feature_1", "rdf:type", "pm:Feature")[0]["source"] == "doc.md"
+
+    def test_unknown_backend_rejected(self, tmp_path):
+        """Misconfigured backends fail loudly"""
+        with pytest.raises(ValueError):
+            KGStore(workspace_path=str(tmp_path), backend="postgres")
+
+
+class TestConcurrency:
+    """Test reader-writer locking"""
+
+    def test_readers_run_concurrently(self, tmp_path):
+        """Two readers can hold the lock at the same time"""
+        kg = KGStore(workspace_path=str(tmp_path))
+        kg.add_triples(make_triples())
+        both_inside = threading.Barrier(2, timeout=5)
+        results = []
+
+        def reader():
+            with kg.lock.read():
+                both_inside.wait()  # Breaks (raises) if readers were serialized
+                results.append(kg.get_entities_by_type("pm:Feature"))
+
+        threads = [threading.Thread(target=reader) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(results) == 2
+        assert kg.get_lock_stats()["max_concurrent_readers"] == 2
+
+    def test_writer_waits_for_readers_and_is_counted(self, tmp_path):
+        """A write blocks until readers leave and is recorded as contended"""
+        kg = KGStore(workspace_path=str(tmp_path))
+        reading = threading.Event()
+        release = threading.Event()
+
+        def reader():
+            with kg.lock.read():
+                reading.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        reading.wait(5)
+        writer = threading.Thread(target=lambda: kg.add_triples(make_triples()))
+        writer.start()
+        writer.join(0.2)
+        assert writer.is_alive()
+        assert len(kg.graph) == 0
+
+        release.set()
+        writer.join(5)
+        thread.join(5)
+
+        stats = kg.get_lock_stats()
+        assert len(kg.graph) == 2
+        assert stats["write_contended"] == 1
+        assert stats["write_wait_seconds"] > 0
+
+    def test_batch_allows_nested_reads_and_writes(self, tmp_path):
+        """A batch holds the write lock; the same thread may still read and write"""
+        kg = KGStore(workspace_path=str(tmp_path))
+        with kg.batch():
+            kg.add_triple("pm:Feature_1", "rdf:type", "pm:Feature")
+            assert kg.get_entities_by_type("pm:Feature") == ["https://nusy.dev/pm/Feature_1"]
+            kg.add_triples(make_triples())
+
+        with kg.lock.read():
+            with pytest.raises(RuntimeError):
+                kg.add_triple("pm:Feature_2", "rdf:type", "pm:Feature")
+        assert kg.get_lock_stats()["writer_active"] is False
+
+
+    def test_save_inside_batch_while_another_thread_saves(self, tmp_path):
+        """save() under batch() does not deadlock with a concurrent save()"""
+        kg = KGStore(workspace_path=str(tmp_path))
+        in_batch = threading.Event()
+
+        def batch_then_save():
+            with kg.batch():
+                kg.add_triples(make_triples())
+                in_batch.set()
+                deadline = time.monotonic() + 5
+                while kg.get_lock_stats()["read_contended"] == 0 and time.monotonic() < deadline:
+                    time.sleep(0.01)  # Until the other save() is queued behind the batch
+                kg.save()
+
+        writer = threading.Thread(target=batch_then_save, daemon=True)
+        writer.start()
+        in_batch.wait(5)
+        saver = threading.Thread(target=kg.save, daemon=True)
+        saver.start()
+
+        writer.join(5)
+        saver.join(5)
+        assert not writer.is_alive() and not saver.is_alive()
+        assert KGStore(workspace_path=str(tmp_path)).get_statistics().total_triples == 2
+
+
+class TestEntityLookups:
+    """Test direct-pattern entity lookups and the entity cache"""
+
+    def test_properties_match_sparql(self, tmp_path):
+        """The fast path returns what the equivalent SPARQL query returns"""
+        kg = KGStore(workspace_path=str(tmp_path))
+        kg.add_triples(make_triples())
+        kg.add_triple("pm:Feature_1", "rdfs:label", "Board")
+        uri = "https://nusy.dev/pm/Feature_1"
+
+        rows = kg.query(f"SELECT ?property ?value WHERE {{ <{uri}> ?property ?value . }}")
+        props = kg.get_entity_properties(uri)
+
+        assert sum(len(v) if isinstance(v, list) else 1 for v in props.values()) == len(rows)
+        assert sorted(props["http://www.w3.org/2000/01/rdf-schema#label"]) == ["Backlog", "Board"]
+        assert kg.get_entities_by_type("pm:Feature") == [uri]
+
+    def test_cache_is_invalidated_on_write(self, tmp_path):
+        """Repeated lookups hit the cache until the entity is written"""
+        kg = KGStore(workspace_path=str(tmp_path))
+        kg.add_triples(make_triples())
+        uri = "https://nusy.dev/pm/Feature_1"
+
+        kg.get_entity_properties(uri)
+        kg.get_entity_properties(uri)["extra"] = "caller mutation"
+        assert "extra" not in kg.get_entity_properties(uri)
+        assert kg.get_cache_stats()["hits"] == 2
+
+        kg.add_triple("pm:Feature_1", "pm:status", "done")
+        assert kg.get_entity_properties(uri)["https://nusy.dev/pm/status"] == "done"
+
+    def test_sqlite_sees_other_stores_writes(self, tmp_path):
+        """Entities are not cached when another process may commit to the file"""
+        reader = KGStore(workspace_path=str(tmp_path), backend="sqlite")
+        writer = KGStore(workspace_path=str(tmp_path), backend="sqlite")
+        uri = "https://nusy.dev/pm/Feature_1"
+        writer.add_triples(make_triples())
+        writer.save()
+        assert len(reader.get_entity_properties(uri)) == 2
+
+        writer.add_triple("pm:Feature_1", "pm:status", "done")
+        writer.save()
+
+        assert reader.get_entity_properties(uri)["https://nusy.dev/pm/status"] == "done"
+        assert reader.get_cache_stats()["entries"] == 0
+
+    def test_batch_properties(self, tmp_path):
+        """Batch lookups return every requested entity, unknown ones empty"""
+        kg = KGStore(workspace_path=str(tmp_path), entity_cache_size=1)
+        kg.add_triples(make_triples())
+        kg.add_triple("pm:Feature_2", "rdf:type", "pm:Feature")
+        uris = ["https://nusy.dev/pm/Feature_1", "https://nusy.dev/pm/Feature_2", "https://nusy.dev/pm/Missing"]
+
+        result = kg.get_entities_properties(uris)
+
+        assert list(result) == uris
+        assert result[uris[2]] == {}
+        assert len(result[uris[0]]) == 2
+        assert kg.get_cache_stats()["entries"] == 1
@@ -0,0 +1,86 @@
+"""
+Tests for Navigator's deduplicated knowledge registry
+"""
+
+from datetime import datetime
+
+import pytest
+
+from domain.nusy_orchestrator.santiago_builder.catchfish import Relationship
+from domain.nusy_orchestrator.santiago_builder.knowledge_registry import KnowledgeRegistry
+from domain.nusy_orchestrator.santiago_builder.navigator import ExpeditionLog, Navigator
+
+
+def make_relationship(subject="Sprint Planning", obj="backlog", source="src-1"):
+    """Create a test relationship"""
+    return Relationship(
+        relationship_id="rel_1", subject_id=subject, predicate="requires", object_id=obj,
+        confidence=0.7, source_references=[source],
+    )
+
+
+class TestKnowledgeRegistry:
+    """Test deduplication and delta tracking"""
+
+    def test_duplicates_merge_into_canonical_entity(self, make_entity):
+        """Same normalized name/type keeps one entity with merged provenance"""
+        registry = KnowledgeRegistry()
+
+        assert registry.add_entity(make_entity("Sprint Planning")) is True
+        assert registry.add_entity(make_entity("sprint  planning", "entity_2", "src-2", 0.9)) is False
+
+        entities = registry.all_entities()
+        assert len(entities) == 1
+        assert entities[0].entity_id == "entity_1"
+        assert entities[0].confidence == 0.9
+        assert entities[0].source_references == ["src-1", "src-2"]
+
+    def test_pending_delta_clears_on_flush(self, make_entity):
+        """Only items added since the last flush are pending"""
+        registry = KnowledgeRegistry()
+        registry.add_entity(make_entity("Sprint Planning"))
+        registry.add_relationship(make_relationship())
+        registry.mark_flushed()
+
+        registry.add_entity(make_entity("Sprint Planning", "entity_2"))
+        registry.add_relationship(make_relationship())
+        registry.add_entity(make_entity("Kanban Board", "entity_3"))
+
+        assert [e.name for e in registry.pending_entities()] == ["Kanban Board"]
+        assert registry.pending_relationships() == []
+        assert registry.get_stats()["entities_merged"] == 1
+
+    def test_new_description_marks_entity_pending(self, make_entity):
+        """Merging in a description changes the entity's triples"""
+        registry = KnowledgeRegistry()
+        registry.add_entity(make_entity("Sprint Planning"))
+        registry.mark_flushed()
+
+        registry.add_entity(make_entity("Sprint Planning", description="Planning ceremony"))
+
+        assert [e.description for e in registry.pending_entities()] == ["Planning ceremony"]
+
+
+class TestNavigatorKGDelta:
+    """Test that KG building only writes new knowledge"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_cycles_do_not_rewrite_kg(self, tmp_path, make_entity):
+        """A second KG build with no new knowledge adds no triples"""
+        navigator = Navigator(workspace_path=tmp_path)
+        navigator.current_expedition = ExpeditionLog(
+            expedition_id="test", domain_name="test", started_at=datetime.now()
+        )
+        for _ in range(2):
+            navigator.knowledge_registry.add_entity(make_entity("Sprint Planning"))
+            navigator.knowledge_registry.add_relationship(make_relationship())
+
+        await navigator._step6_kg_building()
+        after_first = len(navigator.kg_store.graph)
+
+        navigator.knowledge_registry.add_entity(make_entity("Sprint Planning", "entity_9"))
+        await navigator._step6_kg_building()
+
+        assert after_first > 0
+        assert len(navigator.kg_store.graph) == after_first
+        assert len(navigator.extracted_entities) == 1
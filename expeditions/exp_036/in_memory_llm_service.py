@@ -15,6 +15,7 @@ from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass
 from enum import Enum
 import threading
+from collections import Counter, deque
 import psutil
 from pathlib import Path
 
@@ -39,6 +40,23 @@ class LLMSize(Enum):
     XLARGE = "xlarge"    # > 13B parameters
 
 
+# Estimated resident footprint per model size (MB), used when a model has no measured footprint
+SIZE_FOOTPRINT_MB = {
+    LLMSize.SMALL: 2048,
+    LLMSize.MEDIUM: 4096,
+    LLMSize.LARGE: 8192,
+    LLMSize.XLARGE: 16384
+}
+
+# Keywords used to infer which capabilities a question needs
+CAPABILITY_KEYWORDS = {
+    "coding": ["code", "function", "implement", "bug", "python", "class", "refactor", "test"],
+    "mathematics": ["math", "calculate", "equation", "probability", "formula"],
+    "technical_writing": ["document", "docs", "write up", "explain", "readme"],
+    "simple_reasoning": ["why", "compare", "should"]
+}
+
+
 @dataclass
 class LLMModel:
     """Represents a loaded LLM model"""
@@ -50,10 +68,14 @@ class LLMModel:
     memory_usage: int = 0  # MB
     last_used: float = 0.0
     capabilities: List[str] = None
+    footprint_mb: int = 0  # Expected resident size; estimated from size if 0
+    active_requests: int = 0  # Queries currently running on this model
 
     def __post_init__(self):
         if self.capabilities is None:
             self.capabilities = ["general_question_answering"]
+        if not self.footprint_mb:
+            self.footprint_mb = SIZE_FOOTPRINT_MB.get(self.size, 4096)
 
 
 @dataclass
@@ -85,13 +107,15 @@ class InMemoryLLMService:
     enabling instant responses to development questions without external API calls.
     """
 
-    def __init__(self, model_dir: Path = None, max_memory_gb: float = 8.0):
+    def __init__(self, model_dir: Path = None, max_memory_gb: float = 8.0,
+                 prewarm_interval: int = 20):
         """
         Initialize the in-memory LLM service.
 
         Args:
             model_dir: Directory containing LLM model files
             max_memory_gb: Maximum memory to use for models
+            prewarm_interval: Pre-warm models for the recent query mix every N queries (0 disables)
         """
         self.model_dir = model_dir or Path("models")
         # For testing/development, be more permissive with memory limits
@@ -104,6 +128,16 @@ class InMemoryLLMService:
         self.model_lock = threading.Lock()
         self.query_history: List[Dict[str, Any]] = []
 
+        # Residency management
+        self.prewarm_interval = prewarm_interval
+        self.recent_capabilities: deque = deque(maxlen=50)  # Capabilities needed by recent queries
+        self.residency_stats = {
+            "evictions": 0,
+            "cold_loads": 0,
+            "total_cold_load_ms": 0.0,
+            "prewarmed": 0
+        }
+
         # Create model directory if it doesn't exist
         self.model_dir.mkdir(exist_ok=True)
 
@@ -139,9 +173,19 @@ class InMemoryLLMService:
         for model in default_models:
             self.loaded_models[model.name] = model
 
+    @property
+    def memory_budget_mb(self) -> int:
+        """Memory budget for resident models in MB"""
+        return self.max_memory_bytes // (1024 * 1024)
+
+    def resident_memory_mb(self) -> int:
+        """Memory used by currently loaded models in MB"""
+        return sum(m.memory_usage for m in self.loaded_models.values() if m.loaded)
+
     def load_model(self, model_name: str) -> bool:
         """
-        Load a model into memory.
+        Load a model into memory, evicting least-recently-used models if the
+        memory budget would otherwise be exceeded.
 
         Args:
             model_name: Name of the model to load
@@ -150,48 +194,84 @@ class InMemoryLLMService:
             True if loaded successfully, False otherwise
         """
         with self.model_lock:
-            if model_name not in self.loaded_models:
-                logger.error(f"Model {model_name} not found in available models")
-                return False
+            return self._load_model_locked(model_name)
 
-            model = self.loaded_models[model_name]
+    def _load_model_locked(self, model_name: str, allow_eviction: bool = True) -> bool:
+        """Load a model; caller holds model_lock"""
+        if model_name not in self.loaded_models:
+            logger.error(f"Model {model_name} not found in available models")
+            return False
 
-            if model.loaded:
-                logger.info(f"Model {model_name} already loaded")
-                return True
+        model = self.loaded_models[model_name]
+
+        if model.loaded:
+            logger.info(f"Model {model_name} already loaded")
+            return True
+
+        if model.footprint_mb > self.memory_budget_mb:
+            logger.warning(f"Model {model_name} ({model.footprint_mb}MB) exceeds memory budget "
+                           f"({self.memory_budget_mb}MB)")
+            return False
+
+        # Make room within the budget
+        if not self._ensure_capacity(model.footprint_mb, allow_eviction):
+            logger.warning(f"Insufficient memory budget to load {model_name}")
+            return False
+
+        # Check the machine actually has the memory
+        available_memory = psutil.virtual_memory().available
+        if os.environ.get("LLM_TESTING", "").lower() == "true":
+            # In testing, allow loading as long as we have at least 100MB free
+            memory_ok = available_memory > 100 * 1024 * 1024
+        else:
+            memory_ok = available_memory > model.footprint_mb * 1024 * 1024
+
+        if not memory_ok:
+            logger.warning(f"Insufficient memory to load {model_name}")
+            return False
+
+        try:
+            # Simulate model loading (in real implementation, this would load the actual model)
+            logger.info(f"Loading model {model_name} into memory...")
+            load_start = time.perf_counter()
+
+            # Placeholder for actual model loading
+            # In production, this would use transformers, llama.cpp, or similar
+            model.loaded = True
+            model.memory_usage = model.footprint_mb  # MB
+            model.last_used = time.time()
 
-            # Check memory availability
-            current_memory = psutil.virtual_memory()
-            available_memory = current_memory.available
-
-            # For testing, be more permissive
-            import os
-            if os.environ.get("LLM_TESTING", "").lower() == "true":
-                # In testing, allow loading as long as we have at least 100MB free
-                memory_ok = available_memory > 100 * 1024 * 1024
-            else:
-                memory_ok = available_memory > self.max_memory_bytes * 0.8
-
-            if not memory_ok:
-                logger.warning(f"Insufficient memory to load {model_name}")
-                return False
-
-            try:
-                # Simulate model loading (in real implementation, this would load the actual model)
-                logger.info(f"Loading model {model_name} into memory...")
-
-                # Placeholder for actual model loading
-                # In production, this would use transformers, llama.cpp, or similar
-                model.loaded = True
-                model.memory_usage = 1024 * (2 if model.size == LLMSize.SMALL else 4)  # MB
-                model.last_used = time.time()
-
-                logger.info(f"Successfully loaded {model_name} ({model.memory_usage}MB)")
+            self.residency_stats["cold_loads"] += 1
+            self.residency_stats["total_cold_load_ms"] += (time.perf_counter() - load_start) * 1000
+
+            logger.info(f"Successfully loaded {model_name} ({model.memory_usage}MB)")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to load model {model_name}: {e}")
+            return False
+
+    def _ensure_capacity(self, needed_mb: int, allow_eviction: bool = True) -> bool:
+        """Evict idle loaded models, least recently used first, until needed_mb fits"""
+        free_mb = self.memory_budget_mb - self.resident_memory_mb()
+        if free_mb >= needed_mb:
+            return True
+        if not allow_eviction:
+            return False
+
+        idle_models = sorted(
+            (m for m in self.loaded_models.values() if m.loaded and m.active_requests == 0),
+            key=lambda m: m.last_used
+        )
+        for victim in idle_models:
+            logger.info(f"Evicting least recently used model {victim.name} ({victim.memory_usage}MB)")
+            free_mb += victim.memory_usage
+            self._unload_model_locked(victim.name)
+            self.residency_stats["evictions"] += 1
+            if free_mb >= needed_mb:
                 return True
 
-            except Exception as e:
-                logger.error(f"Failed to load model {model_name}: {e}")
-                return False
+        return free_mb >= needed_mb
 
     def unload_model(self, model_name: str) -> bool:
         """
@@ -204,23 +284,61 @@ class InMemoryLLMService:
             True if unloaded successfully
         """
         with self.model_lock:
-            if model_name not in self.loaded_models:
-                return False
+            return self._unload_model_locked(model_name)
 
-            model = self.loaded_models[model_name]
-            if not model.loaded:
-                return True
+    def _unload_model_locked(self, model_name: str) -> bool:
+        """Unload a model; caller holds model_lock"""
+        if model_name not in self.loaded_models:
+            return False
 
-            try:
-                # Simulate model unloading
-                logger.info(f"Unloading model {model_name} from memory...")
-                model.loaded = False
-                model.memory_usage = 0
-                logger.info(f"Successfully unloaded {model_name}")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to unload model {model_name}: {e}")
-                return False
+        model = self.loaded_models[model_name]
+        if not model.loaded:
+            return True
+
+        try:
+            # Simulate model unloading
+            logger.info(f"Unloading model {model_name} from memory...")
+            model.loaded = False
+            model.memory_usage = 0
+            logger.info(f"Successfully unloaded {model_name}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to unload model {model_name}: {e}")
+            return False
+
+    def prewarm(self, max_models: int = 1) -> List[str]:
+        """
+        Load models suited to the recent query mix, using only free budget.
+
+        Args:
+            max_models: Maximum number of models to pre-warm
+
+        Returns:
+            Names of models that were loaded
+        """
+        capability_counts = Counter(cap for caps in self.recent_capabilities for cap in caps)
+        warmed = []
+
+        with self.model_lock:
+            for capability, _ in capability_counts.most_common():
+                if len(warmed) >= max_models:
+                    break
+                if any(m.loaded and capability in m.capabilities for m in self.loaded_models.values()):
+                    continue  # Already covered by a resident model
+
+                candidates = sorted(
+                    (m for m in self.loaded_models.values() if not m.loaded and capability in m.capabilities),
+                    key=lambda m: m.footprint_mb
+                )
+                for model in candidates:
+                    if self._load_model_locked(model.name, allow_eviction=False):
+                        warmed.append(model.name)
+                        self.residency_stats["prewarmed"] += 1
+                        break
+
+        if warmed:
+            logger.info(f"Pre-warmed models for recent query mix: {', '.join(warmed)}")
+        return warmed
 
     def query(self, query: LLMQuery) -> Optional[LLMResponse]:
         """
@@ -234,8 +352,11 @@ class InMemoryLLMService:
         """
         start_time = time.time()
 
+        required_capabilities = self._infer_capabilities(query)
+        self.recent_capabilities.append(required_capabilities)
+
         # Select appropriate model
-        model = self._select_model(query)
+        model = self._select_model(query, required_capabilities)
         if not model:
             logger.warning("No suitable model available for query")
             return None
@@ -246,6 +367,7 @@ class InMemoryLLMService:
                 logger.error(f"Failed to load required model {model.name}")
                 return None
 
+        model.active_requests += 1
         try:
             # Simulate LLM inference (in production, this would call the actual model)
             answer = self._simulate_inference(query.question, model, query.context)
@@ -273,40 +395,62 @@ class InMemoryLLMService:
             # Log the query
             self._log_query(query, response)
 
+            if self.prewarm_interval and len(self.query_history) % self.prewarm_interval == 0:
+                self.prewarm()
+
             return response
 
         except Exception as e:
             logger.error(f"Query failed: {e}")
             return None
+        finally:
+            model.active_requests -= 1
+
+    def _infer_capabilities(self, query: LLMQuery) -> List[str]:
+        """
+        Infer the capabilities a query needs from its text and context.
+        """
+        text = " ".join([query.question, str(query.context.get("task", "")) if query.context else ""]).lower()
+        required = [cap for cap, keywords in CAPABILITY_KEYWORDS.items()
+                    if any(keyword in text for keyword in keywords)]
+        return required or ["general_qa"]
 
-    def _select_model(self, query: LLMQuery) -> Optional[LLMModel]:
+    def _select_model(self, query: LLMQuery, required_capabilities: Optional[List[str]] = None) -> Optional[LLMModel]:
         """
         Select the most appropriate model for the query.
+
+        Models are scored on capability match, with a bonus for already being
+        resident (no cold load) and a penalty for requests already running on
+        them. Smaller models win ties.
         """
+        required = set(required_capabilities or self._infer_capabilities(query))
+
         # If specific model requested, try to use it
         if query.model_preference:
             preferred_models = [m for m in self.loaded_models.values()
                               if m.type == query.model_preference and m.loaded]
             if preferred_models:
-                return preferred_models[0]
-
-        # Otherwise, select based on capabilities and memory efficiency
-        # Prioritize smaller, loaded models for speed
-        candidates = [m for m in self.loaded_models.values() if m.loaded]
-
-        if not candidates:
-            # Try to load a small model
-            small_models = [m for m in self.loaded_models.values()
-                          if m.size == LLMSize.SMALL]
-            if small_models:
-                self.load_model(small_models[0].name)
-                return small_models[0] if small_models[0].loaded else None
-
-        # Return the most recently used loaded model
-        if candidates:
-            return max(candidates, key=lambda m: m.last_used)
+                return min(preferred_models, key=lambda m: m.active_requests)
+
+        best_model = None
+        best_score = None
+        for model in self.loaded_models.values():
+            if model.footprint_mb > self.memory_budget_mb:
+                continue  # Can never be made resident
+
+            match = len(required & set(model.capabilities)) / len(required)
+            score = (
+                match
+                + (0.5 if model.loaded else 0.0)
+                - 0.1 * model.active_requests
+                + (1.0 if query.model_preference and model.type == query.model_preference else 0.0),
+                -model.footprint_mb,
+                model.last_used
+            )
+            if best_score is None or score > best_score:
+                best_model, best_score = model, score
 
-        return None
+        return best_model
 
     def _simulate_inference(self, question: str, model: LLMModel, context: Dict[str, Any]) -> str:
         """
@@ -375,9 +519,17 @@ class InMemoryLLMService:
         loaded_models = [m for m in self.loaded_models.values() if m.loaded]
         total_memory = sum(m.memory_usage for m in loaded_models)
 
+        cold_loads = self.residency_stats["cold_loads"]
+
         return {
             "loaded_models": len(loaded_models),
             "total_memory_mb": total_memory,
+            "memory_budget_mb": self.memory_budget_mb,
+            "evictions": self.residency_stats["evictions"],
+            "cold_loads": cold_loads,
+            "avg_cold_load_ms": self.residency_stats["total_cold_load_ms"] / max(cold_loads, 1),
+            "prewarmed": self.residency_stats["prewarmed"],
+            "active_requests": {m.name: m.active_requests for m in loaded_models},
             "available_models": list(self.loaded_models.keys()),
             "total_queries": len(self.query_history),
             "avg_confidence": sum(q.get("confidence", 0) for q in self.query_history) / max(len(self.query_history), 1),
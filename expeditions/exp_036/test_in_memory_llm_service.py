@@ -167,3 +167,65 @@ class TestInMemoryLLMService:
         assert len(service.query_history) == 0
 
 
+
+
+class TestModelResidency:
+
+    def test_lru_eviction_within_budget(self):
+        """Loading past the budget evicts the least recently used model"""
+        service = InMemoryLLMService()
+        service.max_memory_bytes = 4 * 1024 * 1024 * 1024  # Room for two small models
+
+        assert service.load_model("phi-2")
+        assert service.load_model("tinyllama-1.1b")
+        service.loaded_models["phi-2"].last_used = 0.0  # phi-2 is now least recently used
+
+        assert service.load_model("mistral-7b-instruct")
+
+        assert service.loaded_models["mistral-7b-instruct"].loaded
+        assert not service.loaded_models["phi-2"].loaded
+        assert not service.loaded_models["tinyllama-1.1b"].loaded
+        stats = service.get_stats()
+        assert stats["evictions"] == 2
+        assert stats["total_memory_mb"] <= stats["memory_budget_mb"]
+
+    def test_busy_model_not_evicted(self):
+        """Models serving requests are never evicted"""
+        service = InMemoryLLMService()
+        service.max_memory_bytes = 2 * 1024 * 1024 * 1024
+        service.load_model("phi-2")
+        service.loaded_models["phi-2"].active_requests = 1
+
+        assert not service.load_model("tinyllama-1.1b")
+        assert service.loaded_models["phi-2"].loaded
+
+    def test_capability_match_selection(self):
+        """Models are selected by capability rather than recency"""
+        service = InMemoryLLMService()
+        service.load_model("tinyllama-1.1b")
+
+        response = service.query(LLMQuery(question="Calculate the probability of two heads", context={}))
+
+        assert response.model_used == "phi-2"
+
+    def test_load_aware_selection(self):
+        """Busy models lose to equally capable idle ones"""
+        service = InMemoryLLMService()
+        service.load_model("phi-2")
+        service.load_model("tinyllama-1.1b")
+        service.loaded_models["tinyllama-1.1b"].active_requests = 10
+
+        model = service._select_model(LLMQuery(question="What is the capital of France?", context={}))
+
+        assert model.name == "phi-2"
+
+    def test_prewarm_from_query_mix(self):
+        """Pre-warming loads a model covering the most common recent capability"""
+        service = InMemoryLLMService(prewarm_interval=0)
+        service.recent_capabilities.extend([["technical_writing"]] * 3)
+
+        warmed = service.prewarm()
+
+        assert warmed == ["mistral-7b-instruct"]
+        assert service.get_stats()["prewarmed"] == 1
+        assert service.get_stats()["cold_loads"] == 1
@@ -23,14 +23,14 @@ NUSY_ROOT = Path("/opt/nusy")
 WORKSPACE_ROOT = NUSY_ROOT / "workspace"
 MODEL_REGISTRY = NUSY_ROOT / "models" / "model_registry.json"
 
-# Logging setup
+# Logging setup (file log only where the DGX log directory exists)
+_log_handlers: List[logging.Handler] = [logging.StreamHandler()]
+if (NUSY_ROOT / "logs").is_dir():
+    _log_handlers.insert(0, logging.FileHandler(NUSY_ROOT / "logs" / "multi_agent.log"))
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(NUSY_ROOT / "logs" / "multi_agent.log"),
-        logging.StreamHandler()
-    ]
+    handlers=_log_handlers
 )
 logger = logging.getLogger("manolin-cluster")
 
@@ -61,6 +61,7 @@ class AgentMessage(BaseModel):
     session_id: str
     timestamp: datetime = Field(default_factory=datetime.now)
     message_type: str  # "request", "response", "notification", "error"
+    correlation_id: Optional[str] = None  # Id of the request this message responds to
     payload: Dict[str, Any]
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
@@ -84,30 +85,75 @@ class AgentSession:
         """Check if session has been inactive too long"""
         return (datetime.now() - self.last_activity).seconds > timeout_seconds
 
+@dataclass
+class PendingInference:
+    """An inference request waiting in the shared runtime queue"""
+    request: Dict[str, Any]
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def batch_key(self) -> str:
+        """Requests can share a batch only if their sampling parameters match"""
+        return json.dumps(self.request.get("parameters", {}), sort_keys=True, default=str)
+
 class SharedModelRuntime:
-    """Manages shared Mistral-7B-Instruct instance for all agents"""
+    """Manages shared Mistral-7B-Instruct instance for all agents
+
+    Concurrent prompts are coalesced into micro-batches: the scheduler waits
+    up to ``max_wait_ms`` for up to ``max_batch_size`` requests, then sends them
+    to the model in one call. Each caller awaits its own future.
+    """
 
     def __init__(self, model_config: Dict[str, Any]):
         self.model_config = model_config
         self.loaded_model = None
-        self.request_queue = asyncio.Queue()
-        self.response_queues: Dict[str, asyncio.Queue] = {}
+        self.request_queue: asyncio.Queue = asyncio.Queue()
         self.is_running = False
         self.concurrency_limit = model_config.get("max_concurrent_requests", 10)
-        self.semaphore = asyncio.Semaphore(self.concurrency_limit)
+        self.semaphore = asyncio.Semaphore(self.concurrency_limit)  # Batches in flight
+
+        # Micro-batching configuration
+        self.max_batch_size = model_config.get("max_batch_size", 8)
+        self.max_wait_ms = model_config.get("max_wait_ms", 10)
+
+        # OpenAI-compatible backend (e.g. vLLM); simulated inference when unset
+        self.base_url = model_config.get("base_url")
+        self._client = None
+
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self._batch_tasks: set = set()
+
+        self.metrics = {
+            "requests_submitted": 0,
+            "requests_completed": 0,
+            "requests_failed": 0,
+            "batches_run": 0,
+            "batched_requests": 0,
+            "total_queue_wait_ms": 0.0,
+            "total_batch_latency_ms": 0.0
+        }
 
     async def start(self):
         """Initialize and start the shared model runtime"""
         logger.info("Starting shared model runtime...")
 
-        # Load model configuration
-        with open(MODEL_REGISTRY) as f:
-            registry = json.load(f)
+        model_path = self.model_config.get("model_path")
+        if model_path is None:
+            # Load model configuration
+            with open(MODEL_REGISTRY) as f:
+                registry = json.load(f)
+
+            model_path = registry["models"][self.model_config["model_name"]]["path"]
 
-        model_path = registry["models"][self.model_config["model_name"]]["path"]
+        if self.base_url:
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(
+                base_url=self.base_url,
+                api_key=self.model_config.get("api_key", os.getenv("VLLM_API_KEY", "EMPTY"))
+            )
 
-        # Initialize vLLM or Transformers runtime
-        # This would integrate with actual inference engine
         self.loaded_model = {
             "path": model_path,
             "config": self.model_config,
@@ -115,50 +161,166 @@ class SharedModelRuntime:
         }
 
         self.is_running = True
-        logger.info(f"Shared model runtime started with {self.concurrency_limit} concurrent slots")
+        self._scheduler_task = asyncio.create_task(self.inference_worker())
+        logger.info(
+            f"Shared model runtime started with {self.concurrency_limit} concurrent batch slots "
+            f"(max batch {self.max_batch_size}, max wait {self.max_wait_ms} ms)"
+        )
 
-    async def process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """Process an inference request"""
-        async with self.semaphore:
-            session_id = request.get("session_id", "unknown")
+    async def stop(self):
+        """Stop the scheduler and fail any requests still waiting"""
+        self.is_running = False
+        if self._scheduler_task:
+            self._scheduler_task.cancel()
+            try:
+                await self._scheduler_task
+            except asyncio.CancelledError:
+                pass
+            self._scheduler_task = None
 
-            logger.debug(f"Processing request for session {session_id}")
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
 
-            # Simulate inference (replace with actual vLLM/Transformers call)
-            await asyncio.sleep(0.1)  # Simulated processing time
+        while not self.request_queue.empty():
+            pending = self.request_queue.get_nowait()
+            if not pending.future.done():
+                pending.future.set_exception(RuntimeError("Model runtime stopped"))
 
-            response = {
-                "session_id": session_id,
-                "result": f"Processed: {request.get('prompt', '')[:50]}...",
-                "timestamp": datetime.now().isoformat(),
-                "model": self.model_config["model_name"]
-            }
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
 
-            return response
+    async def submit(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue an inference request and wait for its result"""
+        if not self.is_running:
+            raise RuntimeError("Model runtime is not running")
+
+        pending = PendingInference(request=request, future=asyncio.get_running_loop().create_future())
+        self.metrics["requests_submitted"] += 1
+        await self.request_queue.put(pending)
+        return await pending.future
+
+    async def process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Process an inference request"""
+        return await self.submit(request)
 
     async def inference_worker(self):
-        """Background worker for processing inference requests"""
+        """Background scheduler that coalesces queued requests into batches"""
         while self.is_running:
             try:
-                request = await self.request_queue.get()
-
-                # Create response queue if needed
-                session_id = request.get("session_id")
-                if session_id not in self.response_queues:
-                    self.response_queues[session_id] = asyncio.Queue()
-
-                # Process request
-                response = await self.process_request(request)
+                batch = await self._collect_batch()
 
-                # Send response
-                await self.response_queues[session_id].put(response)
+                # Only requests with identical sampling parameters share a model call
+                groups: Dict[str, List[PendingInference]] = {}
+                for pending in batch:
+                    groups.setdefault(pending.batch_key, []).append(pending)
 
-                self.request_queue.task_done()
+                for group in groups.values():
+                    await self.semaphore.acquire()
+                    task = asyncio.create_task(self._run_batch(group))
+                    self._batch_tasks.add(task)
+                    task.add_done_callback(self._batch_tasks.discard)
 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"Inference worker error: {e}")
                 await asyncio.sleep(1)
 
+    async def _collect_batch(self) -> List[PendingInference]:
+        """Wait for one request, then gather more until the batch is full or max wait passes"""
+        batch = [await self.request_queue.get()]
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+
+        try:
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.request_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+        except asyncio.CancelledError:
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(RuntimeError("Model runtime stopped"))
+            raise
+
+        return batch
+
+    async def _run_batch(self, batch: List[PendingInference]):
+        """Run one batch through the model and resolve each caller's future"""
+        started = time.monotonic()
+        try:
+            for pending in batch:
+                self.metrics["total_queue_wait_ms"] += (started - pending.enqueued_at) * 1000
+
+            try:
+                results = await self._infer_batch([pending.request for pending in batch])
+            except Exception as e:
+                logger.error(f"Batch inference failed for {len(batch)} request(s): {e}")
+                self.metrics["requests_failed"] += len(batch)
+                for pending in batch:
+                    if not pending.future.done():
+                        pending.future.set_exception(e)
+                return
+
+            for pending, result in zip(batch, results):
+                if not pending.future.done():
+                    pending.future.set_result(result)
+            self.metrics["requests_completed"] += len(batch)
+        finally:
+            self.metrics["batches_run"] += 1
+            self.metrics["batched_requests"] += len(batch)
+            self.metrics["total_batch_latency_ms"] += (time.monotonic() - started) * 1000
+            self.semaphore.release()
+
+    async def _infer_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run a batch of prompts in a single model call"""
+        timestamp = datetime.now().isoformat()
+
+        if self._client is None:
+            # Simulate inference (one model pass for the whole batch)
+            await asyncio.sleep(0.1)
+            texts = [f"Processed: {request.get('prompt', '')[:50]}..." for request in requests]
+        else:
+            parameters = requests[0].get("parameters", {})
+            response = await self._client.completions.create(
+                model=self.model_config["model_name"],
+                prompt=[request.get("prompt", "") for request in requests],
+                max_tokens=parameters.get("max_tokens", self.model_config.get("max_tokens", 2048)),
+                temperature=parameters.get("temperature", 0.7)
+            )
+            texts = [""] * len(requests)
+            for choice in response.choices:
+                texts[choice.index] = choice.text
+
+        return [
+            {
+                "session_id": request.get("session_id", "unknown"),
+                "result": text,
+                "timestamp": timestamp,
+                "model": self.model_config["model_name"],
+                "batch_size": len(requests)
+            }
+            for request, text in zip(requests, texts)
+        ]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth and batching efficiency"""
+        batches = self.metrics["batches_run"]
+        batched = self.metrics["batched_requests"]
+        return {
+            **self.metrics,
+            "queue_depth": self.request_queue.qsize(),
+            "batches_in_flight": len(self._batch_tasks),
+            "avg_batch_size": batched / batches if batches else 0.0,
+            "avg_batch_fill": batched / (batches * self.max_batch_size) if batches else 0.0,
+            "avg_queue_wait_ms": self.metrics["total_queue_wait_ms"] / batched if batched else 0.0,
+            "avg_batch_latency_ms": self.metrics["total_batch_latency_ms"] / batches if batches else 0.0
+        }
+
 class SantiagoAgent:
     """Base class for specialized Santiago agents"""
 
@@ -259,15 +421,9 @@ class SantiagoAgent:
             "context": session.context
         }
 
-        # Queue request and wait for response
-        await self.model_runtime.request_queue.put(request)
-
-        # Wait for response (with timeout)
+        # Queue request and wait for response (with timeout)
         try:
-            response = await asyncio.wait_for(
-                self.model_runtime.response_queues[session.session_id].get(),
-                timeout=30.0
-            )
+            response = await asyncio.wait_for(self.model_runtime.submit(request), timeout=30.0)
         except asyncio.TimeoutError:
             raise Exception("Inference request timed out")
 
@@ -367,24 +523,41 @@ class SantiagoAgent:
 class ManolinCluster:
     """Manages the entire multi-agent cluster"""
 
-    def __init__(self):
+    def __init__(self, inbox_size: int = 100, per_agent_concurrency: int = 4,
+                 default_timeout: float = 30.0):
         self.model_runtime = SharedModelRuntime({
             "model_name": "mistral-7b-instruct-4bit",
             "max_concurrent_requests": 10,
-            "max_tokens": 2048
+            "max_tokens": 2048,
+            "max_batch_size": 8,
+            "max_wait_ms": 10,
+            "base_url": os.getenv("VLLM_BASE_URL")
         })
 
         self.agents: Dict[str, SantiagoAgent] = {}
         self.message_bus = asyncio.Queue()
         self.is_running = False
 
+        # RPC layer: per-agent bounded inboxes, each drained by its own worker,
+        # and futures for outstanding requests keyed by message id
+        self.inbox_size = inbox_size
+        self.per_agent_concurrency = per_agent_concurrency
+        self.default_timeout = default_timeout
+        self.agent_inboxes: Dict[str, asyncio.Queue] = {}
+        self.pending_responses: Dict[str, asyncio.Future] = {}
+        self._tasks: List[asyncio.Task] = []
+
         # Performance monitoring
         self.metrics = {
             "total_requests": 0,
             "active_sessions": 0,
             "average_latency": 0.0,
-            "error_rate": 0.0
+            "error_rate": 0.0,
+            "timeouts": 0,
+            "rejected_messages": 0,
+            "broadcast_dropped": 0
         }
+        self._errors = 0
 
     async def start(self):
         """Start the entire cluster"""
@@ -393,13 +566,14 @@ class ManolinCluster:
         # Start shared model runtime
         await self.model_runtime.start()
 
+        self.is_running = True
+
         # Start message routing
-        asyncio.create_task(self._message_router())
+        self._tasks.append(asyncio.create_task(self._message_router()))
 
         # Start metrics collection
-        asyncio.create_task(self._metrics_collector())
+        self._tasks.append(asyncio.create_task(self._metrics_collector()))
 
-        self.is_running = True
         logger.info("Manolin Cluster started successfully")
 
     async def create_agent(self, role: AgentRole, agent_id: Optional[str] = None) -> str:
@@ -411,43 +585,137 @@ class ManolinCluster:
         await agent.start()
 
         self.agents[agent_id] = agent
+        self.agent_inboxes[agent_id] = asyncio.Queue(maxsize=self.inbox_size)
+        self._tasks.append(asyncio.create_task(self._agent_worker(agent_id)))
         logger.info(f"Created agent {agent_id} with role {role.value}")
 
         return agent_id
 
-    async def send_message(self, message: AgentMessage) -> Optional[AgentMessage]:
-        """Send a message to an agent"""
+    async def send_message(self, message: AgentMessage, timeout: Optional[float] = None) -> Optional[AgentMessage]:
+        """Send a message to an agent and wait for its response
+
+        Direct messages return the agent's response (matched by correlation id),
+        or None if the agent does not answer within the timeout. Broadcasts
+        return None once the message is queued for routing.
+        """
+        if message.to_agent is None:
+            await self.message_bus.put(message)
+            return None
+
+        if message.to_agent not in self.agents:
+            return self._error_response(message, f"Unknown agent {message.to_agent}")
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending_responses[message.id] = future
+        started = time.monotonic()
+
         await self.message_bus.put(message)
 
-        # Wait for response (this is simplified - in practice would use correlation IDs)
-        await asyncio.sleep(0.1)  # Allow routing to happen
+        try:
+            response = await asyncio.wait_for(future, timeout or self.default_timeout)
+        except asyncio.TimeoutError:
+            self.metrics["timeouts"] += 1
+            self._errors += 1
+            logger.warning(f"No response from {message.to_agent} for message {message.id}")
+            response = None
+        finally:
+            self.pending_responses.pop(message.id, None)
+
+        self._record_request(time.monotonic() - started, response)
+        return response
+
+    def _record_request(self, latency: float, response: Optional[AgentMessage]):
+        """Update request latency and error metrics"""
+        self.metrics["total_requests"] += 1
+        if response is not None and response.message_type == "error":
+            self._errors += 1
+
+        count = self.metrics["total_requests"]
+        self.metrics["average_latency"] += (latency - self.metrics["average_latency"]) / count
+        self.metrics["error_rate"] = self._errors / count
+
+    def _error_response(self, message: AgentMessage, error: str) -> AgentMessage:
+        """Build an error reply to a message"""
+        return AgentMessage(
+            from_agent="manolin-cluster",
+            to_agent=message.from_agent,
+            session_id=message.session_id,
+            message_type="error",
+            correlation_id=message.id,
+            payload={"error": error}
+        )
 
-        return None  # Response handling would be more sophisticated
+    def _resolve(self, message: AgentMessage, response: Optional[AgentMessage]):
+        """Complete the caller's future for a request, if anyone is waiting"""
+        future = self.pending_responses.get(message.id)
+        if future is not None and not future.done():
+            future.set_result(response)
 
     async def _message_router(self):
-        """Route messages between agents"""
+        """Route messages into agent inboxes without waiting on the agents"""
         while self.is_running:
             try:
                 message = await self.message_bus.get()
 
                 if message.to_agent:
                     # Direct message
-                    if message.to_agent in self.agents:
-                        response = await self.agents[message.to_agent].process_message(message)
-                        if response:
-                            # Handle response (could put back on bus or return to sender)
-                            pass
+                    inbox = self.agent_inboxes.get(message.to_agent)
+                    if inbox is None:
+                        self._resolve(message, self._error_response(message, f"Unknown agent {message.to_agent}"))
+                    else:
+                        try:
+                            inbox.put_nowait(message)
+                        except asyncio.QueueFull:
+                            self.metrics["rejected_messages"] += 1
+                            self._resolve(message, self._error_response(message, f"Agent {message.to_agent} is overloaded"))
                 else:
-                    # Broadcast message
-                    for agent in self.agents.values():
-                        asyncio.create_task(agent.process_message(message))
+                    # Broadcast message, bounded by each agent's inbox
+                    for agent_id, inbox in self.agent_inboxes.items():
+                        if agent_id == message.from_agent:
+                            continue
+                        try:
+                            inbox.put_nowait(message)
+                        except asyncio.QueueFull:
+                            self.metrics["broadcast_dropped"] += 1
 
                 self.message_bus.task_done()
 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"Message routing error: {e}")
                 await asyncio.sleep(1)
 
+    async def _agent_worker(self, agent_id: str):
+        """Drain one agent's inbox, handling up to per_agent_concurrency messages at once"""
+        inbox = self.agent_inboxes[agent_id]
+        slots = asyncio.Semaphore(self.per_agent_concurrency)
+        in_flight: set = set()
+
+        async def handle(message: AgentMessage):
+            try:
+                response = await self.agents[agent_id].process_message(message)
+                if response is not None:
+                    response.correlation_id = message.id
+                self._resolve(message, response)
+            except Exception as e:
+                logger.error(f"Agent {agent_id} failed on message {message.id}: {e}")
+                self._resolve(message, self._error_response(message, str(e)))
+            finally:
+                inbox.task_done()
+                slots.release()
+
+        try:
+            while self.is_running:
+                message = await inbox.get()
+                await slots.acquire()
+                task = asyncio.create_task(handle(message))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+        finally:
+            for task in in_flight:
+                task.cancel()
+
     async def _metrics_collector(self):
         """Collect and update cluster metrics"""
         while self.is_running:
@@ -466,6 +734,7 @@ class ManolinCluster:
             "agent_count": len(self.agents),
             "agents": {aid: agent.role.value for aid, agent in self.agents.items()},
             "model_runtime_status": "running" if self.model_runtime.is_running else "stopped",
+            "model_runtime_metrics": self.model_runtime.get_metrics(),
             "metrics": self.metrics
         }
 
@@ -475,12 +744,21 @@ class ManolinCluster:
 
         self.is_running = False
 
+        # Stop routing and agent workers, failing anyone still waiting
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        for future in self.pending_responses.values():
+            if not future.done():
+                future.set_result(None)
+
         # Stop all agents
         for agent in self.agents.values():
             await agent.stop()
 
         # Stop model runtime
-        self.model_runtime.is_running = False
+        await self.model_runtime.stop()
 
         logger.info("Manolin Cluster stopped")
 
@@ -0,0 +1,220 @@
+"""
+Tests for the Manolin Cluster shared model runtime
+==================================================
+
+Runs the micro-batching scheduler against simulated inference and against a
+local fake OpenAI-compatible completions server.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+sys.path.append(os.path.dirname(__file__))
+
+from manolin_cluster import AgentMessage, AgentRole, ManolinCluster, SharedModelRuntime
+
+
+def runtime_config(**overrides):
+    config = {
+        "model_name": "mistral-7b-instruct-4bit",
+        "model_path": "/tmp/mistral",
+        "max_concurrent_requests": 4,
+        "max_batch_size": 4,
+        "max_wait_ms": 20,
+    }
+    config.update(overrides)
+    return config
+
+
+@pytest_asyncio.fixture
+async def fake_openai_server():
+    """Fake OpenAI-compatible /v1/completions endpoint that records batch sizes"""
+    batch_sizes = []
+
+    async def completions(request):
+        body = await request.json()
+        prompts = body["prompt"]
+        batch_sizes.append(len(prompts))
+        return web.json_response({
+            "id": "cmpl-test",
+            "object": "text_completion",
+            "created": 0,
+            "model": body["model"],
+            "choices": [
+                {"index": i, "text": f"echo: {prompt}", "finish_reason": "stop", "logprobs": None}
+                for i, prompt in enumerate(prompts)
+            ],
+        })
+
+    app = web.Application()
+    app.router.add_post("/v1/completions", completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}/v1", batch_sizes
+
+    await runner.cleanup()
+
+
+class TestSharedModelRuntimeBatching:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_batch(self):
+        """Concurrent prompts are coalesced into one batch"""
+        runtime = SharedModelRuntime(runtime_config())
+        await runtime.start()
+        try:
+            results = await asyncio.gather(*(
+                runtime.submit({"session_id": f"s{i}", "prompt": f"prompt {i}"}) for i in range(4)
+            ))
+        finally:
+            await runtime.stop()
+
+        assert [r["session_id"] for r in results] == ["s0", "s1", "s2", "s3"]
+        assert all(r["batch_size"] == 4 for r in results)
+        metrics = runtime.get_metrics()
+        assert metrics["batches_run"] == 1
+        assert metrics["avg_batch_fill"] == 1.0
+        assert metrics["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_parameters_not_batched_together(self):
+        """Requests with different sampling parameters get separate model calls"""
+        runtime = SharedModelRuntime(runtime_config())
+        await runtime.start()
+        try:
+            results = await asyncio.gather(
+                runtime.submit({"prompt": "a", "parameters": {"temperature": 0.1}}),
+                runtime.submit({"prompt": "b", "parameters": {"temperature": 0.9}}),
+            )
+        finally:
+            await runtime.stop()
+
+        assert [r["batch_size"] for r in results] == [1, 1]
+        assert runtime.get_metrics()["batches_run"] == 2
+
+    @pytest.mark.asyncio
+    async def test_openai_compatible_backend(self, fake_openai_server):
+        """Batches are sent as a single completions call with a prompt list"""
+        base_url, batch_sizes = fake_openai_server
+        runtime = SharedModelRuntime(runtime_config(base_url=base_url, api_key="test"))
+        await runtime.start()
+        try:
+            results = await asyncio.gather(*(
+                runtime.submit({"session_id": f"s{i}", "prompt": f"p{i}"}) for i in range(6)
+            ))
+        finally:
+            await runtime.stop()
+
+        assert [r["result"] for r in results] == [f"echo: p{i}" for i in range(6)]
+        assert sorted(batch_sizes) == [2, 4]
+
+    @pytest.mark.asyncio
+    async def test_backend_error_fails_waiters(self):
+        """A failed batch raises for every request in it"""
+        runtime = SharedModelRuntime(runtime_config(base_url="http://127.0.0.1:9/v1", api_key="test"))
+        await runtime.start()
+        runtime._client = runtime._client.with_options(max_retries=0, timeout=2)
+        try:
+            with pytest.raises(Exception):
+                await runtime.submit({"prompt": "unreachable"})
+        finally:
+            await runtime.stop()
+
+        assert runtime.get_metrics()["requests_failed"] == 1
+
+
+@pytest_asyncio.fixture
+async def cluster():
+    """Cluster with simulated inference and two agents"""
+    cluster = ManolinCluster(default_timeout=5.0)
+    cluster.model_runtime.model_config["model_path"] = "/tmp/mistral"
+    cluster.model_runtime.base_url = None
+    await cluster.start()
+    await cluster.create_agent(AgentRole.PRODUCT_MANAGER)
+    await cluster.create_agent(AgentRole.DEVELOPER)
+    yield cluster
+    await cluster.stop()
+
+
+class TestManolinClusterMessaging:
+
+    @pytest.mark.asyncio
+    async def test_send_message_returns_correlated_response(self, cluster):
+        """Direct messages resolve with the agent's response"""
+        session_id = await cluster.agents["pm_1"].create_session()
+        message = AgentMessage(
+            from_agent="test_client",
+            to_agent="pm_1",
+            session_id=session_id,
+            message_type="inference_request",
+            payload={"prompt": "What are the key steps for DGX setup?"}
+        )
+
+        response = await cluster.send_message(message)
+
+        assert response is not None
+        assert response.message_type == "inference_response"
+        assert response.correlation_id == message.id
+        assert cluster.metrics["total_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_agent_does_not_block_others(self, cluster):
+        """A busy agent does not hold up routing to other agents"""
+        release = asyncio.Event()
+
+        async def slow_process(message):
+            await release.wait()
+            return None
+
+        cluster.agents["pm_1"].process_message = slow_process
+        dev_session = await cluster.agents["developer_1"].create_session()
+
+        slow = asyncio.create_task(cluster.send_message(AgentMessage(
+            from_agent="test_client", to_agent="pm_1", session_id="s",
+            message_type="notification", payload={}
+        )))
+        fast = await cluster.send_message(AgentMessage(
+            from_agent="test_client", to_agent="developer_1", session_id=dev_session,
+            message_type="notification", payload={"hello": True}
+        ))
+
+        assert fast.payload == {"received": {"hello": True}}
+        assert not slow.done()
+        release.set()
+        assert await slow is None
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_none(self, cluster):
+        """Requests the agent never answers time out"""
+        async def never(message):
+            await asyncio.sleep(60)
+
+        cluster.agents["pm_1"].process_message = never
+
+        response = await cluster.send_message(AgentMessage(
+            from_agent="test_client", to_agent="pm_1", session_id="s",
+            message_type="notification", payload={}
+        ), timeout=0.05)
+
+        assert response is None
+        assert cluster.metrics["timeouts"] == 1
+        assert cluster.pending_responses == {}
+
+    @pytest.mark.asyncio
+    async def test_unknown_agent(self, cluster):
+        """Messages to unknown agents get an error reply"""
+        response = await cluster.send_message(AgentMessage(
+            from_agent="test_client", to_agent="nobody", session_id="s",
+            message_type="notification", payload={}
+        ))
+
+        assert response.message_type == "error"
@@ -8,15 +8,19 @@ that delegate to external APIs (GPT-4, Claude, Copilot) before real Santiagos ex
 import asyncio
 import json
 import logging
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
 from santiago_core.core.agent_framework import SantiagoAgent, Message, Task
 from santiago_core.services.llm_router import LLMRouter, TaskComplexity
 from santiago_core.services.message_bus import get_message_bus, MessageBus
+from santiago_core.services.provenance_log import get_provenance_log_writer
+from santiago_core.services.rate_limiter import estimate_tokens, get_rate_limiter_registry
+from santiago_core.services.request_coalescer import get_request_coalescer, make_request_key
 
 
 class MCPTool(BaseModel):
@@ -83,15 +87,40 @@ class BaseProxyAgent(SantiagoAgent):
         self.call_count: int = 0
         self.calls_by_tool: Dict[str, int] = {}
         
-        # Set up logging directory
+        # Set up logging directory; entries are written in the background
         self.log_dir = workspace_path / config.log_dir
         self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.provenance_log = get_provenance_log_writer()
         
         # Initialize tool cost tracking
         self._tool_costs: Dict[str, float] = {}
         
+        # Stable per-tool prompt prefixes and prefix-cache usage
+        self._prompt_prefixes: Dict[str, str] = {}
+        self.prompt_cache_stats: Dict[str, int] = {
+            "calls": 0,
+            "cache_hits": 0,  # Calls with any cached prompt tokens
+            "prompt_tokens": 0,
+            "cached_tokens": 0,
+        }
+        
         # Initialize LLM router
         self.llm_router = LLMRouter()
+
+        # Identical concurrent upstream calls are shared across all proxies
+        self.request_coalescer = get_request_coalescer()
+        self.coalesced_calls: int = 0
+
+        # Per-provider/model rate limits are shared across all proxies
+        self.rate_limiter = get_rate_limiter_registry()
+        
+        # Hedged request and failover counters
+        self.hedge_stats: Dict[str, int] = {
+            "hedges_issued": 0,
+            "hedge_wins": 0,  # Backup answered first
+            "losers_cancelled": 0,
+            "failovers": 0,
+        }
         
         # Initialize message bus connection (lazy - connect on first use)
         self.message_bus: Optional[MessageBus] = None
@@ -108,6 +137,68 @@ class BaseProxyAgent(SantiagoAgent):
         4. Logs operation for provenance
         5. Tracks costs and metrics
         """
+        estimated_cost = self._check_invocation(tool_name)
+        
+        # Route to external API
+        try:
+            result = await self._route_to_external_api(tool_name, params)
+            
+            # Track metrics
+            self.budget_spent += estimated_cost
+            self.call_count += 1
+            self.calls_by_tool[tool_name] = self.calls_by_tool.get(tool_name, 0) + 1
+            
+            # Log for provenance
+            await self._log_tool_call(tool_name, params, result, estimated_cost)
+            
+            return result
+            
+        except Exception as e:
+            self.logger.error(f"Error invoking tool {tool_name}: {e}")
+            await self._log_error(tool_name, params, str(e))
+            raise
+
+    async def invoke_tool_stream(self, tool_name: str, params: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Invoke a tool through the proxy, streaming the response.
+        
+        Yields {"type": "delta", "content": ...} events as text arrives, then
+        one {"type": "result", "result": ...} event with the parsed result.
+        Validation, budget, metrics and provenance logging match invoke_tool().
+        Streamed calls are not coalesced or hedged.
+        """
+        estimated_cost = self._check_invocation(tool_name)
+        chunks: List[str] = []
+        
+        try:
+            async for delta in self._stream_external_api(tool_name, params):
+                chunks.append(delta)
+                yield {"type": "delta", "content": delta}
+            
+            result = self._parse_content(tool_name, "".join(chunks))
+            
+            # Track metrics
+            self.budget_spent += estimated_cost
+            self.call_count += 1
+            self.calls_by_tool[tool_name] = self.calls_by_tool.get(tool_name, 0) + 1
+            
+            # Log for provenance
+            await self._log_tool_call(tool_name, params, result, estimated_cost)
+            
+        except Exception as e:
+            self.logger.error(f"Error streaming tool {tool_name}: {e}")
+            await self._log_error(tool_name, params, str(e))
+            raise
+        
+        yield {"type": "result", "result": result}
+
+    def _check_invocation(self, tool_name: str) -> float:
+        """
+        Validate a tool call against the manifest, budget and session.
+        
+        Returns:
+            Estimated cost of the call
+        """
         # Validate tool exists
         if not self._tool_exists(tool_name):
             raise ValueError(f"Tool '{tool_name}' not found in manifest")
@@ -129,24 +220,7 @@ class BaseProxyAgent(SantiagoAgent):
                 f"Session expired. Started at {self.session_start}, TTL {self.config.session_ttl_hours}h"
             )
         
-        # Route to external API
-        try:
-            result = await self._route_to_external_api(tool_name, params)
-            
-            # Track metrics
-            self.budget_spent += estimated_cost
-            self.call_count += 1
-            self.calls_by_tool[tool_name] = self.calls_by_tool.get(tool_name, 0) + 1
-            
-            # Log for provenance
-            await self._log_tool_call(tool_name, params, result, estimated_cost)
-            
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Error invoking tool {tool_name}: {e}")
-            await self._log_error(tool_name, params, str(e))
-            raise
+        return estimated_cost
 
     async def _route_to_external_api(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -155,20 +229,116 @@ class BaseProxyAgent(SantiagoAgent):
         Determines task complexity and routes to appropriate provider/model.
         Subclasses can override for custom routing logic.
         """
-        # Import here to avoid circular dependency
-        from santiago_core.services.llm_router import LLMProvider
-        
         # Determine task complexity
         complexity = self.llm_router.get_task_complexity(tool_name)
         
         # Get LLM configuration
         llm_config = self.llm_router.get_config(self.config.role_name, complexity)
         
-        # Make API call based on provider
+        # Share the upstream call with identical in-flight requests
+        key = make_request_key(
+            llm_config.provider.value, llm_config.model, self.role_instructions, tool_name, params
+        )
+        if self.request_coalescer.is_in_flight(key):
+            self.coalesced_calls += 1
+        return await self.request_coalescer.run(
+            key, lambda: self._call_with_fallback(llm_config, complexity, tool_name, params)
+        )
+
+    async def _call_with_fallback(
+        self,
+        llm_config: Any,  # LLMConfig
+        complexity: TaskComplexity,
+        tool_name: str,
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Call the primary provider with hedging/failover per the complexity policy.
+        
+        Failover: if the primary fails, retry once on the alternate.
+        Hedging (opt-in): if the primary is slower than its p95-derived delay,
+        also call the alternate, take the first success and cancel the other.
+        """
+        policy = self.llm_router.get_hedge_policy(complexity)
+        backup_config = None
+        if policy.hedge or policy.failover:
+            backup_config = self.llm_router.get_fallback_config(self.config.role_name, complexity, llm_config)
+        
+        if backup_config is None:
+            return await self._call_provider_api(llm_config, tool_name, params)
+        
+        primary = asyncio.ensure_future(self._call_provider_api(llm_config, tool_name, params))
+        delay = self.llm_router.get_hedge_delay(llm_config, policy) if policy.hedge else None
+        
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        
+        if primary in done:
+            if not self._is_failed_call(primary):
+                return primary.result()
+            if not policy.failover:
+                return primary.result()
+            # Failover to the alternate
+            self.hedge_stats["failovers"] += 1
+            self.logger.warning(
+                f"{llm_config.provider.value}/{llm_config.model} failed for {tool_name}; "
+                f"failing over to {backup_config.provider.value}/{backup_config.model}"
+            )
+            return await self._call_provider_api(backup_config, tool_name, params)
+        
+        # Primary is slow: hedge
+        self.hedge_stats["hedges_issued"] += 1
+        self.logger.info(
+            f"Hedging {tool_name} after {delay:.1f}s with {backup_config.provider.value}/{backup_config.model}"
+        )
+        backup = asyncio.ensure_future(self._call_provider_api(backup_config, tool_name, params))
+        pending = {primary, backup}
+        last_finished = None
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    last_finished = task
+                    if not self._is_failed_call(task):
+                        if task is backup:
+                            self.hedge_stats["hedge_wins"] += 1
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+                self.hedge_stats["losers_cancelled"] += 1
+        
+        # Both failed: surface the last failure
+        return last_finished.result()
+
+    @staticmethod
+    def _is_failed_call(task: "asyncio.Future") -> bool:
+        """Whether a finished provider call raised or returned an error result"""
+        if task.cancelled() or task.exception() is not None:
+            return True
+        result = task.result()
+        return isinstance(result, dict) and "error" in result
+
+    async def _call_provider_api(
+        self,
+        llm_config: Any,  # LLMConfig
+        tool_name: str,
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Make the upstream API call for the configured provider"""
+        # Import here to avoid circular dependency
+        from santiago_core.services.llm_router import LLMProvider
+        
         if llm_config.provider == LLMProvider.XAI:
             return await self._call_xai_api(llm_config, tool_name, params)
         elif llm_config.provider == LLMProvider.OPENAI:
             return await self._call_openai_api(llm_config, tool_name, params)
+        elif llm_config.provider == LLMProvider.VLLM:
+            return await self._call_vllm_api(llm_config, tool_name, params)
         else:
             raise ValueError(f"Unknown provider: {llm_config.provider}")
     
@@ -184,6 +354,7 @@ class BaseProxyAgent(SantiagoAgent):
         xAI's API is OpenAI-compatible, so we use the OpenAI SDK
         with custom base_url and api_key.
         """
+        call = None
         try:
             from openai import AsyncOpenAI
             
@@ -197,36 +368,20 @@ class BaseProxyAgent(SantiagoAgent):
             prompt = self._build_prompt(tool_name, params)
             
             # Call Grok API
-            response = await client.chat.completions.create(
-                model=llm_config.model,
-                messages=[
-                    {"role": "system", "content": self.role_instructions or f"You are a {self.config.role_name}."},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=llm_config.temperature,
-                max_tokens=llm_config.max_tokens,
-            )
+            estimated_tokens = estimate_tokens(self._system_instructions() + prompt, llm_config.max_tokens)
+            async with self.rate_limiter.limit("xai", llm_config.model, estimated_tokens) as call:
+                response = await client.chat.completions.create(**self._build_xai_request(llm_config, prompt))
+                call.record_usage(response)
+            self._record_prompt_cache_usage(getattr(response, "usage", None))
             
             # Parse response
             content = response.choices[0].message.content
-            if not content:
-                return {
-                    "error": "Empty response from API",
-                    "tool": tool_name,
-                    "provider": "xai",
-                }
-            
-            # Try to parse as JSON, fallback to text
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                return {
-                    "tool": tool_name,
-                    "result": content,
-                    "raw_response": content,
-                }
+            self.llm_router.record_result(llm_config, call.latency, bool(content), call.actual_tokens)
+            return self._parse_content(tool_name, content, provider="xai")
                 
         except Exception as e:
+            if call is not None:
+                self.llm_router.record_result(llm_config, call.latency, False)
             self.logger.error(f"xAI API error: {e}")
             return {
                 "error": str(e),
@@ -245,6 +400,7 @@ class BaseProxyAgent(SantiagoAgent):
         
         Uses OpenAI SDK with GPT-4, GPT-4o, or o1-preview based on complexity.
         """
+        call = None
         try:
             from openai import AsyncOpenAI
             
@@ -258,69 +414,22 @@ class BaseProxyAgent(SantiagoAgent):
             prompt = self._build_prompt(tool_name, params)
             
             # Build request parameters based on model series
-            # o1/o3 series: Use max_completion_tokens, no system message, no temperature
-            # GPT-5 series: Use max_completion_tokens
-            # Other models: Use max_tokens
-            is_reasoning_model = llm_config.model.startswith(("o1", "o3"))
-            is_gpt5_series = llm_config.model.startswith("gpt-5")
-            
-            if is_reasoning_model:
-                # o1/o3: max_completion_tokens, no system, no temperature
-                request_params = {
-                    "model": llm_config.model,
-                    "messages": [
-                        {"role": "user", "content": f"{self.role_instructions or ''}\n\n{prompt}"},
-                    ],
-                }
-                if llm_config.max_tokens:
-                    request_params["max_completion_tokens"] = llm_config.max_tokens
-            elif is_gpt5_series:
-                # GPT-5: max_completion_tokens, system message allowed, temperature allowed
-                request_params = {
-                    "model": llm_config.model,
-                    "messages": [
-                        {"role": "system", "content": self.role_instructions or f"You are a {self.config.role_name}."},
-                        {"role": "user", "content": prompt},
-                    ],
-                    "temperature": llm_config.temperature,
-                }
-                if llm_config.max_tokens:
-                    request_params["max_completion_tokens"] = llm_config.max_tokens
-            else:
-                # GPT-4 and earlier: max_tokens
-                request_params = {
-                    "model": llm_config.model,
-                    "messages": [
-                        {"role": "system", "content": self.role_instructions or f"You are a {self.config.role_name}."},
-                        {"role": "user", "content": prompt},
-                    ],
-                    "temperature": llm_config.temperature,
-                }
-                if llm_config.max_tokens:
-                    request_params["max_tokens"] = llm_config.max_tokens
+            request_params = self._build_openai_request(llm_config, prompt)
             
-            response = await client.chat.completions.create(**request_params)
+            estimated_tokens = estimate_tokens(self._system_instructions() + prompt, llm_config.max_tokens)
+            async with self.rate_limiter.limit("openai", llm_config.model, estimated_tokens) as call:
+                response = await client.chat.completions.create(**request_params)
+                call.record_usage(response)
+            self._record_prompt_cache_usage(getattr(response, "usage", None))
             
             # Parse response
             content = response.choices[0].message.content
-            if not content:
-                return {
-                    "error": "Empty response from API",
-                    "tool": tool_name,
-                    "provider": "openai",
-                }
-            
-            # Try to parse as JSON, fallback to text
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                return {
-                    "tool": tool_name,
-                    "result": content,
-                    "raw_response": content,
-                }
+            self.llm_router.record_result(llm_config, call.latency, bool(content), call.actual_tokens)
+            return self._parse_content(tool_name, content, provider="openai")
                 
         except Exception as e:
+            if call is not None:
+                self.llm_router.record_result(llm_config, call.latency, False)
             self.logger.error(f"OpenAI API error: {e}")
             return {
                 "error": str(e),
@@ -328,10 +437,202 @@ class BaseProxyAgent(SantiagoAgent):
                 "provider": "openai",
             }
     
+    async def _call_vllm_api(
+        self,
+        llm_config: Any,  # LLMConfig
+        tool_name: str,
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Call the local vLLM server through VLLMClient.
+        
+        Used by the router for simple tasks when the local queue is short.
+        """
+        from santiago_core.services.vllm_client import VLLMClient
+        
+        client = VLLMClient(base_url=llm_config.api_base, model=llm_config.model, api_key=llm_config.api_key)
+        prompt = self._build_prompt(tool_name, params)
+        
+        start = time.monotonic()
+        response = await client.chat(
+            [
+                {"role": "system", "content": self._system_instructions()},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=llm_config.temperature,
+            max_tokens=llm_config.max_tokens,
+        )
+        content = response.get("content")
+        usage = getattr(response.get("raw_response"), "usage", None)
+        self._record_prompt_cache_usage(usage)
+        self.llm_router.record_result(
+            llm_config, time.monotonic() - start, bool(content), getattr(usage, "total_tokens", None)
+        )
+        
+        if "error" in response:
+            self.logger.error(f"vLLM API error: {response['error']}")
+            return {
+                "error": response["error"],
+                "tool": tool_name,
+                "provider": "vllm",
+            }
+        
+        return self._parse_content(tool_name, content, provider="vllm")
+    
+    async def _stream_external_api(self, tool_name: str, params: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream the response text for a tool call as it is generated.
+        
+        Proxies that override _route_to_external_api (e.g. mock proxies)
+        get their full result as a single chunk.
+        """
+        # Import here to avoid circular dependency
+        from santiago_core.services.llm_router import LLMProvider
+        
+        if type(self)._route_to_external_api is not BaseProxyAgent._route_to_external_api:
+            result = await self._route_to_external_api(tool_name, params)
+            yield json.dumps(result)
+            return
+        
+        complexity = self.llm_router.get_task_complexity(tool_name)
+        llm_config = self.llm_router.get_config(self.config.role_name, complexity)
+        prompt = self._build_prompt(tool_name, params)
+        start = time.monotonic()
+        
+        if llm_config.provider == LLMProvider.VLLM:
+            from santiago_core.services.vllm_client import VLLMClient
+            
+            client = VLLMClient(base_url=llm_config.api_base, model=llm_config.model, api_key=llm_config.api_key)
+            async for chunk in client.chat_stream(
+                self._build_xai_request(llm_config, prompt)["messages"],
+                temperature=llm_config.temperature,
+                max_tokens=llm_config.max_tokens,
+            ):
+                if "error" in chunk:
+                    self.llm_router.record_result(llm_config, time.monotonic() - start, False)
+                    raise RuntimeError(f"vLLM API error: {chunk['error']}")
+                if chunk.get("delta"):
+                    yield chunk["delta"]
+            self.llm_router.record_result(llm_config, time.monotonic() - start, True)
+            return
+        
+        from openai import AsyncOpenAI
+        
+        client = AsyncOpenAI(api_key=llm_config.api_key, base_url=llm_config.api_base)
+        if llm_config.provider == LLMProvider.XAI:
+            request_params = self._build_xai_request(llm_config, prompt)
+        else:
+            request_params = self._build_openai_request(llm_config, prompt)
+        request_params["stream"] = True
+        request_params["stream_options"] = {"include_usage": True}
+        
+        estimated_tokens = estimate_tokens(self._system_instructions() + prompt, llm_config.max_tokens)
+        call = None
+        try:
+            async with self.rate_limiter.limit(llm_config.provider.value, llm_config.model, estimated_tokens) as call:
+                stream = await client.chat.completions.create(**request_params)
+                async for chunk in stream:
+                    call.record_usage(chunk)  # Usage arrives on the final chunk
+                    if getattr(chunk, "usage", None) is not None:
+                        self._record_prompt_cache_usage(chunk.usage)
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        yield delta
+        except Exception:
+            if call is not None:
+                self.llm_router.record_result(llm_config, call.latency, False)
+            raise
+        self.llm_router.record_result(llm_config, call.latency, True, call.actual_tokens)
+    
+    def _build_xai_request(self, llm_config: Any, prompt: str) -> Dict[str, Any]:
+        """Build chat completion parameters for xAI (and other OpenAI-compatible servers)"""
+        return {
+            "model": llm_config.model,
+            "messages": [
+                {"role": "system", "content": self._system_instructions()},
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": llm_config.temperature,
+            "max_tokens": llm_config.max_tokens,
+        }
+    
+    def _build_openai_request(self, llm_config: Any, prompt: str) -> Dict[str, Any]:
+        """
+        Build chat completion parameters for OpenAI based on model series.
+        
+        o1/o3 series: Use max_completion_tokens, no system message, no temperature
+        GPT-5 series: Use max_completion_tokens
+        Other models: Use max_tokens
+        """
+        is_reasoning_model = llm_config.model.startswith(("o1", "o3"))
+        is_gpt5_series = llm_config.model.startswith("gpt-5")
+        
+        if is_reasoning_model:
+            # o1/o3: max_completion_tokens, no system, no temperature
+            request_params = {
+                "model": llm_config.model,
+                "messages": [
+                    {"role": "user", "content": f"{self._system_instructions()}\n\n{prompt}"},
+                ],
+            }
+            if llm_config.max_tokens:
+                request_params["max_completion_tokens"] = llm_config.max_tokens
+        elif is_gpt5_series:
+            # GPT-5: max_completion_tokens, system message allowed, temperature allowed
+            request_params = {
+                "model": llm_config.model,
+                "messages": [
+                    {"role": "system", "content": self._system_instructions()},
+                    {"role": "user", "content": prompt},
+                ],
+                "temperature": llm_config.temperature,
+            }
+            if llm_config.max_tokens:
+                request_params["max_completion_tokens"] = llm_config.max_tokens
+        else:
+            # GPT-4 and earlier: max_tokens
+            request_params = {
+                "model": llm_config.model,
+                "messages": [
+                    {"role": "system", "content": self._system_instructions()},
+                    {"role": "user", "content": prompt},
+                ],
+                "temperature": llm_config.temperature,
+            }
+            if llm_config.max_tokens:
+                request_params["max_tokens"] = llm_config.max_tokens
+        
+        return request_params
+    
+    def _parse_content(self, tool_name: str, content: Optional[str], provider: Optional[str] = None) -> Dict[str, Any]:
+        """Parse response text as JSON, falling back to a text result"""
+        if not content:
+            error = {
+                "error": "Empty response from API",
+                "tool": tool_name,
+            }
+            if provider:
+                self.logger.error(f"{provider} API error: {error['error']}")
+                error["provider"] = provider
+            return error
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError:
+            return {
+                "tool": tool_name,
+                "result": content,
+                "raw_response": content,
+            }
+    
     def _build_prompt(self, tool_name: str, params: Dict[str, Any]) -> str:
         """
         Build prompt for LLM from tool name and parameters.
         
+        Everything before the parameters is byte-identical for every call to
+        the same tool, so together with the role instructions it forms a
+        stable prefix that vLLM prefix caching and provider prompt caching
+        can reuse. Parameters come last as compact canonical JSON.
+        
         Args:
             tool_name: Name of the tool being invoked
             params: Tool parameters
@@ -339,6 +640,19 @@ class BaseProxyAgent(SantiagoAgent):
         Returns:
             Formatted prompt string
         """
+        return self._get_prompt_prefix(tool_name) + json.dumps(
+            params, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+        )
+
+    def _system_instructions(self) -> str:
+        """Role instructions, identical across model families so they cache as one prefix"""
+        return self.role_instructions or f"You are a {self.config.role_name}."
+
+    def _get_prompt_prefix(self, tool_name: str) -> str:
+        """Stable prompt prefix (tool description and schema) for a tool, built once"""
+        if tool_name in self._prompt_prefixes:
+            return self._prompt_prefixes[tool_name]
+        
         # Find tool in manifest
         all_tools = (
             self.manifest.input_tools +
@@ -348,22 +662,41 @@ class BaseProxyAgent(SantiagoAgent):
         tool_def = next((t for t in all_tools if t.name == tool_name), None)
         
         if not tool_def:
-            return f"Execute tool: {tool_name}\nParameters: {json.dumps(params, indent=2)}"
-        
-        # Build structured prompt
-        prompt_parts = [
-            f"Execute the following tool:",
-            f"",
-            f"Tool: {tool_name}",
-            f"Description: {tool_def.description}",
-            f"",
-            f"Parameters:",
-            json.dumps(params, indent=2),
-            f"",
-            f"Please provide a structured JSON response following this tool's expected output format.",
-        ]
-        
-        return "\n".join(prompt_parts)
+            prefix = f"Execute tool: {tool_name}\nParameters: "
+        else:
+            # Build structured prompt
+            prefix_parts = [
+                f"Execute the following tool:",
+                f"",
+                f"Tool: {tool_name}",
+                f"Description: {tool_def.description}",
+                f"Parameter schema: {json.dumps(tool_def.parameters, sort_keys=True, separators=(',', ':'))}",
+                f"",
+                f"Please provide a structured JSON response following this tool's expected output format.",
+                f"",
+                f"Parameters:",
+                f"",
+            ]
+            prefix = "\n".join(prefix_parts)
+        
+        self._prompt_prefixes[tool_name] = prefix
+        return prefix
+
+    def _record_prompt_cache_usage(self, usage: Any) -> None:
+        """Track prompt tokens served from the provider/vLLM prefix cache"""
+        prompt_tokens = getattr(usage, "prompt_tokens", None)
+        if not isinstance(prompt_tokens, int):
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None) if details is not None else None
+        if not isinstance(cached_tokens, int):
+            cached_tokens = 0
+        
+        self.prompt_cache_stats["calls"] += 1
+        self.prompt_cache_stats["prompt_tokens"] += prompt_tokens
+        self.prompt_cache_stats["cached_tokens"] += cached_tokens
+        if cached_tokens:
+            self.prompt_cache_stats["cache_hits"] += 1
 
     def _tool_exists(self, tool_name: str) -> bool:
         """Check if tool exists in manifest"""
@@ -415,10 +748,9 @@ class BaseProxyAgent(SantiagoAgent):
             "session_start": self.session_start.isoformat(),
         }
         
-        # Write to jsonl log file
+        # Queue for the jsonl log file
         log_file = self.log_dir / f"{self.name}_{datetime.now().strftime('%Y%m%d')}.jsonl"
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        self.provenance_log.write(log_file, log_entry)
 
     async def _log_error(self, tool_name: str, params: Dict[str, Any], error: str) -> None:
         """Log error for provenance"""
@@ -432,8 +764,12 @@ class BaseProxyAgent(SantiagoAgent):
         }
         
         log_file = self.log_dir / f"{self.name}_errors_{datetime.now().strftime('%Y%m%d')}.jsonl"
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        self.provenance_log.write(log_file, log_entry)
+
+    async def flush_provenance_log(self, timeout: Optional[float] = None) -> bool:
+        """Wait (off the event loop) until queued provenance entries are on disk"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.provenance_log.flush, timeout)
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get proxy metrics"""
@@ -443,6 +779,19 @@ class BaseProxyAgent(SantiagoAgent):
             "total_calls": self.call_count,
             "calls_by_tool": self.calls_by_tool,
             "budget_spent": self.budget_spent,
+            "coalesced_calls": self.coalesced_calls,
+            "coalescing": self.request_coalescer.get_metrics(),
+            "rate_limits": self.rate_limiter.get_metrics(),
+            "routing": self.llm_router.stats.snapshot(),
+            "hedging": dict(self.hedge_stats),
+            "provenance_log": self.provenance_log.get_metrics(),
+            "prompt_cache": {
+                **self.prompt_cache_stats,
+                "hit_rate": (
+                    self.prompt_cache_stats["cached_tokens"] / self.prompt_cache_stats["prompt_tokens"]
+                    if self.prompt_cache_stats["prompt_tokens"] else 0.0
+                ),
+            },
         }
         
         # Add budget remaining if tracking is enabled
@@ -386,7 +386,6 @@ class EthicistProxyAgent(BaseProxyAgent):
         but don't block operations. Reviews focus on Service to Humanity
         and Consultation principles per user decision.
         """
-        import json
         from datetime import datetime
         
         log_entry = {
@@ -400,7 +399,6 @@ class EthicistProxyAgent(BaseProxyAgent):
         
         # Write to async review log
         log_file = self.log_dir / f"async_reviews_{datetime.now().strftime('%Y%m%d')}.jsonl"
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        self.provenance_log.write(log_file, log_entry)
         
         self.logger.info(f"Async ethical review logged: {tool_name}")
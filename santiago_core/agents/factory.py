@@ -5,7 +5,8 @@ Santiago Agent Factory
 Creates and manages Santiago agents for the multi-agent system.
 """
 
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import AsyncIterator, List, Dict, Any, Optional
 import asyncio
 
 
@@ -33,6 +34,8 @@ class SantiagoFactory:
                 "status": "available"
             }
         }
+        # Proxy agents attached to stream task execution: name -> (proxy, tool_name)
+        self.streaming_proxies: Dict[str, Any] = {}
 
     def list_available_agents(self) -> List[Dict[str, Any]]:
         """List all available agents"""
@@ -53,4 +56,38 @@ class SantiagoFactory:
             "status": "started",
             "estimated_completion": "2025-11-18T16:00:00Z",
             "message": f"Task assigned to {agent_name}. Agent will begin work shortly."
-        }
\ No newline at end of file
+        }
+
+    def attach_proxy(self, agent_name: str, proxy: Any, tool_name: str) -> None:
+        """Execute an agent's streamed tasks through a proxy tool"""
+        if agent_name not in self.agents:
+            raise ValueError(f"Agent {agent_name} not found")
+        self.streaming_proxies[agent_name] = (proxy, tool_name)
+
+    def attach_default_proxies(self, workspace_path: Path) -> None:
+        """Stream each agent's tasks through its role proxy"""
+        # Import here to avoid loading the proxies (and their LLM clients) unless needed
+        from santiago_core.agents._proxy import ArchitectProxyAgent, DeveloperProxyAgent, PMProxyAgent
+
+        self.attach_proxy("santiago-pm", PMProxyAgent(workspace_path), "create_feature")
+        self.attach_proxy("santiago-architect", ArchitectProxyAgent(workspace_path), "create_design")
+        self.attach_proxy("santiago-developer", DeveloperProxyAgent(workspace_path), "write_code")
+
+    async def stream_task_with_agent(self, agent_name: str, task_description: str,
+                                     priority: str = "medium",
+                                     assignee: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Execute a task with a specific agent, yielding events as output is produced"""
+        if agent_name not in self.agents:
+            raise ValueError(f"Agent {agent_name} not found")
+
+        yield {"type": "status", "agent": agent_name, "status": "started"}
+
+        if agent_name not in self.streaming_proxies:
+            result = await self.execute_task_with_agent(agent_name, task_description, priority, assignee)
+            yield {"type": "result", "result": result}
+            return
+
+        proxy, tool_name = self.streaming_proxies[agent_name]
+        params = {"task_description": task_description, "priority": priority, "assignee": assignee}
+        async for event in proxy.invoke_tool_stream(tool_name, params):
+            yield event
@@ -6,10 +6,13 @@ Provides REST API endpoints for Santiago multi-agent system.
 """
 
 import os
+import json
 import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
 import uvicorn
@@ -31,10 +34,19 @@ class TaskRequest(BaseModel):
     assignee: Optional[str] = None
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Stream agent tasks through role proxies when an LLM provider is configured"""
+    if os.getenv("OPENAI_API_KEY") or os.getenv("XAI_API_KEY"):
+        factory.attach_default_proxies(Path(os.getenv("SANTIAGO_WORKSPACE", ".")))
+    yield
+
+
 app = FastAPI(
     title="Santiago Core API",
     description="Multi-agent AI factory for autonomous development",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -141,6 +153,37 @@ async def execute_agent_task(agent_name: str, task: TaskRequest):
         raise HTTPException(status_code=500, detail=f"Failed to execute task: {str(e)}")
 
 
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format a Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@app.post("/agents/{agent_name}/execute/stream")
+async def stream_agent_task(agent_name: str, task: TaskRequest):
+    """Execute a task with a specific agent, streaming output as Server-Sent Events"""
+    if agent_name not in factory.agents:
+        raise HTTPException(status_code=404, detail=f"Agent {agent_name} not found")
+
+    async def event_stream():
+        try:
+            async for event in factory.stream_task_with_agent(
+                agent_name=agent_name,
+                task_description=task.task_description,
+                priority=task.priority,
+                assignee=task.assignee
+            ):
+                yield _sse_event(event.get("type", "message"), event)
+        except Exception as e:
+            yield _sse_event("error", {"type": "error", "detail": f"Failed to execute task: {str(e)}"})
+        yield _sse_event("done", {"type": "done"})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 if __name__ == "__main__":
     # Get configuration from environment
     host = os.getenv("HOST", "0.0.0.0")
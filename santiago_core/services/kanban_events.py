@@ -0,0 +1,195 @@
+"""
+Kanban Change Feed for Santiago Factory
+
+In-process publish/subscribe feed of kanban card changes (add, move, tag,
+comment). Services that used to poll boards on a timer subscribe here and
+react as soon as a card changes, touching only the cards that changed.
+
+Events can optionally be bridged to the Redis MessageBus so agents in other
+processes see the same feed.
+"""
+
+import asyncio
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from santiago_core.services.message_bus import MessageBus
+
+
+EVENT_TYPES = ("add", "move", "tag", "comment")
+
+
+@dataclass
+class KanbanChangeEvent:
+    """A change to a single kanban card"""
+    event_type: str  # add, move, tag, comment
+    board_id: str
+    card_id: str
+    column: Optional[str] = None  # Column the card is in after the change
+    from_column: Optional[str] = None  # Previous column (move events only)
+    actor: Optional[str] = None  # Person/agent that made the change
+    card: Dict[str, Any] = field(default_factory=dict)  # Card snapshot after the change
+    data: Dict[str, Any] = field(default_factory=dict)  # Event-specific details
+    timestamp: datetime = None
+
+    def __post_init__(self):
+        if self.timestamp is None:
+            self.timestamp = datetime.now()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize event for the message bus"""
+        event = asdict(self)
+        event["timestamp"] = self.timestamp.isoformat()
+        return event
+
+
+class KanbanSubscription:
+    """A subscriber's bounded queue of matching kanban events"""
+
+    def __init__(
+        self,
+        feed: "KanbanEventFeed",
+        event_types: Optional[Iterable[str]] = None,
+        board_ids: Optional[Iterable[str]] = None,
+        max_queue_size: int = 1000,
+    ):
+        self.feed = feed
+        self.event_types: Optional[Set[str]] = set(event_types) if event_types else None
+        self.board_ids: Optional[Set[str]] = set(board_ids) if board_ids else None
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self.dropped_events = 0
+
+    def matches(self, event: KanbanChangeEvent) -> bool:
+        """Check whether an event passes this subscription's filters"""
+        if self.event_types is not None and event.event_type not in self.event_types:
+            return False
+        if self.board_ids is not None and event.board_id not in self.board_ids:
+            return False
+        return True
+
+    def set_board_filter(self, board_ids: Optional[Iterable[str]]) -> None:
+        """Restrict the subscription to the given boards (None for all boards)"""
+        self.board_ids = set(board_ids) if board_ids else None
+
+    def deliver(self, event: KanbanChangeEvent) -> None:
+        """Queue an event, dropping the oldest one if the subscriber fell behind"""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped_events += 1
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[KanbanChangeEvent]:
+        """Wait for the next event, returning None on timeout"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def get_batch(self, timeout: Optional[float] = None, max_events: int = 100) -> List[KanbanChangeEvent]:
+        """Wait for at least one event, then drain whatever else is already queued"""
+        first = await self.get(timeout)
+        if first is None:
+            return []
+
+        events = [first]
+        while len(events) < max_events and not self.queue.empty():
+            events.append(self.queue.get_nowait())
+        return events
+
+    def close(self) -> None:
+        """Stop receiving events"""
+        self.feed.unsubscribe(self)
+
+
+class KanbanEventFeed:
+    """In-process feed of kanban card changes"""
+
+    def __init__(self):
+        self.subscriptions: List[KanbanSubscription] = []
+        self.message_bus: Optional[MessageBus] = None
+        self.message_bus_topic = "kanban.events"
+        self.published_count = 0
+        self.logger = logging.getLogger(__name__)
+        self._bridge_tasks: Set[asyncio.Task] = set()
+
+    def subscribe(
+        self,
+        event_types: Optional[Iterable[str]] = None,
+        board_ids: Optional[Iterable[str]] = None,
+        max_queue_size: int = 1000,
+    ) -> KanbanSubscription:
+        """
+        Subscribe to card change events.
+
+        Args:
+            event_types: Event types to receive (default: all)
+            board_ids: Boards to receive events for (default: all)
+            max_queue_size: Queue bound; oldest events are dropped beyond it
+
+        Returns:
+            Subscription to read events from
+        """
+        subscription = KanbanSubscription(self, event_types, board_ids, max_queue_size)
+        self.subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: KanbanSubscription) -> None:
+        """Remove a subscription"""
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+
+    def bridge_to_message_bus(self, message_bus: MessageBus, topic: str = "kanban.events") -> None:
+        """Also publish every event to a connected MessageBus topic"""
+        self.message_bus = message_bus
+        self.message_bus_topic = topic
+
+    def publish(self, event: KanbanChangeEvent) -> None:
+        """Deliver an event to all matching subscribers"""
+        self.published_count += 1
+        for subscription in list(self.subscriptions):
+            if subscription.matches(event):
+                subscription.deliver(event)
+
+        if self.message_bus is not None:
+            self._publish_to_message_bus(event)
+
+    def _publish_to_message_bus(self, event: KanbanChangeEvent) -> None:
+        """Forward an event to the MessageBus without blocking the publisher"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.logger.debug("No running event loop; skipping MessageBus bridge")
+            return
+
+        task = loop.create_task(
+            self.message_bus.publish(self.message_bus_topic, event.to_dict(), sender="santiago-kanban")
+        )
+        self._bridge_tasks.add(task)
+        task.add_done_callback(self._on_bridge_done)
+
+    def _on_bridge_done(self, task: asyncio.Task) -> None:
+        """Log MessageBus bridge failures"""
+        self._bridge_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error(f"Failed to bridge kanban event to MessageBus: {task.exception()}")
+
+
+# Singleton instance
+_kanban_event_feed: Optional[KanbanEventFeed] = None
+
+
+def get_kanban_event_feed() -> KanbanEventFeed:
+    """
+    Get or create the process-wide kanban event feed.
+
+    Returns:
+        KanbanEventFeed instance
+    """
+    global _kanban_event_feed
+
+    if _kanban_event_feed is None:
+        _kanban_event_feed = KanbanEventFeed()
+
+    return _kanban_event_feed
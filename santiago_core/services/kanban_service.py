@@ -8,11 +8,13 @@ to manage workflow, track progress, and coordinate work through the board.
 
 import json
 import asyncio
+import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 from santiago_core.core.mcp_service import MCPServer, MCPTool, MCPToolResult
+from santiago_core.services.kanban_events import KanbanChangeEvent, KanbanEventFeed, get_kanban_event_feed
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from domain.src.nusy_pm_core.adapters.neurosymbolic_prioritizer import NeurosymbolicPrioritizer
@@ -23,7 +25,7 @@ from self_improvement.santiago_pm.tackle.kanban.kanban_model import ColumnType,
 class SantiagoKanbanService(MCPServer):
     """MCP service for Kanban board management in Santiago Factory"""
 
-    def __init__(self, workspace_path: Path):
+    def __init__(self, workspace_path: Path, event_feed: Optional[KanbanEventFeed] = None):
         super().__init__(
             name="santiago-kanban",
             version="1.0.0",
@@ -31,9 +33,13 @@ class SantiagoKanbanService(MCPServer):
         )
 
         self.workspace_path = workspace_path
+        self.logger = logging.getLogger("santiago-kanban")
         self.kanban_service = KanbanService()
         self.prioritizer = NeurosymbolicPrioritizer(workspace_path)
 
+        # Card change feed shared with pollers and monitors
+        self.event_feed = event_feed or get_kanban_event_feed()
+
         # Register tools
         self.register_tools()
 
@@ -225,6 +231,51 @@ class SantiagoKanbanService(MCPServer):
         except Exception as e:
             return MCPToolResult(error=f"Error executing {tool_name}: {str(e)}")
 
+    def _find_card(self, board_id: str, card_id: str):
+        """Find a card and the name of the column it is in"""
+        board = self.kanban_service.kanban_system.boards.get(board_id)
+        if not board:
+            return None, None
+
+        for column_name, column in board.columns.items():
+            for card in column.cards:
+                if card.card_id == card_id:
+                    return card, column_name
+        return None, None
+
+    def _card_snapshot(self, card) -> Dict[str, Any]:
+        """Serialize a card the same way kanban_get_next_work does"""
+        return {
+            "card_id": card.card_id,
+            "title": card.item_reference.title,
+            "item_type": card.item_reference.item_type.value,
+            "priority": card.item_reference.priority,
+            "assignee": card.item_reference.assignee,
+            "repository_path": card.item_reference.repository_path,
+            "description": card.item_reference.description,
+            "tags": list(card.tags),
+        }
+
+    def _publish_card_event(self, event_type: str, board_id: str, card_id: str,
+                            actor: Optional[str] = None, from_column: Optional[str] = None,
+                            data: Optional[Dict[str, Any]] = None):
+        """Publish a card change to the event feed"""
+        try:
+            card, column = self._find_card(board_id, card_id)
+            self.event_feed.publish(KanbanChangeEvent(
+                event_type=event_type,
+                board_id=board_id,
+                card_id=card_id,
+                column=column,
+                from_column=from_column,
+                actor=actor,
+                card=self._card_snapshot(card) if card else {},
+                data=data or {}
+            ))
+        except Exception as e:
+            # Never fail the tool call because of a subscriber problem
+            self.logger.error(f"Failed to publish kanban {event_type} event for {card_id}: {e}")
+
     async def _handle_create_board(self, params: Dict[str, Any]) -> MCPToolResult:
         """Handle board creation"""
         board_id = self.kanban_service.kanban_system.create_board(
@@ -266,10 +317,12 @@ class SantiagoKanbanService(MCPServer):
             priority=params.get("priority", "medium"),
             assignee=params.get("assignee")
         )
+        self._publish_card_event("add", params["board_id"], card_id, actor=params.get("assignee"))
         return MCPToolResult(result={"card_id": card_id, "status": "added"})
 
     async def _handle_move_card(self, params: Dict[str, Any]) -> MCPToolResult:
         """Handle card movement"""
+        _, from_column = self._find_card(params["board_id"], params["card_id"])
         result = self.kanban_service.move_card_with_validation(
             board_id=params["board_id"],
             card_id=params["card_id"],
@@ -277,6 +330,13 @@ class SantiagoKanbanService(MCPServer):
             moved_by=params.get("moved_by", "mcp-service"),
             reason=params.get("reason")
         )
+        if not (isinstance(result, dict) and result.get("success") is False):
+            self._publish_card_event(
+                "move", params["board_id"], params["card_id"],
+                actor=params.get("moved_by", "mcp-service"),
+                from_column=from_column,
+                data={"reason": params.get("reason")}
+            )
         return MCPToolResult(result=result)
 
     async def _handle_search_cards(self, params: Dict[str, Any]) -> MCPToolResult:
@@ -298,6 +358,12 @@ class SantiagoKanbanService(MCPServer):
             comment_text=params["comment"],
             author=params.get("author", "mcp-service")
         )
+        if success:
+            self._publish_card_event(
+                "comment", params["board_id"], params["card_id"],
+                actor=params.get("author", "mcp-service"),
+                data={"comment": params["comment"]}
+            )
         return MCPToolResult(result={"success": success})
 
     async def _handle_add_tags(self, params: Dict[str, Any]) -> MCPToolResult:
@@ -327,6 +393,8 @@ class SantiagoKanbanService(MCPServer):
         board.updated_at = datetime.now()
         self.kanban_service.kanban_system._save_boards()
 
+        self._publish_card_event("tag", params["board_id"], params["card_id"], data={"tags": params["tags"]})
+
         return MCPToolResult(result={"success": True, "tags_added": params["tags"]})
 
     async def _handle_get_next_work(self, params: Dict[str, Any]) -> MCPToolResult:
@@ -604,6 +672,7 @@ class SantiagoKanbanService(MCPServer):
         """Handle issue closing by moving card to done column"""
         try:
             # Move card to done column
+            _, from_column = self._find_card(params["board_id"], params["card_id"])
             result = self.kanban_service.move_card_with_validation(
                 board_id=params["board_id"],
                 card_id=params["card_id"],
@@ -611,14 +680,30 @@ class SantiagoKanbanService(MCPServer):
                 moved_by=params.get("closed_by", "santiago-developer"),
                 reason=params.get("close_reason", "Work completed following full development workflow")
             )
+            if isinstance(result, dict) and result.get("success") is False:
+                # Validation rejected the move; the issue is not closed
+                return MCPToolResult(result=result)
+
+            self._publish_card_event(
+                "move", params["board_id"], params["card_id"],
+                actor=params.get("closed_by", "santiago-developer"),
+                from_column=from_column,
+                data={"reason": params.get("close_reason"), "closed": True}
+            )
 
             # Add a completion comment
-            self.kanban_service.add_comment_to_card(
+            comment = f"✅ Issue closed by {params.get('closed_by', 'santiago-developer')}. {params.get('close_reason', 'Work completed successfully.')}"
+            if self.kanban_service.add_comment_to_card(
                 board_id=params["board_id"],
                 card_id=params["card_id"],
-                comment_text=f"✅ Issue closed by {params.get('closed_by', 'santiago-developer')}. {params.get('close_reason', 'Work completed successfully.')}",
+                comment_text=comment,
                 author=params.get("closed_by", "santiago-developer")
-            )
+            ):
+                self._publish_card_event(
+                    "comment", params["board_id"], params["card_id"],
+                    actor=params.get("closed_by", "santiago-developer"),
+                    data={"comment": comment}
+                )
 
             return MCPToolResult(result={
                 "success": True,
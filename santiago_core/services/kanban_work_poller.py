@@ -7,25 +7,83 @@ starts work on them when they become available. It integrates with the documenta
 automation system to create documentation stubs when work begins.
 
 Key features:
-- Polls kanban boards for ready tickets at configurable intervals
+- Reacts to kanban card change events as soon as a ticket becomes ready
+- Falls back to polling boards at configurable intervals to reconcile
 - Automatically moves high-priority tickets to in_progress
 - Triggers documentation automation for feature start events
-- Supports multiple boards and configurable polling intervals
+- Processes multiple boards concurrently under a global work limit, taking
+  cards from each board in turn
 - Includes health monitoring and graceful shutdown
 """
 
 import asyncio
 import signal
 import sys
+import time
+from collections import OrderedDict
+from itertools import zip_longest
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import logging
 
+from santiago_core.services.kanban_events import KanbanChangeEvent, KanbanSubscription
 from santiago_core.services.kanban_service import SantiagoKanbanService
 from santiago_core.services.documentation_integration import DocumentationWorkflowIntegration
 
 
+class ProcessedCardCache:
+    """Set-like record of started cards, bounded by size (LRU) and age (TTL).
+
+    A hit refreshes both recency and age, so a card that keeps being seen
+    (e.g. left in "ready" after a start) is remembered for as long as polls
+    keep seeing it. Only a card unseen for the TTL, or the least recently
+    seen card when the cache is full, is forgotten; if such a card is
+    still in "ready" it is started again.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 24 * 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+
+    def __contains__(self, card_id: str) -> bool:
+        added_at = self._entries.get(card_id)
+        if added_at is None:
+            return False
+        now = time.monotonic()
+        if now - added_at > self.ttl_seconds:
+            del self._entries[card_id]
+            return False
+        self._entries[card_id] = now
+        self._entries.move_to_end(card_id)
+        return True
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._entries)
+
+    def add(self, card_id: str) -> None:
+        """Record a card, evicting the oldest entries beyond the size bound"""
+        self._entries[card_id] = time.monotonic()
+        self._entries.move_to_end(card_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, card_id: str) -> None:
+        """Forget a card"""
+        self._entries.pop(card_id, None)
+
+    def _expire(self) -> None:
+        """Drop entries not seen within the TTL (least recently seen are first)"""
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self._entries:
+            card_id, added_at = next(iter(self._entries.items()))
+            if added_at > cutoff:
+                break
+            del self._entries[card_id]
+
+
 class KanbanWorkPoller:
     """Service that polls kanban boards for ready work and automatically starts it"""
 
@@ -38,10 +96,20 @@ class KanbanWorkPoller:
         # Service state
         self.running = False
         self.last_poll_time = None
-        self.processed_cards = set()  # Track cards we've already processed
+        self.processed_cards = ProcessedCardCache(  # Track cards we've already processed
+            max_entries=self.config.get('processed_cards_max', 10000),
+            ttl_seconds=self.config.get('processed_cards_ttl_hours', 24) * 3600
+        )
         self.poll_interval = self.config.get('poll_interval_seconds', 30)
         self.max_concurrent_work = self.config.get('max_concurrent_work', 3)
+        self.work_semaphore = asyncio.Semaphore(self.max_concurrent_work)
+        self.in_flight_cards: set = set()  # Cards currently being started
+        self.start_tasks: set = set()  # Background card starts, so polling never waits on them
+        self.cards_started = 0
         self.target_boards = self.config.get('target_boards', [])
+        self.event_driven = self.config.get('event_driven', True)
+        self.subscription: Optional[KanbanSubscription] = None
+        self.events_processed = 0
 
         # Setup logging
         self.logger = logging.getLogger('KanbanWorkPoller')
@@ -55,8 +123,11 @@ class KanbanWorkPoller:
         """Get default configuration"""
         return {
             'poll_interval_seconds': 30,  # Poll every 30 seconds
-            'max_concurrent_work': 3,     # Maximum concurrent work items
+            'max_concurrent_work': 3,     # Maximum concurrent work items across all boards
+            'processed_cards_max': 10000, # Bound on remembered started cards
+            'processed_cards_ttl_hours': 24,  # How long a started card is remembered
             'target_boards': [],          # Empty means poll all boards
+            'event_driven': True,         # React to card change events between polls
             'auto_start_work': True,      # Whether to automatically start work
             'documentation_enabled': True, # Whether to trigger documentation
             'log_level': 'INFO'
@@ -75,11 +146,20 @@ class KanbanWorkPoller:
             # Initial discovery of boards
             await self._discover_boards()
 
-            # Main polling loop
+            if self.event_driven:
+                self.subscription = self.kanban_service.event_feed.subscribe(
+                    event_types=['add', 'move', 'tag', 'comment'],
+                    board_ids=self.target_boards
+                )
+
+            # Main loop: react to change events, poll periodically to reconcile
             while self.running:
                 try:
-                    await self._poll_and_process_work()
-                    await asyncio.sleep(self.poll_interval)
+                    if self.subscription:
+                        await self._wait_and_process_changes()
+                    else:
+                        await self._poll_and_process_work()
+                        await asyncio.sleep(self.poll_interval)
                 except Exception as e:
                     self.logger.error(f"❌ Error in polling loop: {e}")
                     await asyncio.sleep(self.poll_interval)
@@ -87,6 +167,10 @@ class KanbanWorkPoller:
         except Exception as e:
             self.logger.error(f"❌ Fatal error in poller service: {e}")
         finally:
+            if self.subscription:
+                self.subscription.close()
+                self.subscription = None
+            await self.wait_for_started_work()
             self.logger.info("🛑 Kanban Work Poller Service stopped")
 
     def _signal_handler(self, signum, frame):
@@ -120,18 +204,68 @@ class KanbanWorkPoller:
 
         self.logger.info(f"✅ Discovered {len(self.target_boards)} board(s): {', '.join(self.target_boards)}")
 
+    async def _wait_and_process_changes(self):
+        """Wait for card change events until the next reconciliation poll is due"""
+        if self.last_poll_time is None:
+            await self._poll_and_process_work()
+
+        elapsed = (datetime.now() - self.last_poll_time).total_seconds()
+        events = await self.subscription.get_batch(timeout=max(0.0, self.poll_interval - elapsed))
+        if events:
+            await self._process_change_events(events)
+
+        # Reconcile with a full poll to catch changes made outside this process
+        if (datetime.now() - self.last_poll_time).total_seconds() >= self.poll_interval:
+            await self._poll_and_process_work()
+
+    async def _process_change_events(self, events: List[KanbanChangeEvent]):
+        """Start work on cards that became ready, touching only the changed cards"""
+        self.events_processed += len(events)
+
+        # Keep only the latest state of each changed card, grouped by board
+        changed: Dict[str, Dict[str, KanbanChangeEvent]] = {}
+        for event in events:
+            if event.event_type == 'move' and event.column == 'ready':
+                # A card moved (back) into ready needs to be started again
+                self.processed_cards.discard(event.card_id)
+            changed.setdefault(event.board_id, {})[event.card_id] = event
+
+        priority_order = {"high": 0, "medium": 1, "low": 2}
+        cards_by_board: Dict[str, List[Dict[str, Any]]] = {}
+        for board_id, card_events in changed.items():
+            ready_cards = [
+                event.card for event in card_events.values()
+                if event.column == 'ready' and event.card and self._is_new_card(event.card_id)
+            ]
+            if not ready_cards:
+                continue
+
+            ready_cards.sort(key=lambda card: priority_order.get(card.get('priority'), 1))
+            self.logger.info(f"⚡ {len(ready_cards)} ticket(s) became ready on board {board_id}")
+            cards_by_board[board_id] = ready_cards[:self.max_concurrent_work]
+
+        self._start_cards(cards_by_board)
+
     async def _poll_and_process_work(self):
-        """Poll boards for ready work and process it"""
+        """Poll all boards concurrently for ready work and process it"""
         self.last_poll_time = datetime.now()
 
-        for board_id in self.target_boards:
-            try:
-                await self._process_board(board_id)
-            except Exception as e:
-                self.logger.error(f"❌ Error processing board {board_id}: {e}")
+        results = await asyncio.gather(
+            *(self._process_board(board_id) for board_id in self.target_boards),
+            return_exceptions=True
+        )
+
+        cards_by_board: Dict[str, List[Dict[str, Any]]] = {}
+        for board_id, result in zip(self.target_boards, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"❌ Error processing board {board_id}: {result}")
+            elif result:
+                cards_by_board[board_id] = result
 
-    async def _process_board(self, board_id: str):
-        """Process a single board for ready work"""
+        self._start_cards(cards_by_board)
+
+    async def _process_board(self, board_id: str) -> List[Dict[str, Any]]:
+        """Get the new ready cards for a single board"""
         # Get next work items
         work_result = await self.kanban_service.handle_tool_call('kanban_get_next_work', {
             'board_id': board_id,
@@ -140,35 +274,63 @@ class KanbanWorkPoller:
 
         if work_result.error:
             self.logger.error(f"❌ Failed to get next work for board {board_id}: {work_result.error}")
-            return
+            return []
 
         ready_cards = work_result.result.get('cards', [])
         if not ready_cards:
-            return  # No work ready
+            return []  # No work ready
 
         self.logger.info(f"📋 Found {len(ready_cards)} ready ticket(s) on board {board_id}")
 
-        # Filter out cards we've already processed
-        new_cards = [card for card in ready_cards if card['card_id'] not in self.processed_cards]
-
-        if not new_cards:
-            return  # All cards already processed
-
-        # Process cards up to the concurrency limit
-        processed_count = 0
-        for card in new_cards[:self.max_concurrent_work]:
-            if not self.running:
-                break
-
-            try:
+        # Filter out cards we've already processed or are starting right now
+        new_cards = [card for card in ready_cards if self._is_new_card(card['card_id'])]
+        return new_cards[:self.max_concurrent_work]
+
+    def _is_new_card(self, card_id: str) -> bool:
+        """Check whether a card has not been started yet"""
+        return card_id not in self.processed_cards and card_id not in self.in_flight_cards
+
+    def _start_cards(self, cards_by_board: Dict[str, List[Dict[str, Any]]]):
+        """Dispatch card starts as background tasks under the global work limit.
+
+        Cards are queued on the semaphore round-robin across boards, so one
+        board with many (or slow) cards cannot take every slot. The caller
+        does not wait for the starts, so a slow start never delays the next
+        poll or event batch; in_flight_cards keeps those from starting a card
+        twice.
+        """
+        board_queues = [[(board_id, card) for card in cards] for board_id, cards in cards_by_board.items()]
+        interleaved = [item for turn in zip_longest(*board_queues) for item in turn if item is not None]
+
+        for board_id, card in interleaved:
+            self.in_flight_cards.add(card['card_id'])
+            task = asyncio.create_task(self._start_card_limited(board_id, card))
+            self.start_tasks.add(task)
+            task.add_done_callback(self.start_tasks.discard)
+
+        if interleaved:
+            self.logger.info(f"⏳ Dispatched {len(interleaved)} ticket start(s)")
+
+    async def wait_for_started_work(self):
+        """Wait for all dispatched card starts to finish"""
+        while self.start_tasks:
+            await asyncio.gather(*list(self.start_tasks), return_exceptions=True)
+
+    async def _start_card_limited(self, board_id: str, card: Dict[str, Any]) -> bool:
+        """Start one card while holding a global work slot"""
+        try:
+            async with self.work_semaphore:
+                if not self.running:
+                    return False
                 await self._start_work_on_card(board_id, card)
                 self.processed_cards.add(card['card_id'])
-                processed_count += 1
-            except Exception as e:
-                self.logger.error(f"❌ Failed to start work on card {card['card_id']}: {e}")
-
-        if processed_count > 0:
-            self.logger.info(f"✅ Started work on {processed_count} ticket(s)")
+                self.cards_started += 1
+                return True
+        except Exception as e:
+            self.logger.error(f"❌ Failed to start work on card {card['card_id']}: {e}")
+            return False
+        finally:
+            self.in_flight_cards.discard(card['card_id'])
 
     async def _start_work_on_card(self, board_id: str, card: Dict[str, Any]):
         """Start work on a specific card"""
@@ -244,6 +406,10 @@ class KanbanWorkPoller:
             'poll_interval_seconds': self.poll_interval,
             'target_boards': self.target_boards,
             'processed_cards_count': len(self.processed_cards),
+            'cards_started': self.cards_started,
+            'starts_in_flight': len(self.in_flight_cards),
+            'event_driven': self.event_driven,
+            'events_processed': self.events_processed,
             'max_concurrent_work': self.max_concurrent_work,
             'config': self.config
         }
@@ -264,6 +430,8 @@ async def main():
                        help='Workspace path (default: current directory)')
     parser.add_argument('--poll-interval', '-i', type=int, default=30,
                        help='Poll interval in seconds (default: 30)')
+    parser.add_argument('--no-events', action='store_true',
+                       help='Disable the card change feed and rely on polling only')
     parser.add_argument('--max-concurrent', '-c', type=int, default=3,
                        help='Maximum concurrent work items (default: 3)')
     parser.add_argument('--boards', '-b', nargs='*',
@@ -284,6 +452,7 @@ async def main():
         'poll_interval_seconds': args.poll_interval,
         'max_concurrent_work': args.max_concurrent,
         'target_boards': args.boards or [],
+        'event_driven': not args.no_events,
         'auto_start_work': not args.dry_run,
         'documentation_enabled': not args.no_docs,
         'log_level': 'INFO'
@@ -12,6 +12,9 @@ Part of the layered memory system:
 - Voyage Shared Memory: This file - collective project knowledge
 - Captain's Intent & Orders: Mission directives (captains_memory.py)
 - Multimodal Ingest Officer: Input processing (multimodal_ingest.py)
+
+Storage backend is selectable: in-memory graph saved as Turtle (default) or
+an indexed SQLite triple table (backend="sqlite" or KG_STORE_BACKEND=sqlite).
 """
 
 import asyncio
@@ -24,6 +27,8 @@ from typing import Dict, List, Optional, Set, Tuple
 from rdflib import Graph, Literal, Namespace, RDF, RDFS, URIRef, BNode
 from rdflib.namespace import FOAF, XSD
 
+from domain.src.nusy_pm_core.adapters.sqlite_triple_store import create_graph, get_default_backend
+
 
 class SantiagoKnowledgeGraph:
     """RDF-based shared knowledge graph for Santiago voyage/project memory"""
@@ -36,19 +41,21 @@ class SantiagoKnowledgeGraph:
     CONCEPT = Namespace("https://santiago.ai/concept/")
     DECISION = Namespace("https://santiago.ai/decision/")
 
-    def __init__(self, voyage_id: str, workspace_path: Path):
+    def __init__(self, voyage_id: str, workspace_path: Path, backend: Optional[str] = None):
         self.voyage_id = voyage_id
         self.workspace_path = workspace_path
         self.logger = logging.getLogger(f"santiago-voyage-memory-{voyage_id}")
 
-        # Initialize RDF graph for shared memory
-        self.graph = Graph()
-        self._bind_namespaces()
-
         # Shared memory file - accessible to entire crew
         self.memory_file = workspace_path / "voyages" / voyage_id / "shared_memory.ttl"
+        self.memory_db = self.memory_file.with_suffix(".sqlite")
         self.memory_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # Initialize RDF graph for shared memory
+        self.backend = (backend or get_default_backend()).lower()
+        self.graph = create_graph(self.backend, self.memory_db)
+        self._bind_namespaces()
+
         # Load existing shared knowledge
         self._load_shared_memory()
 
@@ -66,9 +73,13 @@ class SantiagoKnowledgeGraph:
 
     def _load_shared_memory(self):
         """Load existing shared voyage memory"""
-        if self.memory_file.exists():
+        if self.backend == "sqlite" and len(self.graph) > 0:
+            self.logger.info(f"Opened voyage shared memory with {len(self.graph)} triples")
+        elif self.memory_file.exists():
             try:
                 self.graph.parse(str(self.memory_file), format="turtle")
+                if self.backend == "sqlite":
+                    self.graph.commit()  # One-time import of the Turtle file
                 self.logger.info(f"Loaded {len(self.graph)} triples from voyage shared memory")
             except Exception as e:
                 self.logger.error(f"Error loading voyage shared memory: {e}")
@@ -91,7 +102,10 @@ class SantiagoKnowledgeGraph:
     def save_shared_memory(self):
         """Save shared voyage memory to file"""
         try:
-            self.graph.serialize(destination=str(self.memory_file), format="turtle")
+            if self.backend == "sqlite":
+                self.graph.commit()
+            else:
+                self.graph.serialize(destination=str(self.memory_file), format="turtle")
             self.logger.info(f"Saved {len(self.graph)} triples to voyage shared memory")
         except Exception as e:
             self.logger.error(f"Error saving voyage shared memory: {e}")
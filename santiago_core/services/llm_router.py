@@ -2,14 +2,26 @@
 LLM Router for Santiago Factory
 
 Routes requests to appropriate LLM based on task complexity and role.
-Supports xAI (Grok) and OpenAI with model selection.
+Supports xAI (Grok) and OpenAI with model selection, plus an optional local
+vLLM endpoint for simple tasks.
+
+Routing is adaptive: rolling latency, error-rate and cost statistics are kept
+per (provider, model), and when a role's default model stops meeting that
+role's latency SLO / cost budget an eligible alternate is chosen instead.
+Samples expire after a few minutes, so a model that was routed around gets
+traffic again (and a fresh chance to meet its SLO) once its bad samples age out.
+Each decision is recorded in a trace for analysis.
 """
 
 import os
+import time
+from collections import deque
 from enum import Enum
-from typing import Dict, Any, Optional
+from typing import Callable, Deque, Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
+from santiago_core.services.rate_limiter import get_rate_limiter_registry
+
 
 class TaskComplexity(Enum):
     """Task complexity levels for model selection"""
@@ -23,6 +35,7 @@ class LLMProvider(Enum):
     """Available LLM providers"""
     XAI = "xai"
     OPENAI = "openai"
+    VLLM = "vllm"  # Local OpenAI-compatible vLLM server
 
 
 @dataclass
@@ -36,6 +49,141 @@ class LLMConfig:
     max_tokens: Optional[int] = None
 
 
+@dataclass
+class RoleBudget:
+    """Latency SLO and cost budget for a role"""
+    latency_slo_seconds: float = 30.0  # p95 target
+    max_cost_per_call: float = 0.05  # USD
+    max_error_rate: float = 0.2
+
+
+@dataclass
+class HedgePolicy:
+    """Hedging and failover behaviour for one task complexity"""
+    hedge: bool = False  # Send a backup request if the primary is slow
+    failover: bool = True  # Retry on the alternate if the primary fails
+    default_delay_seconds: float = 10.0  # Hedge delay before enough latency samples exist
+    min_delay_seconds: float = 1.0
+    max_delay_seconds: float = 60.0
+
+
+# Approximate blended price per 1K tokens (USD) used for cost statistics
+MODEL_COST_PER_1K_TOKENS = {
+    "grok-4-fast": 0.0004,
+    "gpt-5-nano": 0.0002,
+    "gpt-5.1": 0.005,
+    "o3": 0.005,
+}
+
+
+class ModelStats:
+    """Rolling latency, error and cost statistics for one provider/model.
+
+    Bounded by count (window) and by age (max_age_seconds).
+    """
+
+    def __init__(
+        self,
+        window: int = 50,
+        max_age_seconds: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        # (recorded_at, latency, success, cost), oldest first
+        self._samples: Deque[Tuple[float, float, bool, float]] = deque(maxlen=window)
+        self.max_age_seconds = max_age_seconds
+        self.clock = clock
+
+    def record(self, latency: float, success: bool, cost: float = 0.0) -> None:
+        self._samples.append((self.clock(), latency, success, cost))
+
+    @property
+    def samples(self) -> List[Tuple[float, bool, float]]:
+        """Unexpired (latency, success, cost) samples"""
+        cutoff = self.clock() - self.max_age_seconds
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+        return [sample[1:] for sample in self._samples]
+
+    @property
+    def count(self) -> int:
+        return len(self.samples)
+
+    @property
+    def p95_latency(self) -> float:
+        samples = self.samples
+        if not samples:
+            return 0.0
+        latencies = sorted(sample[0] for sample in samples)
+        return latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+
+    @property
+    def avg_latency(self) -> float:
+        samples = self.samples
+        return sum(sample[0] for sample in samples) / len(samples) if samples else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        samples = self.samples
+        return sum(1 for sample in samples if not sample[1]) / len(samples) if samples else 0.0
+
+    @property
+    def avg_cost(self) -> float:
+        samples = self.samples
+        return sum(sample[2] for sample in samples) / len(samples) if samples else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "samples": self.count,
+            "p95_latency": round(self.p95_latency, 3),
+            "avg_latency": round(self.avg_latency, 3),
+            "error_rate": round(self.error_rate, 3),
+            "avg_cost": round(self.avg_cost, 6),
+        }
+
+
+class ModelStatsTracker:
+    """Statistics for every provider/model, shared by all routers"""
+
+    def __init__(self, window: int = 50, max_age_seconds: float = 600.0, clock: Callable[[], float] = time.monotonic):
+        self.window = window
+        self.max_age_seconds = max_age_seconds
+        self.clock = clock
+        self.stats: Dict[Tuple[str, str], ModelStats] = {}
+
+    def record(self, provider: str, model: str, latency: float, success: bool, tokens: Optional[int] = None) -> None:
+        """Record the outcome of one call"""
+        cost = (tokens or 0) / 1000 * MODEL_COST_PER_1K_TOKENS.get(model, 0.0)
+        stats = self.stats.get((provider, model))
+        if stats is None:
+            stats = self.stats[(provider, model)] = ModelStats(self.window, self.max_age_seconds, self.clock)
+        stats.record(latency, success, cost)
+
+    def get(self, provider: str, model: str) -> Optional[ModelStats]:
+        return self.stats.get((provider, model))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {f"{provider}/{model}": stats.to_dict() for (provider, model), stats in self.stats.items()}
+
+
+# Singleton instance
+_model_stats_tracker: Optional[ModelStatsTracker] = None
+
+
+def get_model_stats_tracker() -> ModelStatsTracker:
+    """
+    Get or create the process-wide model statistics tracker.
+
+    Returns:
+        ModelStatsTracker instance
+    """
+    global _model_stats_tracker
+
+    if _model_stats_tracker is None:
+        _model_stats_tracker = ModelStatsTracker()
+
+    return _model_stats_tracker
+
+
 class LLMRouter:
     """Routes LLM requests to appropriate provider and model"""
     
@@ -70,14 +218,53 @@ class LLMRouter:
         "coordinator_proxy": LLMProvider.OPENAI,
     }
     
-    def __init__(self):
+    # Per-role latency SLO and cost budget (roles not listed use RoleBudget defaults)
+    ROLE_BUDGETS = {
+        "architect_proxy": RoleBudget(latency_slo_seconds=60.0, max_cost_per_call=0.10),
+        "ethicist_proxy": RoleBudget(latency_slo_seconds=60.0, max_cost_per_call=0.10),
+        "pm_proxy": RoleBudget(latency_slo_seconds=20.0, max_cost_per_call=0.03),
+        "qa_proxy": RoleBudget(latency_slo_seconds=20.0, max_cost_per_call=0.03),
+    }
+    
+    MIN_SAMPLES = 5  # Samples needed before stats can override the static choice
+    
+    # Hedging is opt-in per complexity (LLM_HEDGE_COMPLEXITIES=simple,moderate)
+    HEDGE_POLICIES = {
+        TaskComplexity.SIMPLE: HedgePolicy(default_delay_seconds=5.0),
+        TaskComplexity.MODERATE: HedgePolicy(default_delay_seconds=15.0),
+        TaskComplexity.COMPLEX: HedgePolicy(default_delay_seconds=30.0),
+        TaskComplexity.CRITICAL: HedgePolicy(default_delay_seconds=60.0, max_delay_seconds=120.0),
+    }
+    
+    def __init__(
+        self,
+        stats: Optional[ModelStatsTracker] = None,
+        adaptive: bool = True,
+        local_routing: Optional[bool] = None,
+    ):
         self.xai_api_key = os.getenv("XAI_API_KEY", "")
         self.xai_api_base = os.getenv("XAI_API_BASE", "https://api.x.ai/v1")
         self.openai_api_key = os.getenv("OPENAI_API_KEY", "")
         self.openai_api_base = os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1")
         
+        # Local vLLM endpoint for SIMPLE tasks (same variables as VLLMClient)
+        self.vllm_api_base = os.getenv("VLLM_BASE_URL", "http://localhost:8000/v1")
+        self.vllm_model = os.getenv("VLLM_MODEL_NAME", "mistral-7b-instruct")
+        self.vllm_api_key = os.getenv("VLLM_API_KEY", "EMPTY")
+        self.vllm_max_queue = int(os.getenv("VLLM_MAX_QUEUE", "4"))
+        if local_routing is None:
+            local_routing = os.getenv("VLLM_ROUTING_ENABLED", "false").lower() == "true"
+        self.local_routing = local_routing
+        
         # Allow testing without API keys
         self.require_api_keys = os.getenv("REQUIRE_API_KEYS", "true").lower() == "true"
+        
+        self.adaptive = adaptive
+        self.stats = stats or get_model_stats_tracker()
+        self.hedge_complexities = {
+            value.strip() for value in os.getenv("LLM_HEDGE_COMPLEXITIES", "").split(",") if value.strip()
+        }
+        self.decision_trace: Deque[Dict[str, Any]] = deque(maxlen=500)
     
     def get_config(
         self,
@@ -107,13 +294,187 @@ class LLMRouter:
         if not model:
             raise ValueError(f"No model mapping for {provider}, {task_complexity}")
         
-        # Get API credentials
-        if provider == LLMProvider.XAI:
-            api_key = self.xai_api_key
-            api_base = self.xai_api_base
+        if self.adaptive:
+            provider, model = self._choose_model(role, task_complexity, provider, model)
+        
+        return self._build_config(provider, model, temperature, max_tokens)
+    
+    def get_candidates(self, role: str, task_complexity: TaskComplexity) -> List[Tuple[LLMProvider, str]]:
+        """
+        Eligible (provider, model) pairs for a role and task, default first.
+        
+        Alternates are only offered for providers with credentials configured.
+        """
+        provider = self.ROLE_PROVIDER.get(role, LLMProvider.OPENAI)
+        candidates = [(provider, self.MODEL_MAP[(provider, task_complexity)])]
+        
+        for alternate in (LLMProvider.XAI, LLMProvider.OPENAI):
+            model = self.MODEL_MAP.get((alternate, task_complexity))
+            if alternate != provider and model and self._get_credentials(alternate)[0]:
+                candidates.append((alternate, model))
+        
+        return candidates
+    
+    def get_hedge_policy(self, task_complexity: TaskComplexity) -> HedgePolicy:
+        """Hedging/failover policy for a task complexity"""
+        policy = self.HEDGE_POLICIES.get(task_complexity, HedgePolicy())
+        if task_complexity.value in self.hedge_complexities and not policy.hedge:
+            policy = HedgePolicy(**{**policy.__dict__, "hedge": True})
+        return policy
+    
+    def get_hedge_delay(self, llm_config: LLMConfig, policy: HedgePolicy) -> float:
+        """
+        Seconds to wait on the primary before sending a hedge request.
+        
+        Uses the primary model's rolling p95 latency once enough samples
+        exist, so only the slowest ~5% of calls are hedged.
+        """
+        stats = self.stats.get(llm_config.provider.value, llm_config.model)
+        if stats is None or stats.count < self.MIN_SAMPLES:
+            delay = policy.default_delay_seconds
         else:
-            api_key = self.openai_api_key
-            api_base = self.openai_api_base
+            delay = stats.p95_latency
+        return min(policy.max_delay_seconds, max(policy.min_delay_seconds, delay))
+    
+    def get_fallback_config(
+        self,
+        role: str,
+        task_complexity: TaskComplexity,
+        primary: LLMConfig,
+    ) -> Optional[LLMConfig]:
+        """
+        Alternate config for hedging/failover, or None if there is none.
+        
+        Args:
+            role: The proxy role
+            task_complexity: Complexity of the task
+            primary: Config already in use
+        """
+        for provider, model in self.get_candidates(role, task_complexity):
+            if (provider, model) == (primary.provider, primary.model):
+                continue
+            api_key, _ = self._get_credentials(provider)
+            if not api_key:
+                continue
+            return self._build_config(provider, model, primary.temperature, primary.max_tokens)
+        return None
+    
+    def record_result(
+        self,
+        llm_config: LLMConfig,
+        latency: float,
+        success: bool,
+        tokens: Optional[int] = None,
+    ) -> None:
+        """
+        Record the outcome of a call made with a config from this router.
+        
+        Args:
+            llm_config: Config the call was made with
+            latency: Call duration in seconds
+            success: Whether a usable response came back
+            tokens: Total tokens used, if reported
+        """
+        self.stats.record(llm_config.provider.value, llm_config.model, latency, success, tokens)
+    
+    def get_decision_trace(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Most recent routing decisions, oldest first"""
+        trace = list(self.decision_trace)
+        return trace[-limit:] if limit else trace
+    
+    def _choose_model(
+        self,
+        role: str,
+        task_complexity: TaskComplexity,
+        default_provider: LLMProvider,
+        default_model: str,
+    ) -> Tuple[LLMProvider, str]:
+        """Pick the candidate that best meets the role's SLO and cost budget"""
+        budget = self.ROLE_BUDGETS.get(role, RoleBudget())
+        evaluated = []
+        
+        # Local vLLM first for simple tasks when its queue is short
+        if task_complexity == TaskComplexity.SIMPLE and self.local_routing:
+            queue_length = self._local_queue_length()
+            entry = self._evaluate(LLMProvider.VLLM, self.vllm_model, budget)
+            entry["queue_length"] = queue_length
+            if queue_length > self.vllm_max_queue:
+                entry["violations"].append(f"queue {queue_length} > {self.vllm_max_queue}")
+            evaluated.append(entry)
+        
+        for provider, model in self.get_candidates(role, task_complexity):
+            evaluated.append(self._evaluate(provider, model, budget))
+        
+        chosen = next((entry for entry in evaluated if not entry["violations"]), None)
+        if chosen is not None:
+            is_default = chosen["provider"] == default_provider and chosen["model"] == default_model
+            reason = "default" if is_default else (
+                "local_short_queue" if chosen["provider"] == LLMProvider.VLLM else "default_violates_budget"
+            )
+        else:
+            # Nothing meets the budget: take the most reliable, then fastest
+            chosen = min(evaluated, key=lambda entry: (entry["error_rate"], entry["p95_latency"]))
+            reason = "best_effort"
+        
+        self.decision_trace.append({
+            "timestamp": time.time(),
+            "role": role,
+            "complexity": task_complexity.value,
+            "chosen": f"{chosen['provider'].value}/{chosen['model']}",
+            "reason": reason,
+            "candidates": [
+                {**entry, "provider": entry["provider"].value} for entry in evaluated
+            ],
+        })
+        
+        return chosen["provider"], chosen["model"]
+    
+    def _evaluate(self, provider: LLMProvider, model: str, budget: RoleBudget) -> Dict[str, Any]:
+        """Check a candidate's rolling stats against a role budget"""
+        stats = self.stats.get(provider.value, model)
+        entry = {
+            "provider": provider,
+            "model": model,
+            "samples": stats.count if stats else 0,
+            "p95_latency": stats.p95_latency if stats else 0.0,
+            "error_rate": stats.error_rate if stats else 0.0,
+            "avg_cost": stats.avg_cost if stats else 0.0,
+            "violations": [],
+        }
+        
+        if entry["samples"] < self.MIN_SAMPLES:
+            return entry  # Not enough data to rule it out
+        
+        if entry["p95_latency"] > budget.latency_slo_seconds:
+            entry["violations"].append(f"p95 {entry['p95_latency']:.1f}s > {budget.latency_slo_seconds}s")
+        if entry["error_rate"] > budget.max_error_rate:
+            entry["violations"].append(f"error rate {entry['error_rate']:.2f} > {budget.max_error_rate}")
+        if entry["avg_cost"] > budget.max_cost_per_call:
+            entry["violations"].append(f"cost ${entry['avg_cost']:.4f} > ${budget.max_cost_per_call}")
+        return entry
+    
+    def _local_queue_length(self) -> int:
+        """Calls running or waiting on the local vLLM endpoint"""
+        metrics = get_rate_limiter_registry().get("vllm", self.vllm_model).get_metrics()
+        return metrics["in_flight"] + metrics["queued"]
+    
+    def _get_credentials(self, provider: LLMProvider) -> Tuple[str, str]:
+        """API key and base URL for a provider"""
+        if provider == LLMProvider.XAI:
+            return self.xai_api_key, self.xai_api_base
+        if provider == LLMProvider.VLLM:
+            return self.vllm_api_key, self.vllm_api_base
+        return self.openai_api_key, self.openai_api_base
+    
+    def _build_config(
+        self,
+        provider: LLMProvider,
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int],
+    ) -> LLMConfig:
+        """Build an LLMConfig, checking credentials"""
+        api_key, api_base = self._get_credentials(provider)
         
         if not api_key and self.require_api_keys:
             raise ValueError(f"API key not found for {provider.value}")
@@ -199,6 +199,10 @@ class SantiagoMemoryCoordinator:
 
     # Integration Methods
 
+    def shutdown(self):
+        """Release worker pools held by the memory layers"""
+        self.multimodal_ingest.shutdown()
+
     def save_all_memories(self):
         """Save all memory layers to persistent storage"""
         self.shared_memory.save_shared_memory()
@@ -16,13 +16,27 @@ Part of the layered memory system:
 - Multimodal Ingest Officer: This file - input processing and routing
 """
 
+import asyncio
+import atexit
 import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 import json
 import base64
+import hashlib
+
+
+def _extract_pdf_text(path: Path) -> str:
+    """Extract text from a PDF file.
+
+    Module-level so it can run in a worker process.
+    """
+    # Placeholder - would use PyPDF2 or similar
+    return f"[PDF Content from {path.name}] Extracted text would go here."
 
 
 @dataclass
@@ -64,7 +78,30 @@ class SantiagoMultimodalIngestOfficer:
         'text': ['txt', 'md', 'json']
     }
 
-    def __init__(self, workspace_path: Path):
+    # Bounded worker pool size per source type
+    WORKER_POOL_LIMITS = {
+        'text': 8,
+        'chat': 8,
+        'pdf': 2,
+        'voice': 2,
+        'video': 1,
+        'screen': 2
+    }
+
+    # Where each source type runs: 'process' for CPU-heavy parsing,
+    # 'thread' for blocking media tooling, 'inline' for lightweight text on the event loop
+    WORKER_POOL_KINDS = {
+        'text': 'inline',
+        'chat': 'inline',
+        'pdf': 'process',
+        'voice': 'thread',
+        'video': 'thread',
+        'screen': 'thread'
+    }
+
+    PRIORITY_KEYWORDS = ['urgent', 'critical', 'emergency', 'asap']
+
+    def __init__(self, workspace_path: Path, use_process_pool: bool = True):
         self.workspace_path = workspace_path
         self.logger = logging.getLogger("santiago-first-mate")
 
@@ -72,10 +109,30 @@ class SantiagoMultimodalIngestOfficer:
         self.ingest_queue: List[IngestedContent] = []
         self.routing_queue: List[Tuple[IngestedContent, ContentRoutingDecision]] = []
 
+        # Worker pools (created lazily)
+        self.use_process_pool = use_process_pool
+        self._process_pool: Optional[Executor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+
+        # Per-stage metrics: stage -> source_type -> counters
+        self.stage_metrics: Dict[str, Dict[str, Dict[str, float]]] = {}
+
         # Ingest storage
         self.ingest_dir = workspace_path / "multimodal_ingest"
         self.ingest_dir.mkdir(parents=True, exist_ok=True)
 
+        # Content fingerprint index: sha256 -> prior ingest record, plus
+        # content id -> sha256 for lookups by id. Saved by the batch paths
+        # (queue processing, cleanup), not on every ingest.
+        self.fingerprint_index: Dict[str, Dict[str, Any]] = {}
+        self._fingerprint_by_content_id: Dict[str, str] = {}
+        self.dedupe_stats = {
+            'duplicates_skipped': 0,
+            'processing_seconds_saved': 0.0,
+            'routings_saved': 0
+        }
+        self._load_fingerprint_index()
+
         # Load any pending ingests
         self._load_pending_ingests()
 
@@ -97,6 +154,10 @@ class SantiagoMultimodalIngestOfficer:
                         timestamp=datetime.fromisoformat(item['timestamp'])
                     )
                     self.ingest_queue.append(content)
+                    fingerprint = content.metadata.get('fingerprint')
+                    if fingerprint and fingerprint not in self.fingerprint_index:
+                        # Queued after the index was last saved
+                        self._register_fingerprint(fingerprint, content.content_id, content.source_type)
 
                 self.logger.info(f"Loaded {len(self.ingest_queue)} pending ingests")
 
@@ -127,18 +188,117 @@ class SantiagoMultimodalIngestOfficer:
         except Exception as e:
             self.logger.error(f"Error saving pending ingests: {e}")
 
+    def _load_fingerprint_index(self):
+        """Load the content fingerprint index from disk"""
+        index_file = self.ingest_dir / "content_fingerprints.json"
+        if index_file.exists():
+            try:
+                with open(index_file, 'r') as f:
+                    data = json.load(f)
+                self.fingerprint_index = data.get('fingerprints', {})
+                self._fingerprint_by_content_id = {
+                    record['content_id']: fingerprint
+                    for fingerprint, record in self.fingerprint_index.items()
+                }
+                self.dedupe_stats.update(data.get('dedupe_stats', {}))
+                self.logger.info(f"Loaded {len(self.fingerprint_index)} content fingerprints")
+            except Exception as e:
+                self.logger.error(f"Error loading content fingerprints: {e}")
+
+    def _save_fingerprint_index(self):
+        """Save the content fingerprint index to disk"""
+        data = {
+            'fingerprints': self.fingerprint_index,
+            'dedupe_stats': self.dedupe_stats,
+            'last_updated': datetime.now().isoformat()
+        }
+
+        index_file = self.ingest_dir / "content_fingerprints.json"
+        try:
+            with open(index_file, 'w') as f:
+                json.dump(data, f, indent=2)
+        except Exception as e:
+            self.logger.error(f"Error saving content fingerprints: {e}")
+
+    def _fingerprint_content(self, source_type: str, content: Any) -> str:
+        """Compute a stable SHA-256 fingerprint of the content"""
+        digest = hashlib.sha256(source_type.encode('utf-8'))
+        digest.update(b'\0')
+
+        if isinstance(content, Path) and content.is_file():
+            with open(content, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+        elif isinstance(content, bytes):
+            digest.update(content)
+        elif isinstance(content, (str, Path)):
+            digest.update(str(content).encode('utf-8'))
+        else:
+            digest.update(json.dumps(content, sort_keys=True, default=str).encode('utf-8'))
+
+        return digest.hexdigest()
+
+    def get_fingerprint_record(self, content_id: str) -> Optional[Tuple[str, Optional[ContentRoutingDecision]]]:
+        """Get the processed content and routing decision recorded for a content id"""
+        record = self.fingerprint_index.get(self._fingerprint_by_content_id.get(content_id))
+        if record is None:
+            return None
+        decision = None
+        if record.get('routing_decision'):
+            decision = ContentRoutingDecision(**record['routing_decision'])
+        return record.get('processed_content', ""), decision
+
+    def _register_fingerprint(self, fingerprint: str, content_id: str, source_type: str):
+        """Add a fingerprint record for newly queued content"""
+        self.fingerprint_index[fingerprint] = {
+            'content_id': content_id,
+            'source_type': source_type,
+            'processed_content': "",
+            'routing_decision': None,
+            'process_seconds': 0.0,
+            'hits': 0,
+            'first_seen': datetime.now().isoformat()
+        }
+        self._fingerprint_by_content_id[content_id] = fingerprint
+
+    def _forget_fingerprint(self, fingerprint: str):
+        """Remove a fingerprint record and its content id entry"""
+        record = self.fingerprint_index.pop(fingerprint, None)
+        if record is not None:
+            self._fingerprint_by_content_id.pop(record['content_id'], None)
+
     def ingest_content(self, source_type: str, content: Any, metadata: Dict[str, Any] = None) -> str:
-        """Ingest multimodal content and queue for processing"""
-        content_id = f"{source_type}_{datetime.now().timestamp()}_{hash(str(content))}"
+        """Ingest multimodal content and queue for processing.
+
+        Content already seen (same SHA-256 fingerprint) is not processed or
+        routed again; the original content id is returned instead.
+        """
+        fingerprint = self._fingerprint_content(source_type, content)
+
+        existing = self.fingerprint_index.get(fingerprint)
+        if existing:
+            existing['hits'] = existing.get('hits', 0) + 1
+            self.dedupe_stats['duplicates_skipped'] += 1
+            self.dedupe_stats['processing_seconds_saved'] += existing.get('process_seconds', 0.0)
+            decision = existing.get('routing_decision')
+            if decision:
+                self.dedupe_stats['routings_saved'] += 1 + len(decision['secondary_destinations'])
+
+            self.logger.info(f"Duplicate {source_type} content, reusing {existing['content_id']}")
+            return existing['content_id']
+
+        content_id = f"{source_type}_{datetime.now().timestamp()}_{fingerprint[:16]}"
 
         ingested = IngestedContent(
             content_id=content_id,
             source_type=source_type,
             raw_content=content,
             processed_content="",  # Will be filled by processing
-            metadata=metadata or {}
+            metadata={**(metadata or {}), 'fingerprint': fingerprint}
         )
 
+        self._register_fingerprint(fingerprint, content_id, source_type)
+
         self.ingest_queue.append(ingested)
         self._save_pending_ingests()
 
@@ -147,36 +307,212 @@ class SantiagoMultimodalIngestOfficer:
 
     def process_ingest_queue(self) -> int:
         """Process all items in the ingest queue"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.process_ingest_queue_async())
+
+        # Already inside an event loop - fall back to serial processing
+        self.logger.warning(
+            "process_ingest_queue called from a running event loop; processing serially "
+            "without worker lanes or priorities. Await process_ingest_queue_async instead."
+        )
         processed_count = 0
-
         while self.ingest_queue:
             content = self.ingest_queue.pop(0)
-
+            started = time.perf_counter()
             try:
-                # Process based on type
                 processed_content = self._process_content(content)
-
-                if processed_content:
-                    content.processed_content = processed_content
-
-                    # Make routing decision
-                    routing_decision = self._decide_routing(content)
-
-                    # Queue for routing
-                    self.routing_queue.append((content, routing_decision))
-
-                    processed_count += 1
-                    self.logger.info(f"Processed content: {content.content_id}")
-
-                else:
-                    self.logger.warning(f"Failed to process content: {content.content_id}")
-
             except Exception as e:
                 self.logger.error(f"Error processing content {content.content_id}: {e}")
+                processed_content = None
+            if self._complete_processing(content, processed_content, started):
+                processed_count += 1
 
+        self._sort_routing_queue()
         self._save_pending_ingests()
+        self._save_fingerprint_index()
         return processed_count
 
+    async def process_ingest_queue_async(self) -> int:
+        """Process the ingest queue through per-type bounded worker pools.
+
+        Each source type gets its own lane with a fixed number of workers, so a
+        slow video or PDF item only occupies its own lane. Within a lane,
+        human-attention content is picked up first.
+        """
+        if not self.ingest_queue:
+            return 0
+
+        items = self.ingest_queue
+        self.ingest_queue = []
+
+        lanes: Dict[str, asyncio.PriorityQueue] = {}
+        for sequence, content in enumerate(items):
+            lane = lanes.setdefault(content.source_type, asyncio.PriorityQueue())
+            lane.put_nowait((self._ingest_priority(content), sequence, time.perf_counter(), content))
+
+        results: List[bool] = []
+
+        async def lane_worker(source_type: str, lane: asyncio.PriorityQueue):
+            while True:
+                try:
+                    _, _, enqueued, content = lane.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                self._record_stage_metric("queue_wait", source_type, time.perf_counter() - enqueued)
+                started = time.perf_counter()
+                try:
+                    processed_content = await self._process_content_async(content)
+                except Exception as e:
+                    self.logger.error(f"Error processing content {content.content_id}: {e}")
+                    processed_content = None
+                results.append(self._complete_processing(content, processed_content, started))
+
+        workers = []
+        for source_type, lane in lanes.items():
+            pool_size = min(self.WORKER_POOL_LIMITS.get(source_type, 1), lane.qsize())
+            workers.extend(
+                asyncio.create_task(lane_worker(source_type, lane)) for _ in range(pool_size)
+            )
+        await asyncio.gather(*workers)
+
+        self._sort_routing_queue()
+        self._save_pending_ingests()
+        self._save_fingerprint_index()
+        return sum(results)
+
+    async def _process_content_async(self, content: IngestedContent) -> Optional[str]:
+        """Run content processing on the worker pool for its source type"""
+        kind = self.WORKER_POOL_KINDS.get(content.source_type, 'inline')
+        if kind == 'inline':
+            return self._process_content(content)
+
+        loop = asyncio.get_running_loop()
+        if kind == 'process' and content.source_type == 'pdf':
+            if not isinstance(content.raw_content, Path):
+                return ""
+            return await loop.run_in_executor(self._get_process_pool(), _extract_pdf_text, content.raw_content)
+
+        return await loop.run_in_executor(self._get_thread_pool(), self._process_content, content)
+
+    def _complete_processing(self, content: IngestedContent, processed_content: Optional[str],
+                             started: float) -> bool:
+        """Record processing outcome and queue the content for routing"""
+        elapsed = time.perf_counter() - started
+        fingerprint = content.metadata.get('fingerprint')
+        if not processed_content:
+            self._record_stage_metric("process", content.source_type, elapsed, success=False)
+            # Forget the fingerprint so the content can be retried
+            self._forget_fingerprint(fingerprint)
+            self.logger.warning(f"Failed to process content: {content.content_id}")
+            return False
+
+        content.processed_content = processed_content
+        self._record_stage_metric("process", content.source_type, elapsed)
+
+        routing_decision = self._decide_routing(content)
+        self.routing_queue.append((content, routing_decision))
+
+        record = self.fingerprint_index.get(fingerprint)
+        if record is not None:
+            record['processed_content'] = processed_content
+            record['routing_decision'] = asdict(routing_decision)
+            record['process_seconds'] = elapsed
+        self.logger.info(f"Processed content: {content.content_id}")
+        return True
+
+    def _ingest_priority(self, content: IngestedContent) -> int:
+        """Priority lane for content before processing (0 = human attention, 1 = normal)"""
+        metadata = content.metadata or {}
+        if metadata.get('requires_human_attention') or metadata.get('urgency') in ('immediate', 'high'):
+            return 0
+        if isinstance(content.raw_content, str):
+            text = content.raw_content.lower()
+            if any(keyword in text for keyword in self.PRIORITY_KEYWORDS):
+                return 0
+        return 1
+
+    def _sort_routing_queue(self):
+        """Move human-attention content to the front of the routing queue"""
+        urgency_rank = {'immediate': 0, 'high': 1}
+        self.routing_queue.sort(
+            key=lambda item: (0 if item[1].requires_human_attention else 1,
+                              urgency_rank.get(item[1].urgency, 2))
+        )
+
+    def _register_shutdown(self):
+        """Release worker pools at interpreter exit if the owner never calls shutdown()"""
+        if self._process_pool is None and self._thread_pool is None:
+            atexit.register(self.shutdown)
+
+    def _get_process_pool(self) -> Executor:
+        """Get the process pool used for CPU-heavy parsing"""
+        if self._process_pool is None:
+            self._register_shutdown()
+            if self.use_process_pool:
+                self._process_pool = ProcessPoolExecutor(max_workers=self.WORKER_POOL_LIMITS['pdf'])
+            else:
+                self._process_pool = ThreadPoolExecutor(
+                    max_workers=self.WORKER_POOL_LIMITS['pdf'], thread_name_prefix="first-mate-cpu"
+                )
+        return self._process_pool
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        """Get the thread pool used for blocking media processing"""
+        if self._thread_pool is None:
+            self._register_shutdown()
+            max_workers = sum(
+                limit for source_type, limit in self.WORKER_POOL_LIMITS.items()
+                if self.WORKER_POOL_KINDS.get(source_type) == 'thread'
+            )
+            self._thread_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="first-mate-media")
+        return self._thread_pool
+
+    def shutdown(self):
+        """Shut down worker pools"""
+        atexit.unregister(self.shutdown)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True)
+            self._process_pool = None
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=True)
+            self._thread_pool = None
+
+    def _record_stage_metric(self, stage: str, source_type: str, elapsed: float, success: bool = True):
+        """Record latency for a pipeline stage"""
+        metrics = self.stage_metrics.setdefault(stage, {}).setdefault(source_type, {
+            'count': 0,
+            'failed': 0,
+            'total_seconds': 0.0,
+            'max_seconds': 0.0,
+            'first_started': time.time() - elapsed,
+            'last_finished': 0.0
+        })
+        metrics['count'] += 1
+        if not success:
+            metrics['failed'] += 1
+        metrics['total_seconds'] += elapsed
+        metrics['max_seconds'] = max(metrics['max_seconds'], elapsed)
+        metrics['last_finished'] = time.time()
+
+    def _get_stage_statistics(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Summarize per-stage throughput and latency"""
+        summary = {}
+        for stage, by_type in self.stage_metrics.items():
+            summary[stage] = {}
+            for source_type, metrics in by_type.items():
+                count = metrics['count']
+                window = max(metrics['last_finished'] - metrics['first_started'], 1e-9)
+                summary[stage][source_type] = {
+                    'count': count,
+                    'failed': metrics['failed'],
+                    'avg_latency_ms': (metrics['total_seconds'] / count) * 1000 if count else 0.0,
+                    'max_latency_ms': metrics['max_seconds'] * 1000,
+                    'throughput_per_sec': count / window
+                }
+        return summary
+
     def _process_content(self, content: IngestedContent) -> Optional[str]:
         """Process content based on its type"""
         if content.source_type == 'text':
@@ -211,11 +547,9 @@ class SantiagoMultimodalIngestOfficer:
 
     def _process_pdf(self, content: IngestedContent) -> str:
         """Extract text from PDF"""
-        # Placeholder - would use PyPDF2 or similar
         if isinstance(content.raw_content, Path):
             try:
-                # Simulate PDF processing
-                return f"[PDF Content from {content.raw_content.name}] Extracted text would go here."
+                return _extract_pdf_text(content.raw_content)
             except Exception as e:
                 self.logger.error(f"Error processing PDF: {e}")
                 return ""
@@ -325,6 +659,7 @@ class SantiagoMultimodalIngestOfficer:
 
         while self.routing_queue:
             content, decision = self.routing_queue.pop(0)
+            started = time.perf_counter()
 
             try:
                 # Route to primary destination
@@ -339,9 +674,11 @@ class SantiagoMultimodalIngestOfficer:
                     self._notify_human_attention(content, decision)
 
                 routed_count += 1
+                self._record_stage_metric("route", content.source_type, time.perf_counter() - started)
                 self.logger.info(f"Routed content {content.content_id} to {decision.primary_destination}")
 
             except Exception as e:
+                self._record_stage_metric("route", content.source_type, time.perf_counter() - started, success=False)
                 self.logger.error(f"Error routing content {content.content_id}: {e}")
 
         return routed_count
@@ -410,7 +747,12 @@ class SantiagoMultimodalIngestOfficer:
             "total_pending": total_ingested,
             "in_ingest_queue": len(self.ingest_queue),
             "in_routing_queue": len(self.routing_queue),
-            "by_type": type_counts
+            "by_type": type_counts,
+            "stages": self._get_stage_statistics(),
+            "dedupe": {
+                "unique_fingerprints": len(self.fingerprint_index),
+                **self.dedupe_stats
+            }
         }
 
     def cleanup_old_content(self, days_old: int = 30) -> int:
@@ -431,6 +773,16 @@ class SantiagoMultimodalIngestOfficer:
             except Exception as e:
                 self.logger.error(f"Error cleaning up {routing_file}: {e}")
 
+        # Expire old content fingerprints so the index stays bounded
+        expired = [
+            fingerprint for fingerprint, record in self.fingerprint_index.items()
+            if datetime.fromisoformat(record['first_seen']) < cutoff_date
+        ]
+        for fingerprint in expired:
+            self._forget_fingerprint(fingerprint)
+        if expired:
+            self._save_fingerprint_index()
+
         if cleaned_count > 0:
             self.logger.info(f"Cleaned up {cleaned_count} old ingest files")
 
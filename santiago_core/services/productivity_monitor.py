@@ -8,22 +8,26 @@ stalled work and triggering appropriate actions.
 
 Key features:
 - Monitors active kanban cards (in_progress state)
-- Tracks time spent on each task
+- Tracks time spent on each task, updated from kanban card change events
 - Detects tasks stuck for more than configurable threshold (default: 5 minutes)
+  using a deadline heap, so each check only visits tasks crossing a threshold
 - Triggers alerts and potential escalation actions
 - Integrates with kanban workflow for automatic task reassignment
 - Provides productivity metrics and reports
 """
 
 import asyncio
+import heapq
+import itertools
 import signal
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 import json
 
+from santiago_core.services.kanban_events import KanbanChangeEvent, KanbanSubscription
 from santiago_core.services.kanban_service import SantiagoKanbanService
 
 
@@ -41,6 +45,12 @@ class ProductivityMonitor:
         self.task_timers: Dict[str, Dict[str, Any]] = {}  # card_id -> timer data
         self.alerted_tasks: set = set()  # Tasks we've already alerted about
 
+        # Deadline heap: (deadline, seq, card_id, timer_id, generation, kind)
+        # Entries are invalidated lazily when a timer is removed or sees activity
+        self._deadlines: List[Tuple[datetime, int, str, int, int, str]] = []
+        self._deadline_seq = itertools.count()
+        self.subscription: Optional[KanbanSubscription] = None
+
         # Setup logging
         self.logger = logging.getLogger('ProductivityMonitor')
         self.logger.setLevel(logging.INFO)
@@ -57,6 +67,7 @@ class ProductivityMonitor:
             'escalation_threshold_minutes': 15,  # Escalate after 15 minutes
             'auto_reassign_stuck_tasks': False,  # Whether to auto-reassign stuck tasks
             'target_boards': [],  # Empty means monitor all boards
+            'event_driven': True,  # Track card moves and activity from change events
             'alert_channels': ['log'],  # Where to send alerts: log, email, slack, etc.
             'productivity_report_interval_hours': 24,  # Daily productivity reports
             'log_level': 'INFO'
@@ -75,11 +86,20 @@ class ProductivityMonitor:
             # Initial discovery and baseline
             await self._initialize_monitoring()
 
+            if self.config.get('event_driven', True):
+                self.subscription = self.kanban_service.event_feed.subscribe(
+                    event_types=['move', 'tag', 'comment'],
+                    board_ids=self.config['target_boards']
+                )
+
             # Main monitoring loop
             while self.running:
                 try:
-                    await self._check_productivity()
-                    await asyncio.sleep(self.config['check_interval_seconds'])
+                    if self.subscription:
+                        await self._wait_and_apply_changes()
+                    else:
+                        await self._check_productivity()
+                        await asyncio.sleep(self.config['check_interval_seconds'])
                 except Exception as e:
                     self.logger.error(f"❌ Error in monitoring loop: {e}")
                     await asyncio.sleep(self.config['check_interval_seconds'])
@@ -87,6 +107,9 @@ class ProductivityMonitor:
         except Exception as e:
             self.logger.error(f"❌ Fatal error in productivity monitor: {e}")
         finally:
+            if self.subscription:
+                self.subscription.close()
+                self.subscription = None
             self.logger.info("🛑 Productivity Monitor Service stopped")
 
     def _signal_handler(self, signum, frame):
@@ -142,45 +165,147 @@ class ProductivityMonitor:
                     card_id = item['card_id']
                     if card_id not in self.task_timers:
                         # Initialize timer for this task
-                        self.task_timers[card_id] = {
-                            'board_id': board_id,
-                            'card_id': card_id,
-                            'title': item['title'],
-                            'assignee': item.get('assignee', 'unassigned'),
-                            'start_time': datetime.now(),
-                            'last_activity': datetime.now(),
-                            'status': 'active',
-                            'alerts_sent': 0,
-                            'escalated': False
-                        }
-                        self.logger.info(f"⏱️  Started monitoring: {item['title']} (assigned to {item.get('assignee', 'unassigned')})")
+                        self._start_task_timer(board_id, card_id, item['title'], item.get('assignee'))
 
             except Exception as e:
                 self.logger.error(f"❌ Error scanning board {board_id}: {e}")
 
         self.logger.info(f"✅ Now monitoring {len(self.task_timers)} active task(s)")
 
+    async def _wait_and_apply_changes(self):
+        """Apply card change events until the next productivity check is due"""
+        interval = self.config['check_interval_seconds']
+        if self.last_check_time is None:
+            await self._check_productivity()
+
+        # Wake up for the next periodic check or the next task deadline, whichever is first
+        timeout = interval - (datetime.now() - self.last_check_time).total_seconds()
+        if self._deadlines:
+            timeout = min(timeout, (self._deadlines[0][0] - datetime.now()).total_seconds())
+
+        events = await self.subscription.get_batch(timeout=max(0.0, timeout))
+        for event in events:
+            self._apply_change_event(event)
+
+        now = datetime.now()
+        if ((now - self.last_check_time).total_seconds() >= interval or
+                (self._deadlines and self._deadlines[0][0] <= now)):
+            await self._check_productivity()
+
+    def _apply_change_event(self, event: KanbanChangeEvent):
+        """Update task timers from a single card change"""
+        card_id = event.card_id
+
+        if event.event_type == 'move':
+            if event.column == 'in_progress' and card_id not in self.task_timers:
+                self._start_task_timer(event.board_id, card_id, event.card.get('title', card_id),
+                                       event.card.get('assignee'))
+            elif event.column != 'in_progress' and card_id in self.task_timers:
+                timer = self._remove_task_timer(card_id)
+                self.alerted_tasks.discard(card_id)
+                self.logger.info(f"✅ Stopped monitoring: {timer['title']} (moved to {event.column})")
+            return
+
+        # Comments and tags count as activity, except our own escalation comments
+        timer = self.task_timers.get(card_id)
+        if timer and event.actor != 'productivity-monitor':
+            self.record_activity(card_id)
+
+    def record_activity(self, card_id: str):
+        """Record progress on a task, pushing back its stuck deadline"""
+        timer = self.task_timers.get(card_id)
+        if timer is None:
+            return
+
+        timer['last_activity'] = datetime.now()
+        timer['escalated'] = False
+        timer['generation'] += 1  # Invalidates the previously scheduled stuck deadline
+        self.alerted_tasks.discard(card_id)
+        self._schedule_stuck_deadline(card_id)
+
+    def _start_task_timer(self, board_id: str, card_id: str, title: str, assignee: Optional[str]):
+        """Start tracking an active task"""
+        self.task_timers[card_id] = {
+            'board_id': board_id,
+            'card_id': card_id,
+            'title': title,
+            'assignee': assignee or 'unassigned',
+            'start_time': datetime.now(),
+            'last_activity': datetime.now(),
+            'status': 'active',
+            'alerts_sent': 0,
+            'escalated': False,
+            'timer_id': next(self._deadline_seq),
+            'generation': 0
+        }
+        self._schedule_stuck_deadline(card_id)
+        self._schedule_deadline(card_id, self.task_timers[card_id]['start_time'] + timedelta(hours=24), 'expire')
+        self.logger.info(f"⏱️  Started monitoring: {title} (assigned to {assignee or 'unassigned'})")
+
+    def _remove_task_timer(self, card_id: str) -> Dict[str, Any]:
+        """Stop tracking a task; its heap entries become stale"""
+        self.alerted_tasks.discard(card_id)
+        return self.task_timers.pop(card_id)
+
+    def _schedule_deadline(self, card_id: str, deadline: datetime, kind: str):
+        """Push a deadline for a task onto the heap"""
+        timer = self.task_timers[card_id]
+        heapq.heappush(self._deadlines, (
+            deadline, next(self._deadline_seq), card_id, timer['timer_id'], timer['generation'], kind
+        ))
+
+        # Drop stale entries once they dominate the heap
+        if len(self._deadlines) > 4 * len(self.task_timers) + 64:
+            self._deadlines = [entry for entry in self._deadlines if self._is_live_deadline(entry)]
+            heapq.heapify(self._deadlines)
+
+    def _schedule_stuck_deadline(self, card_id: str):
+        """Schedule the next stuck alert or escalation for a task"""
+        timer = self.task_timers[card_id]
+        if timer.get('escalated', False):
+            return  # Nothing further to detect until new activity
+
+        if card_id in self.alerted_tasks:
+            threshold = self.config['escalation_threshold_minutes']
+        else:
+            threshold = self.config['stuck_threshold_minutes']
+        self._schedule_deadline(card_id, timer['last_activity'] + timedelta(minutes=threshold), 'stuck')
+
+    def _is_live_deadline(self, entry: Tuple[datetime, int, str, int, int, str]) -> bool:
+        """Check whether a heap entry still refers to the current timer state"""
+        _, _, card_id, timer_id, generation, kind = entry
+        timer = self.task_timers.get(card_id)
+        if timer is None or timer['timer_id'] != timer_id:
+            return False
+        return kind == 'expire' or timer['generation'] == generation
+
+    def _pop_due_deadlines(self, now: datetime) -> List[Tuple[str, str]]:
+        """Pop all live deadlines that have passed"""
+        due = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            entry = heapq.heappop(self._deadlines)
+            if self._is_live_deadline(entry):
+                due.append((entry[2], entry[5]))
+        return due
+
     async def _check_productivity(self):
         """Check productivity by examining active tasks"""
         self.last_check_time = datetime.now()
         current_time = datetime.now()
 
-        # Check for stuck tasks
-        stuck_tasks = []
-        for card_id, timer in self.task_timers.items():
-            time_since_activity = current_time - timer['last_activity']
-            minutes_stuck = time_since_activity.total_seconds() / 60
+        # Only visit tasks whose deadline has passed
+        for card_id, kind in self._pop_due_deadlines(current_time):
+            timer = self.task_timers.get(card_id)
+            if timer is None:
+                continue
 
-            # Update timer status
-            if minutes_stuck >= self.config['stuck_threshold_minutes']:
-                stuck_tasks.append((card_id, timer, minutes_stuck))
+            if kind == 'expire':
+                await self._cleanup_completed_task(card_id, current_time)
+                continue
 
-        # Process stuck tasks
-        for card_id, timer, minutes_stuck in stuck_tasks:
+            minutes_stuck = (current_time - timer['last_activity']).total_seconds() / 60
             await self._handle_stuck_task(card_id, timer, minutes_stuck)
-
-        # Clean up completed tasks (this would be enhanced with actual completion detection)
-        await self._cleanup_completed_tasks()
+            self._schedule_stuck_deadline(card_id)
 
         # Periodic productivity report
         await self._generate_productivity_report()
@@ -317,23 +442,12 @@ class ProductivityMonitor:
         except Exception as e:
             self.logger.error(f"❌ Error considering reassignment: {e}")
 
-    async def _cleanup_completed_tasks(self):
-        """Clean up timers for completed tasks"""
-        # This is a simplified version - in practice, you'd want to detect
-        # when tasks actually move out of in_progress status
-        current_time = datetime.now()
-
-        # Remove tasks that have been monitored for more than 24 hours
-        # (assuming they're either completed or genuinely stuck)
-        to_remove = []
-        for card_id, timer in self.task_timers.items():
-            if current_time - timer['start_time'] > timedelta(hours=24):
-                to_remove.append(card_id)
-
-        for card_id in to_remove:
-            timer = self.task_timers[card_id]
-            self.logger.info(f"🧹 Cleaning up old task timer: {timer['title']} (monitored for {(current_time - timer['start_time']).total_seconds() / 3600:.1f} hours)")
-            del self.task_timers[card_id]
+    async def _cleanup_completed_task(self, card_id: str, current_time: datetime):
+        """Clean up the timer of a task monitored for more than 24 hours"""
+        # Tasks that leave in_progress are removed from card move events;
+        # anything still here after 24 hours is either completed elsewhere or genuinely stuck
+        timer = self._remove_task_timer(card_id)
+        self.logger.info(f"🧹 Cleaning up old task timer: {timer['title']} (monitored for {(current_time - timer['start_time']).total_seconds() / 3600:.1f} hours)")
 
     async def _generate_productivity_report(self):
         """Generate periodic productivity reports"""
@@ -0,0 +1,212 @@
+"""
+Provenance Log Writer for Santiago Factory
+
+Background writer for the JSONL provenance logs kept by proxy agents.
+Callers enqueue entries and return immediately; a single writer thread
+batches entries per file, flushes periodically, rotates files that grow
+past a size limit and optionally gzips rotated files. Disk latency no longer
+blocks the event loop, and bursts are absorbed by the queue.
+"""
+
+import atexit
+import gzip
+import json
+import logging
+import queue
+import shutil
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+class ProvenanceLogWriter:
+    """Queue-backed, batching JSONL writer shared by all proxies"""
+
+    def __init__(
+        self,
+        flush_interval: float = 1.0,
+        batch_size: int = 500,
+        max_bytes: int = 50 * 1024 * 1024,
+        compress_rotated: bool = False,
+    ):
+        """
+        Args:
+            flush_interval: Maximum seconds an entry waits before being written
+            batch_size: Write as soon as this many entries are queued
+            max_bytes: Rotate a log file once it grows past this size (0 disables)
+            compress_rotated: Gzip rotated files
+        """
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self.compress_rotated = compress_rotated
+        self.logger = logging.getLogger(__name__)
+
+        self._queue: "queue.Queue[Optional[Tuple[Path, str]]]" = queue.Queue()
+        self._known_files: Set[Path] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.metrics = {
+            "entries_written": 0,
+            "batches_written": 0,
+            "bytes_written": 0,
+            "rotations": 0,
+            "write_errors": 0,
+            "max_queue_depth": 0,
+        }
+
+    def write(self, path: Path, entry: Dict[str, Any]) -> None:
+        """
+        Queue an entry for appending to a JSONL file. Never blocks on disk,
+        except to create a file the first time it is written to.
+
+        Args:
+            path: Log file to append to
+            entry: JSON-serializable log entry
+        """
+        if self._closed:
+            raise RuntimeError("Provenance log writer is closed")
+
+        line = json.dumps(entry, default=str) + "\n"
+        path = Path(path)
+
+        # Create new files up front so they are visible as soon as the call returns
+        if path not in self._known_files:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch(exist_ok=True)
+            self._known_files.add(path)
+
+        self._ensure_started()
+        self._queue.put((path, line))
+        depth = self._queue.qsize()
+        if depth > self.metrics["max_queue_depth"]:
+            self.metrics["max_queue_depth"] = depth
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until everything queued so far is on disk.
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        if self._thread is None:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Flush and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get writer metrics"""
+        return {**self.metrics, "queue_depth": self._queue.qsize()}
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="provenance-log-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Writer loop: collect a batch, then write it grouped by file"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            while len(batch) < self.batch_size:
+                # Take whatever is already queued; wait up to the flush interval for more
+                try:
+                    remaining = deadline - time.monotonic()
+                    next_item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if next_item is None:
+                    stop = True
+                    break
+                batch.append(next_item)
+
+            self._write_batch(batch)
+            for _ in range(len(batch) + (1 if stop else 0)):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, batch: List[Tuple[Path, str]]) -> None:
+        by_file: Dict[Path, List[str]] = defaultdict(list)
+        for path, line in batch:
+            by_file[path].append(line)
+
+        for path, lines in by_file.items():
+            data = "".join(lines)
+            try:
+                self._rotate_if_needed(path)
+                with open(path, "a") as f:
+                    f.write(data)
+                self.metrics["entries_written"] += len(lines)
+                self.metrics["bytes_written"] += len(data)
+            except OSError as e:
+                self.metrics["write_errors"] += 1
+                self.logger.error(f"Failed to write provenance log {path}: {e}")
+        self.metrics["batches_written"] += 1
+
+    def _rotate_if_needed(self, path: Path) -> None:
+        """Move a full log aside as <stem>.<n><suffix>[.gz]"""
+        if not self.max_bytes or not path.exists() or path.stat().st_size < self.max_bytes:
+            return
+
+        index = 1
+        while True:
+            rotated = path.with_name(f"{path.stem}.{index}{path.suffix}")
+            if not rotated.exists() and not rotated.with_name(rotated.name + ".gz").exists():
+                break
+            index += 1
+
+        path.rename(rotated)
+        if self.compress_rotated:
+            with open(rotated, "rb") as src, gzip.open(rotated.with_name(rotated.name + ".gz"), "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            rotated.unlink()
+        self.metrics["rotations"] += 1
+        self.logger.info(f"Rotated provenance log {path.name} -> {rotated.name}")
+
+
+# Singleton instance
+_provenance_log_writer: Optional[ProvenanceLogWriter] = None
+
+
+def get_provenance_log_writer() -> ProvenanceLogWriter:
+    """
+    Get or create the process-wide provenance log writer.
+
+    Returns:
+        ProvenanceLogWriter instance
+    """
+    global _provenance_log_writer
+
+    if _provenance_log_writer is None:
+        _provenance_log_writer = ProvenanceLogWriter()
+        atexit.register(_provenance_log_writer.close)
+
+    return _provenance_log_writer
@@ -0,0 +1,334 @@
+"""
+LLM Rate Limiter for Santiago Factory
+
+Per-provider/per-model limits shared by every proxy and the vLLM client:
+token buckets for requests/min and tokens/min, plus an adaptive in-flight
+limit. The in-flight limit grows additively while calls succeed within the
+latency target and shrinks multiplicatively on 429s or slow responses
+(AIMD), so bursts from several proxies back off before the provider starts
+rejecting them.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional, Tuple
+
+
+@dataclass
+class RateLimits:
+    """Limits for one provider/model"""
+    requests_per_minute: int = 60
+    tokens_per_minute: int = 90000
+    max_in_flight: int = 8
+    min_in_flight: int = 1
+    latency_target_seconds: float = 20.0  # Slower responses shrink concurrency
+
+
+# Defaults per provider; override with RateLimiterRegistry.configure()
+DEFAULT_LIMITS = {
+    "openai": RateLimits(requests_per_minute=500, tokens_per_minute=200000, max_in_flight=16),
+    "xai": RateLimits(requests_per_minute=60, tokens_per_minute=100000, max_in_flight=8),
+    "vllm": RateLimits(requests_per_minute=6000, tokens_per_minute=10000000, max_in_flight=32,
+                       latency_target_seconds=5.0),
+}
+
+DEFAULT_MAX_TOKENS = 1024  # Completion budget assumed when a call sets none
+
+
+def estimate_tokens(text: str, max_tokens: Optional[int] = None) -> int:
+    """Rough token estimate for a request: ~4 characters per prompt token plus completion budget"""
+    return len(text) // 4 + (max_tokens or DEFAULT_MAX_TOKENS)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Check whether an exception is a provider 429 / rate limit response"""
+    if getattr(error, "status_code", None) == 429:
+        return True
+    message = str(error).lower()
+    return "429" in message or "rate limit" in message
+
+
+class TokenBucket:
+    """Continuously refilling token bucket"""
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_second)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount tokens are available (0 if available now)"""
+        self._refill()
+        amount = min(amount, self.capacity)  # Oversized requests wait for a full bucket
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_per_second
+
+    def consume(self, amount: float) -> None:
+        """Take tokens; the balance may go negative when reconciling actual usage"""
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+    def refund(self, amount: float) -> None:
+        """Return tokens that were reserved but not used"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the provider rejected a request"""
+        self._refill()
+        self.tokens = min(self.tokens, 0.0)
+
+
+class ProviderRateLimiter:
+    """Limits and adaptive concurrency for a single provider/model"""
+
+    def __init__(self, provider: str, model: str, limits: RateLimits):
+        self.provider = provider
+        self.model = model
+        self.limits = limits
+        self.request_bucket = TokenBucket(limits.requests_per_minute, limits.requests_per_minute / 60.0)
+        self.token_bucket = TokenBucket(limits.tokens_per_minute, limits.tokens_per_minute / 60.0)
+        self.concurrency_limit = float(limits.max_in_flight)
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.logger = logging.getLogger(__name__)
+        self.metrics = {
+            "requests": 0,
+            "throttled": 0,  # 429 responses seen
+            "slow_responses": 0,
+            "errors": 0,
+            "queued_seconds": 0.0,
+            "latency_total_seconds": 0.0,
+            "tokens_used": 0,
+            "abandoned": 0,
+        }
+
+    async def acquire(self, estimated_tokens: int) -> float:
+        """
+        Wait for a concurrency slot and bucket capacity.
+
+        Args:
+            estimated_tokens: Tokens to reserve against the tokens/min bucket
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = time.monotonic()
+
+        # Concurrency slot first so queued callers don't drain the buckets
+        while self.in_flight >= int(self.concurrency_limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                else:
+                    self._wake_waiters()  # Pass on the wake-up we were given
+                raise
+        self.in_flight += 1
+
+        try:
+            while True:
+                wait = max(self.request_bucket.wait_time(1), self.token_bucket.wait_time(estimated_tokens))
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            self._release_slot()
+            raise
+
+        self.request_bucket.consume(1)
+        self.token_bucket.consume(estimated_tokens)
+        queued = time.monotonic() - started
+        self.metrics["queued_seconds"] += queued
+        return queued
+
+    def release(
+        self,
+        latency: float,
+        estimated_tokens: int,
+        actual_tokens: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Record the outcome of a call and adjust concurrency (AIMD).
+
+        Args:
+            latency: Call duration in seconds
+            estimated_tokens: Tokens reserved in acquire()
+            actual_tokens: Tokens reported by the provider, if known
+            error: Exception raised by the call, if any
+        """
+        self._release_slot()
+        self.metrics["requests"] += 1
+        self.metrics["latency_total_seconds"] += latency
+
+        if actual_tokens is not None:
+            self.metrics["tokens_used"] += actual_tokens
+            difference = estimated_tokens - actual_tokens
+            if difference > 0:
+                self.token_bucket.refund(difference)
+            else:
+                self.token_bucket.consume(-difference)
+
+        if error is not None and is_rate_limit_error(error):
+            self.metrics["throttled"] += 1
+            self.request_bucket.drain()
+            self._decrease(0.5)
+            self.logger.warning(
+                f"Rate limited by {self.provider}/{self.model}; "
+                f"concurrency limit now {int(self.concurrency_limit)}"
+            )
+        elif error is not None:
+            self.metrics["errors"] += 1
+        elif latency > self.limits.latency_target_seconds:
+            self.metrics["slow_responses"] += 1
+            self._decrease(0.9)
+        else:
+            # Additive increase: roughly +1 slot per full window of successful calls
+            self.concurrency_limit = min(
+                float(self.limits.max_in_flight), self.concurrency_limit + 1.0 / self.concurrency_limit
+            )
+
+        self._wake_waiters()
+
+    def abandon(self) -> None:
+        """Free the slot of a call that was cancelled before completing"""
+        self.metrics["abandoned"] += 1
+        self._release_slot()
+
+    def _decrease(self, factor: float) -> None:
+        self.concurrency_limit = max(float(self.limits.min_in_flight), self.concurrency_limit * factor)
+
+    def _release_slot(self) -> None:
+        self.in_flight = max(0, self.in_flight - 1)
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        """Wake as many queued callers as there are free slots"""
+        free = int(self.concurrency_limit) - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get limiter metrics"""
+        requests = self.metrics["requests"]
+        return {
+            **self.metrics,
+            "in_flight": self.in_flight,
+            "queued": len(self._waiters),
+            "concurrency_limit": int(self.concurrency_limit),
+            "avg_latency_seconds": self.metrics["latency_total_seconds"] / requests if requests else 0.0,
+        }
+
+
+class RateLimitedCall:
+    """Async context manager wrapping one upstream call"""
+
+    def __init__(self, limiter: ProviderRateLimiter, estimated_tokens: int):
+        self.limiter = limiter
+        self.estimated_tokens = estimated_tokens
+        self.actual_tokens: Optional[int] = None
+        self.queued_seconds = 0.0
+        self.latency = 0.0
+        self._started = 0.0
+
+    def record_usage(self, response: Any) -> None:
+        """Record actual token usage from an OpenAI-compatible response"""
+        usage = getattr(response, "usage", None)
+        total = getattr(usage, "total_tokens", None) if usage is not None else None
+        if isinstance(total, int):
+            self.actual_tokens = total
+
+    async def __aenter__(self) -> "RateLimitedCall":
+        self.queued_seconds = await self.limiter.acquire(self.estimated_tokens)
+        self._started = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        self.latency = time.monotonic() - self._started
+        if isinstance(exc, (asyncio.CancelledError, GeneratorExit)):
+            # Abandoned (a losing hedge or a stream closed early); don't let it skew AIMD
+            self.limiter.abandon()
+            return False
+        self.limiter.release(
+            self.latency,
+            self.estimated_tokens,
+            actual_tokens=self.actual_tokens,
+            error=exc if isinstance(exc, Exception) else None,
+        )
+        return False
+
+
+class RateLimiterRegistry:
+    """Process-wide registry of limiters keyed by (provider, model)"""
+
+    def __init__(self):
+        self.limiters: Dict[Tuple[str, str], ProviderRateLimiter] = {}
+        self.limits: Dict[str, RateLimits] = dict(DEFAULT_LIMITS)
+
+    def configure(self, provider: str, limits: RateLimits, model: Optional[str] = None) -> None:
+        """Set limits for a provider, or for one model of a provider"""
+        key = f"{provider}/{model}" if model else provider
+        self.limits[key] = limits
+        for (limiter_provider, limiter_model), limiter in list(self.limiters.items()):
+            if limiter_provider == provider and (model is None or limiter_model == model):
+                del self.limiters[(limiter_provider, limiter_model)]
+
+    def get(self, provider: str, model: str) -> ProviderRateLimiter:
+        """Get (or create) the limiter for a provider/model"""
+        key = (provider, model)
+        if key not in self.limiters:
+            limits = self.limits.get(f"{provider}/{model}") or self.limits.get(provider) or RateLimits()
+            self.limiters[key] = ProviderRateLimiter(provider, model, limits)
+        return self.limiters[key]
+
+    def limit(self, provider: str, model: str, estimated_tokens: int) -> RateLimitedCall:
+        """
+        Rate limit one call.
+
+        Usage:
+            async with registry.limit("openai", "gpt-5.1", tokens) as call:
+                response = await client.chat.completions.create(...)
+                call.record_usage(response)
+        """
+        return RateLimitedCall(self.get(provider, model), estimated_tokens)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get metrics for every limiter"""
+        return {f"{provider}/{model}": limiter.get_metrics()
+                for (provider, model), limiter in self.limiters.items()}
+
+
+# Singleton instance
+_rate_limiter_registry: Optional[RateLimiterRegistry] = None
+
+
+def get_rate_limiter_registry() -> RateLimiterRegistry:
+    """
+    Get or create the process-wide rate limiter registry.
+
+    Returns:
+        RateLimiterRegistry instance
+    """
+    global _rate_limiter_registry
+
+    if _rate_limiter_registry is None:
+        _rate_limiter_registry = RateLimiterRegistry()
+
+    return _rate_limiter_registry
@@ -0,0 +1,133 @@
+"""
+Request Coalescer for Santiago Factory
+
+Single-flight layer for upstream LLM calls. When several proxies issue the
+same request (same model, normalized instructions, tool and parameters)
+while one is already in flight, they all wait on that one upstream call
+instead of issuing their own, and each receives a copy of its result.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+def normalize_prompt(text: str) -> str:
+    """Collapse whitespace so formatting differences don't defeat coalescing"""
+    return " ".join(text.split())
+
+
+def make_request_key(provider: str, model: str, instructions: str, tool_name: str, params: Dict[str, Any]) -> str:
+    """
+    Build a coalescing key for an upstream request.
+
+    Args:
+        provider: LLM provider name
+        model: Model name
+        instructions: System/role instructions sent with the request (whitespace-insensitive)
+        tool_name: Tool being invoked
+        params: Tool parameters (key order does not matter; values are compared exactly,
+            since whitespace inside them can be significant, e.g. code)
+
+    Returns:
+        Hex digest identifying the request
+    """
+    canonical = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "instructions": normalize_prompt(instructions),
+            "tool": tool_name,
+            "params": json.dumps(params, sort_keys=True, default=str),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RequestCoalescer:
+    """Shares one in-flight upstream call among concurrent identical requests"""
+
+    def __init__(self):
+        self.in_flight: Dict[str, asyncio.Future] = {}
+        self.logger = logging.getLogger(__name__)
+        self.metrics = {
+            "upstream_calls": 0,  # Calls actually issued
+            "coalesced_calls": 0,  # Calls that joined an in-flight request
+            "failed_calls": 0,
+            "max_waiters": 0,
+        }
+        self._waiters: Dict[str, int] = {}
+
+    def is_in_flight(self, key: str) -> bool:
+        """Check whether a request with this key is already running"""
+        return key in self.in_flight
+
+    async def run(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run call() once per key among concurrent callers.
+
+        The first caller starts the upstream call; callers arriving while it
+        is in flight wait for the same result. Exceptions are propagated to
+        every waiter. Cancelling one waiter does not cancel the shared call.
+
+        Args:
+            key: Request key from make_request_key
+            call: Zero-argument coroutine factory issuing the upstream call
+
+        Returns:
+            The call result (a private copy for joining callers)
+        """
+        task = self.in_flight.get(key)
+        if task is not None:
+            self.metrics["coalesced_calls"] += 1
+            self._waiters[key] += 1
+            self.metrics["max_waiters"] = max(self.metrics["max_waiters"], self._waiters[key])
+            self.logger.debug(f"Coalesced request {key[:12]} ({self._waiters[key]} waiters)")
+            return copy.deepcopy(await asyncio.shield(task))
+
+        task = asyncio.ensure_future(call())
+        self.in_flight[key] = task
+        self._waiters[key] = 1
+        self.metrics["upstream_calls"] += 1
+        task.add_done_callback(lambda t: self._on_done(key, t))
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: str, task: asyncio.Future) -> None:
+        """Forget a finished request so later calls go upstream again"""
+        if self.in_flight.get(key) is task:
+            del self.in_flight[key]
+            self._waiters.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            self.metrics["failed_calls"] += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get coalescing metrics"""
+        total = self.metrics["upstream_calls"] + self.metrics["coalesced_calls"]
+        return {
+            **self.metrics,
+            "in_flight": len(self.in_flight),
+            "saved_ratio": self.metrics["coalesced_calls"] / total if total else 0.0,
+        }
+
+
+# Singleton instance
+_request_coalescer: Optional[RequestCoalescer] = None
+
+
+def get_request_coalescer() -> RequestCoalescer:
+    """
+    Get or create the process-wide request coalescer.
+
+    Returns:
+        RequestCoalescer instance
+    """
+    global _request_coalescer
+
+    if _request_coalescer is None:
+        _request_coalescer = RequestCoalescer()
+
+    return _request_coalescer
@@ -1,18 +1,20 @@
 """
 Simple vLLM client wrapper for DGX-hosted OpenAI-compatible inference.
 
-This does not change the existing LLMRouter behavior; it provides a focused
-entry point for DGX vLLM services that can be used by experiments or
-integrated into the router in the future.
+Provides a focused entry point for DGX vLLM services that can be used by
+experiments; LLMRouter also routes SIMPLE tasks here when
+VLLM_ROUTING_ENABLED=true and the local queue is short.
 """
 
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from openai import AsyncOpenAI
 
+from santiago_core.services.rate_limiter import RateLimiterRegistry, estimate_tokens, get_rate_limiter_registry
+
 
 class VLLMClient:
     """
@@ -31,12 +33,16 @@ class VLLMClient:
         base_url: Optional[str] = None,
         model: Optional[str] = None,
         api_key: Optional[str] = None,
+        rate_limiter: Optional[RateLimiterRegistry] = None,
     ) -> None:
         self.base_url = base_url or os.getenv("VLLM_BASE_URL", "http://localhost:8000/v1")
         self.model = model or os.getenv("VLLM_MODEL_NAME", "mistral-7b-instruct")
         # vLLM can run without auth; provide a dummy key if needed
         self.api_key = api_key or os.getenv("VLLM_API_KEY", "EMPTY")
 
+        # Shared with the proxies so all callers of this server respect one limit
+        self.rate_limiter = rate_limiter or get_rate_limiter_registry()
+
         self._client = AsyncOpenAI(
             base_url=self.base_url,
             api_key=self.api_key,
@@ -61,18 +67,12 @@ class VLLMClient:
         Returns:
             A dict with at least 'content' and 'raw_response' keys.
         """
-        params: Dict[str, Any] = {
-            "model": self.model,
-            "messages": messages,
-            "temperature": temperature,
-        }
-        if max_tokens is not None:
-            params["max_completion_tokens"] = max_tokens
-
-        params.update(kwargs)
+        params = self._build_params(messages, temperature, max_tokens, **kwargs)
 
         try:
-            response = await self._client.chat.completions.create(**params)
+            async with self.rate_limiter.limit("vllm", self.model, self._estimate_tokens(messages, max_tokens)) as call:
+                response = await self._client.chat.completions.create(**params)
+                call.record_usage(response)
         except Exception as e:  # pragma: no cover - network error handling
             return {
                 "error": str(e),
@@ -90,4 +90,75 @@ class VLLMClient:
             "model": self.model,
         }
 
+    async def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a chat completion from the vLLM endpoint.
+
+        Args:
+            messages: List of role/content dicts.
+            temperature: Sampling temperature.
+            max_tokens: Optional max completion tokens.
+            **kwargs: Extra parameters forwarded to the client.
+
+        Yields:
+            Dicts with a 'delta' key as content arrives, then a final dict
+            with 'done': True and the full 'content' (or 'error' on failure).
+        """
+        params = self._build_params(messages, temperature, max_tokens, **kwargs)
+        params["stream"] = True
+        params.setdefault("stream_options", {"include_usage": True})
+
+        chunks: List[str] = []
+        try:
+            async with self.rate_limiter.limit("vllm", self.model, self._estimate_tokens(messages, max_tokens)) as call:
+                stream = await self._client.chat.completions.create(**params)
+                async for chunk in stream:
+                    call.record_usage(chunk)  # Usage arrives on the final chunk
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        chunks.append(delta)
+                        yield {"delta": delta, "provider": "vllm", "model": self.model}
+        except Exception as e:  # pragma: no cover - network error handling
+            yield {
+                "error": str(e),
+                "done": True,
+                "provider": "vllm",
+                "base_url": self.base_url,
+            }
+            return
+
+        yield {
+            "done": True,
+            "content": "".join(chunks),
+            "provider": "vllm",
+            "model": self.model,
+        }
+
+    def _build_params(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Build chat completion parameters."""
+        params: Dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+        }
+        if max_tokens is not None:
+            params["max_completion_tokens"] = max_tokens
+
+        params.update(kwargs)
+        return params
 
+    def _estimate_tokens(self, messages: List[Dict[str, str]], max_tokens: Optional[int]) -> int:
+        """Token estimate used for rate limiting."""
+        return estimate_tokens("".join(str(m.get("content", "")) for m in messages), max_tokens)
@@ -291,3 +291,65 @@ class TestAPIClients:
             assert "raw_response" in result
             assert result["raw_response"] == "This is plain text, not JSON"
             assert result["tool"] == "test_tool"
+
+
+class TestPromptCaching:
+    """Test prompt layout for prefix-cache reuse"""
+
+    def test_prefix_is_stable_and_params_last(self):
+        """Calls to the same tool share a byte-identical prefix"""
+        workspace = Path("./test_workspace")
+        workspace.mkdir(exist_ok=True)
+
+        pm = PMProxyAgent(workspace)
+
+        first = pm._build_prompt("create_feature", {"title": "Login", "priority": "high"})
+        second = pm._build_prompt("create_feature", {"priority": "low", "title": "Signup"})
+
+        prefix = pm._get_prompt_prefix("create_feature")
+        assert first.startswith(prefix) and second.startswith(prefix)
+        assert first[len(prefix):] == '{"priority":"high","title":"Login"}'
+
+    def test_canonical_params(self):
+        """Parameter order does not change the prompt"""
+        workspace = Path("./test_workspace")
+        workspace.mkdir(exist_ok=True)
+
+        pm = PMProxyAgent(workspace)
+
+        assert pm._build_prompt("create_feature", {"a": 1, "b": 2}) == pm._build_prompt("create_feature", {"b": 2, "a": 1})
+
+    @pytest.mark.asyncio
+    async def test_prompt_cache_hit_rate_reported(self):
+        """Cached prompt tokens from response usage are reported in metrics"""
+        workspace = Path("./test_workspace")
+        workspace.mkdir(exist_ok=True)
+
+        pm = PMProxyAgent(workspace)
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = '{"result": "ok"}'
+        mock_response.usage.prompt_tokens = 1000
+        mock_response.usage.prompt_tokens_details.cached_tokens = 800
+        mock_response.usage.total_tokens = 1100
+
+        from santiago_core.services.llm_router import LLMConfig, LLMProvider
+        mock_config = LLMConfig(
+            provider=LLMProvider.OPENAI,
+            model="gpt-5.1",
+            api_key="test-key",
+            api_base="https://api.openai.com/v1",
+        )
+
+        with patch("openai.AsyncOpenAI") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.chat.completions.create = AsyncMock(return_value=mock_response)
+            mock_client.return_value = mock_instance
+
+            await pm._call_openai_api(mock_config, "create_feature", {"title": "Login"})
+
+        prompt_cache = pm.get_metrics()["prompt_cache"]
+        assert prompt_cache["cached_tokens"] == 800
+        assert prompt_cache["cache_hits"] == 1
+        assert prompt_cache["hit_rate"] == 0.8
@@ -0,0 +1,99 @@
+"""
+Tests for the kanban card change feed
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from santiago_core.services.kanban_events import KanbanChangeEvent, KanbanEventFeed, get_kanban_event_feed
+
+
+def make_event(event_type="move", board_id="board-1", card_id="card-1", column="ready"):
+    """Create a test event"""
+    return KanbanChangeEvent(event_type=event_type, board_id=board_id, card_id=card_id, column=column)
+
+
+class TestKanbanEventFeed:
+    """Test publish/subscribe behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_subscriber_receives_event(self):
+        """Published events are delivered to subscribers"""
+        feed = KanbanEventFeed()
+        subscription = feed.subscribe()
+
+        feed.publish(make_event())
+        event = await subscription.get(timeout=1)
+
+        assert event.card_id == "card-1"
+        assert event.column == "ready"
+
+    @pytest.mark.asyncio
+    async def test_filters_by_type_and_board(self):
+        """Subscriptions only receive matching events"""
+        feed = KanbanEventFeed()
+        subscription = feed.subscribe(event_types=["move"], board_ids=["board-1"])
+
+        feed.publish(make_event(event_type="comment"))
+        feed.publish(make_event(board_id="board-2"))
+        feed.publish(make_event(card_id="card-2"))
+
+        events = await subscription.get_batch(timeout=1)
+
+        assert [e.card_id for e in events] == ["card-2"]
+
+    @pytest.mark.asyncio
+    async def test_get_times_out(self):
+        """Waiting without events returns nothing after the timeout"""
+        feed = KanbanEventFeed()
+        subscription = feed.subscribe()
+
+        assert await subscription.get(timeout=0.01) is None
+        assert await subscription.get_batch(timeout=0.01) == []
+
+    @pytest.mark.asyncio
+    async def test_bounded_queue_drops_oldest(self):
+        """Slow subscribers keep only the newest events"""
+        feed = KanbanEventFeed()
+        subscription = feed.subscribe(max_queue_size=2)
+
+        for i in range(3):
+            feed.publish(make_event(card_id=f"card-{i}"))
+
+        events = await subscription.get_batch(timeout=1)
+
+        assert [e.card_id for e in events] == ["card-1", "card-2"]
+        assert subscription.dropped_events == 1
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe(self):
+        """Closed subscriptions stop receiving events"""
+        feed = KanbanEventFeed()
+        subscription = feed.subscribe()
+        subscription.close()
+
+        feed.publish(make_event())
+
+        assert subscription.queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_message_bus_bridge(self):
+        """Events are forwarded to the message bus when bridged"""
+        feed = KanbanEventFeed()
+        bus = AsyncMock()
+        feed.bridge_to_message_bus(bus, topic="kanban.test")
+
+        feed.publish(make_event())
+        await asyncio.sleep(0)
+
+        bus.publish.assert_awaited_once()
+        topic, payload = bus.publish.call_args.args
+        assert topic == "kanban.test"
+        assert payload["card_id"] == "card-1"
+        assert isinstance(payload["timestamp"], str)
+
+    def test_singleton(self):
+        """The process-wide feed is shared"""
+        assert get_kanban_event_feed() is get_kanban_event_feed()
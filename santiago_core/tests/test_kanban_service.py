@@ -8,6 +8,7 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+from santiago_core.services.kanban_events import KanbanEventFeed
 from santiago_core.services.kanban_service import SantiagoKanbanService
 from santiago_core.core.mcp_service import MCPToolResult
 
@@ -119,6 +120,40 @@ class TestKanbanCloseIssue:
             assert result.error is not None
             assert "Failed to close issue nonexistent-card" in result.error
 
+    @pytest.mark.asyncio
+    async def test_close_issue_publishes_move_and_comment(self, workspace_path):
+        """A successful close publishes the move to done and the completion comment"""
+        feed = KanbanEventFeed()
+        service = SantiagoKanbanService(workspace_path, event_feed=feed)
+        subscription = feed.subscribe()
+        with patch.object(service.kanban_service, 'move_card_with_validation') as mock_move, \
+             patch.object(service.kanban_service, 'add_comment_to_card') as mock_comment:
+            mock_move.return_value = {"success": True, "card_id": "test-card-123"}
+            mock_comment.return_value = True
+
+            await service._handle_close_issue({"board_id": "test-board", "card_id": "test-card-123"})
+
+        events = await subscription.get_batch(timeout=1)
+        assert [e.event_type for e in events] == ["move", "comment"]
+        assert events[0].data["closed"] is True
+        assert events[1].data["comment"].startswith("✅ Issue closed by santiago-developer")
+
+    @pytest.mark.asyncio
+    async def test_close_issue_rejected_by_validation(self, workspace_path):
+        """A rejected move is reported and nothing is published or commented"""
+        feed = KanbanEventFeed()
+        service = SantiagoKanbanService(workspace_path, event_feed=feed)
+        subscription = feed.subscribe()
+        with patch.object(service.kanban_service, 'move_card_with_validation') as mock_move, \
+             patch.object(service.kanban_service, 'add_comment_to_card') as mock_comment:
+            mock_move.return_value = {"success": False, "error": "Tests not passing"}
+
+            result = await service._handle_close_issue({"board_id": "test-board", "card_id": "test-card-123"})
+
+        assert result.result == {"success": False, "error": "Tests not passing"}
+        mock_comment.assert_not_called()
+        assert await subscription.get_batch(timeout=0.01) == []
+
     @pytest.mark.asyncio
     async def test_close_issue_tool_registration(self, kanban_service):
         """Should have kanban_close_issue tool registered"""
@@ -0,0 +1,140 @@
+"""
+Tests for the Kanban Work Poller's card tracking and concurrent starts
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from santiago_core.services import kanban_work_poller
+from santiago_core.services.kanban_work_poller import KanbanWorkPoller, ProcessedCardCache
+
+
+def make_card(card_id, priority="medium"):
+    """Create a ready card as returned by kanban_get_next_work"""
+    return {"card_id": card_id, "title": f"Card {card_id}", "priority": priority}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock"""
+    now = [1000.0]
+    monkeypatch.setattr(kanban_work_poller.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def poller(tmp_path):
+    """Running poller whose card starts are recorded instead of performed"""
+    poller = KanbanWorkPoller(tmp_path, {"max_concurrent_work": 2, "documentation_enabled": False})
+    poller.running = True
+    poller.started_order = []
+    poller.release = asyncio.Event()
+    poller.active = 0
+    poller.max_active = 0
+
+    async def fake_start(board_id, card):
+        poller.started_order.append(card["card_id"])
+        poller.active += 1
+        poller.max_active = max(poller.max_active, poller.active)
+        await poller.release.wait()
+        poller.active -= 1
+
+    poller._start_work_on_card = fake_start
+    return poller
+
+
+class TestProcessedCardCache:
+    """Test the size and age bounds"""
+
+    def test_entries_expire_after_ttl(self, clock):
+        """A card unseen for longer than the TTL is forgotten"""
+        cache = ProcessedCardCache(ttl_seconds=60)
+        cache.add("card-1")
+
+        clock[0] += 61
+
+        assert "card-1" not in cache
+        assert len(cache) == 0
+
+    def test_hit_refreshes_age(self, clock):
+        """A card that keeps being seen is not expired"""
+        cache = ProcessedCardCache(ttl_seconds=60)
+        cache.add("card-1")
+
+        clock[0] += 50
+        assert "card-1" in cache
+        clock[0] += 50
+
+        assert "card-1" in cache
+
+    def test_least_recently_seen_is_evicted(self, clock):
+        """The size bound evicts by recency, not insertion order"""
+        cache = ProcessedCardCache(max_entries=2)
+        cache.add("card-1")
+        cache.add("card-2")
+        assert "card-1" in cache
+
+        cache.add("card-3")
+
+        assert "card-1" in cache
+        assert "card-2" not in cache
+        assert len(cache) == 2
+
+
+class TestConcurrentStarts:
+    """Test round-robin dispatch under the shared work limit"""
+
+    @pytest.mark.asyncio
+    async def test_boards_interleaved_round_robin(self, poller):
+        """Cards are taken from each board in turn"""
+        poller.work_semaphore = asyncio.Semaphore(1)
+        poller.release.set()
+
+        poller._start_cards({
+            "board-1": [make_card("a1"), make_card("a2"), make_card("a3")],
+            "board-2": [make_card("b1")],
+        })
+        await poller.wait_for_started_work()
+
+        assert poller.started_order == ["a1", "b1", "a2", "a3"]
+        assert poller.cards_started == 4
+
+    @pytest.mark.asyncio
+    async def test_work_limit_shared_across_boards(self, poller):
+        """No more than max_concurrent_work cards start at once, whatever the board"""
+        poller._start_cards({
+            "board-1": [make_card("a1"), make_card("a2")],
+            "board-2": [make_card("b1"), make_card("b2")],
+        })
+        await asyncio.sleep(0.01)
+
+        assert poller.max_active == 2
+        poller.release.set()
+        await poller.wait_for_started_work()
+        assert poller.cards_started == 4
+
+    @pytest.mark.asyncio
+    async def test_poll_does_not_wait_for_starts_or_restart_in_flight_cards(self, poller):
+        """A slow start neither blocks the next poll nor gets started twice"""
+        poller.target_boards = ["board-1"]
+        poller.kanban_service.handle_tool_call = AsyncMock(
+            return_value=SimpleNamespace(error=None, result={"cards": [make_card("a1")]})
+        )
+
+        await asyncio.wait_for(poller._poll_and_process_work(), timeout=1)
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(poller._poll_and_process_work(), timeout=1)
+
+        assert poller.started_order == ["a1"]
+        assert "a1" in poller.in_flight_cards
+
+        poller.release.set()
+        await poller.wait_for_started_work()
+        await poller._poll_and_process_work()
+        await poller.wait_for_started_work()
+
+        assert poller.started_order == ["a1"]
+        assert "a1" in poller.processed_cards
@@ -0,0 +1,33 @@
+"""
+Tests for voyage shared memory storage backends
+"""
+
+import pytest
+
+from santiago_core.services.knowledge_graph import SantiagoKnowledgeGraph
+
+
+class TestKnowledgeGraphBackends:
+    """Test that shared memory behaves the same on every backend"""
+
+    @pytest.mark.parametrize("backend", ["memory", "sqlite"])
+    def test_tasks_survive_restart(self, tmp_path, backend):
+        """Recorded tasks are visible after reopening the voyage"""
+        kg = SantiagoKnowledgeGraph("voyage-1", tmp_path, backend=backend)
+        kg.record_shared_task("task-1", "Write docs", "Document the API", ["pm"], priority="high")
+        kg.update_shared_task_status("task-1", "in_progress", "pm")
+
+        reopened = SantiagoKnowledgeGraph("voyage-1", tmp_path, backend=backend)
+
+        tasks = reopened.get_shared_tasks()
+        assert [(t["task_id"], t["status"]) for t in tasks] == [("task-1", "in_progress")]
+        assert reopened.get_voyage_status()["status"] == "active"
+
+    def test_sqlite_backend_does_not_write_turtle(self, tmp_path):
+        """The SQLite backend persists to its database only"""
+        kg = SantiagoKnowledgeGraph("voyage-1", tmp_path, backend="sqlite")
+        kg.record_collective_decision("d-1", "Use SQLite", "Bounded RAM", ["architect"], "accepted", "Scale")
+
+        assert kg.memory_db.exists()
+        assert not kg.memory_file.exists()
+        assert kg.get_statistics()["decisions"] == 1
@@ -0,0 +1,146 @@
+"""
+Tests for latency- and cost-aware adaptive LLM routing
+"""
+
+import pytest
+
+from santiago_core.services.llm_router import (
+    LLMConfig,
+    LLMProvider,
+    LLMRouter,
+    ModelStatsTracker,
+    TaskComplexity,
+)
+from santiago_core.services.rate_limiter import get_rate_limiter_registry
+
+
+@pytest.fixture
+def router(monkeypatch):
+    """Router with both providers configured and private statistics"""
+    monkeypatch.setenv("XAI_API_KEY", "xai-test")
+    monkeypatch.setenv("OPENAI_API_KEY", "openai-test")
+    return LLMRouter(stats=ModelStatsTracker())
+
+
+def record(router, provider, model, latency, success=True, tokens=None, count=10):
+    """Record several identical call outcomes"""
+    config = LLMConfig(provider=provider, model=model, api_key="test", api_base="http://test")
+    for _ in range(count):
+        router.record_result(config, latency, success, tokens)
+
+
+class TestAdaptiveRouting:
+    """Test SLO- and budget-driven model choice"""
+
+    def test_default_without_statistics(self, router):
+        """With no data the static mapping is used"""
+        config = router.get_config("architect_proxy", TaskComplexity.COMPLEX)
+
+        assert config.provider == LLMProvider.XAI
+        assert router.get_decision_trace()[-1]["reason"] == "default"
+
+    def test_slow_default_routes_to_alternate(self, router):
+        """A default model missing the latency SLO is replaced"""
+        record(router, LLMProvider.OPENAI, "gpt-5.1", latency=45.0)
+
+        config = router.get_config("pm_proxy", TaskComplexity.MODERATE)
+
+        assert config.provider == LLMProvider.XAI
+        assert config.model == "grok-4-fast"
+        decision = router.get_decision_trace()[-1]
+        assert decision["reason"] == "default_violates_budget"
+        assert decision["candidates"][0]["violations"]
+
+    def test_excluded_default_recovers_after_samples_expire(self, monkeypatch):
+        """A routed-around default gets traffic again once its bad samples age out"""
+        monkeypatch.setenv("XAI_API_KEY", "xai-test")
+        monkeypatch.setenv("OPENAI_API_KEY", "openai-test")
+        now = [0.0]
+        router = LLMRouter(stats=ModelStatsTracker(max_age_seconds=300, clock=lambda: now[0]))
+        record(router, LLMProvider.OPENAI, "gpt-5.1", latency=45.0)
+        assert router.get_config("pm_proxy", TaskComplexity.MODERATE).provider == LLMProvider.XAI
+
+        now[0] += 301
+        config = router.get_config("pm_proxy", TaskComplexity.MODERATE)
+
+        assert config.provider == LLMProvider.OPENAI
+        assert config.model == "gpt-5.1"
+        assert router.get_decision_trace()[-1]["reason"] == "default"
+
+    def test_error_prone_default_routes_to_alternate(self, router):
+        """A default model with a high error rate is replaced"""
+        record(router, LLMProvider.XAI, "grok-4-fast", latency=1.0, success=False)
+
+        config = router.get_config("architect_proxy", TaskComplexity.COMPLEX)
+
+        assert config.provider == LLMProvider.OPENAI
+
+    def test_over_budget_default_routes_to_alternate(self, router):
+        """A default model over the role's cost budget is replaced"""
+        record(router, LLMProvider.OPENAI, "o3", latency=5.0, tokens=20000)
+
+        config = router.get_config("qa_proxy", TaskComplexity.CRITICAL)
+
+        assert config.provider == LLMProvider.XAI
+
+    def test_best_effort_when_nothing_meets_budget(self, router):
+        """When every candidate violates the budget the most reliable wins"""
+        record(router, LLMProvider.OPENAI, "gpt-5.1", latency=45.0, success=False)
+        record(router, LLMProvider.XAI, "grok-4-fast", latency=90.0)
+
+        config = router.get_config("pm_proxy", TaskComplexity.MODERATE)
+
+        assert config.provider == LLMProvider.XAI
+        assert router.get_decision_trace()[-1]["reason"] == "best_effort"
+
+    def test_alternates_require_credentials(self, monkeypatch):
+        """Providers without an API key are not offered as alternates"""
+        monkeypatch.setenv("OPENAI_API_KEY", "openai-test")
+        monkeypatch.setenv("XAI_API_KEY", "")
+        router = LLMRouter(stats=ModelStatsTracker())
+
+        assert router.get_candidates("pm_proxy", TaskComplexity.MODERATE) == [(LLMProvider.OPENAI, "gpt-5.1")]
+
+    def test_non_adaptive_uses_static_mapping(self, monkeypatch):
+        """Adaptive routing can be disabled"""
+        monkeypatch.setenv("XAI_API_KEY", "xai-test")
+        monkeypatch.setenv("OPENAI_API_KEY", "openai-test")
+        router = LLMRouter(stats=ModelStatsTracker(), adaptive=False)
+        record(router, LLMProvider.OPENAI, "gpt-5.1", latency=45.0)
+
+        assert router.get_config("pm_proxy", TaskComplexity.MODERATE).model == "gpt-5.1"
+        assert router.get_decision_trace() == []
+
+
+class TestLocalRouting:
+    """Test routing of simple tasks to the local vLLM server"""
+
+    def test_simple_task_routes_local(self, monkeypatch):
+        """Simple tasks go to vLLM when its queue is short"""
+        monkeypatch.setenv("OPENAI_API_KEY", "openai-test")
+        router = LLMRouter(stats=ModelStatsTracker(), local_routing=True)
+
+        config = router.get_config("developer_proxy", TaskComplexity.SIMPLE)
+
+        assert config.provider == LLMProvider.VLLM
+        assert config.model == router.vllm_model
+        assert router.get_decision_trace()[-1]["reason"] == "local_short_queue"
+
+    def test_long_local_queue_falls_back(self, monkeypatch):
+        """A busy local server is skipped"""
+        monkeypatch.setenv("OPENAI_API_KEY", "openai-test")
+        router = LLMRouter(stats=ModelStatsTracker(), local_routing=True)
+        limiter = get_rate_limiter_registry().get("vllm", router.vllm_model)
+        monkeypatch.setattr(limiter, "in_flight", router.vllm_max_queue + 1)
+
+        config = router.get_config("developer_proxy", TaskComplexity.SIMPLE)
+
+        assert config.provider == LLMProvider.OPENAI
+        assert config.model == "gpt-5-nano"
+
+    def test_moderate_task_not_local(self, monkeypatch):
+        """Only simple tasks are routed locally"""
+        monkeypatch.setenv("OPENAI_API_KEY", "openai-test")
+        router = LLMRouter(stats=ModelStatsTracker(), local_routing=True)
+
+        assert router.get_config("developer_proxy", TaskComplexity.MODERATE).provider == LLMProvider.OPENAI
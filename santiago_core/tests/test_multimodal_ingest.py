@@ -0,0 +1,145 @@
+"""
+Tests for the Multimodal Ingest Officer processing pipeline
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from santiago_core.services.multimodal_ingest import SantiagoMultimodalIngestOfficer
+
+
+@pytest.fixture
+def ingest_officer(tmp_path):
+    """Create ingest officer backed by a temporary workspace"""
+    officer = SantiagoMultimodalIngestOfficer(tmp_path, use_process_pool=False)
+    yield officer
+    officer.shutdown()
+
+
+class TestIngestPipeline:
+    """Test per-type worker pools and priority lanes"""
+
+    def test_process_mixed_types(self, ingest_officer, tmp_path):
+        """All source types are processed and queued for routing"""
+        ingest_officer.ingest_content("text", "plain notes")
+        ingest_officer.ingest_content("chat", "conversation with the team")
+        ingest_officer.ingest_content("pdf", tmp_path / "spec.pdf")
+        ingest_officer.ingest_content("voice", tmp_path / "memo.wav")
+
+        processed = ingest_officer.process_ingest_queue()
+
+        assert processed == 4
+        assert len(ingest_officer.routing_queue) == 4
+        assert ingest_officer.ingest_queue == []
+
+    def test_human_attention_routed_first(self, ingest_officer):
+        """Urgent content jumps ahead of normal content in the routing queue"""
+        ingest_officer.ingest_content("text", "routine update")
+        ingest_officer.ingest_content("text", "URGENT: production is down")
+
+        ingest_officer.process_ingest_queue()
+
+        first_content, first_decision = ingest_officer.routing_queue[0]
+        assert first_decision.requires_human_attention
+        assert "URGENT" in first_content.processed_content
+
+    def test_stage_metrics_reported(self, ingest_officer):
+        """Statistics include per-stage latency and throughput"""
+        ingest_officer.ingest_content("text", "research findings")
+        ingest_officer.ingest_content("pdf", "not a path")
+
+        ingest_officer.process_ingest_queue()
+        ingest_officer.route_content()
+
+        stages = ingest_officer.get_ingest_statistics()["stages"]
+        assert stages["process"]["text"]["count"] == 1
+        assert stages["process"]["pdf"]["failed"] == 1
+        assert stages["route"]["text"]["count"] == 1
+        assert "avg_latency_ms" in stages["process"]["text"]
+        assert "throughput_per_sec" in stages["route"]["text"]
+
+    @pytest.mark.asyncio
+    async def test_process_from_running_loop(self, ingest_officer, caplog):
+        """Sync entry point still works inside an event loop, but warns about the serial fallback"""
+        ingest_officer.ingest_content("chat", "hello")
+
+        assert ingest_officer.process_ingest_queue() == 1
+        assert "process_ingest_queue_async" in caplog.text
+
+    def test_pdf_in_process_pool(self, tmp_path):
+        """PDF parsing runs in a worker process"""
+        officer = SantiagoMultimodalIngestOfficer(tmp_path)
+        try:
+            officer.ingest_content("pdf", tmp_path / "report.pdf")
+            assert asyncio.run(officer.process_ingest_queue_async()) == 1
+            content, _ = officer.routing_queue[0]
+            assert "report.pdf" in content.processed_content
+        finally:
+            officer.shutdown()
+
+
+class TestIngestDeduplication:
+    """Test content fingerprint deduplication"""
+
+    def test_duplicate_not_reprocessed(self, ingest_officer):
+        """Re-ingesting identical content returns the original id and skips work"""
+        first_id = ingest_officer.ingest_content("chat", "same chat log")
+        ingest_officer.process_ingest_queue()
+        ingest_officer.route_content()
+
+        second_id = ingest_officer.ingest_content("chat", "same chat log")
+
+        assert second_id == first_id
+        assert ingest_officer.ingest_queue == []
+        dedupe = ingest_officer.get_ingest_statistics()["dedupe"]
+        assert dedupe["duplicates_skipped"] == 1
+        assert dedupe["routings_saved"] == 2  # conversation + shared_memory
+
+    def test_prior_result_reused(self, ingest_officer):
+        """Prior processed content and routing decision are available for duplicates"""
+        content_id = ingest_officer.ingest_content("text", "critical outage")
+        ingest_officer.process_ingest_queue()
+
+        processed, decision = ingest_officer.get_fingerprint_record(content_id)
+
+        assert processed == "critical outage"
+        assert decision.requires_human_attention
+
+    def test_index_persists(self, ingest_officer, tmp_path):
+        """Fingerprints survive a restart"""
+        content_id = ingest_officer.ingest_content("text", "durable note")
+        ingest_officer.process_ingest_queue()
+
+        restarted = SantiagoMultimodalIngestOfficer(tmp_path, use_process_pool=False)
+
+        assert restarted.ingest_content("text", "durable note") == content_id
+        assert restarted.ingest_queue == []
+
+    def test_source_type_part_of_fingerprint(self, ingest_officer):
+        """Same payload under different source types is processed separately"""
+        text_id = ingest_officer.ingest_content("text", "shared payload")
+        chat_id = ingest_officer.ingest_content("chat", "shared payload")
+
+        assert text_id != chat_id
+
+    def test_index_saved_per_batch_not_per_item(self, ingest_officer, tmp_path):
+        """Ingesting only queues; the index is written when the queue is processed"""
+        index_file = tmp_path / "multimodal_ingest" / "content_fingerprints.json"
+        ingest_officer.ingest_content("text", "first note")
+        ingest_officer.ingest_content("text", "second note")
+
+        assert not index_file.exists()
+        ingest_officer.process_ingest_queue()
+        assert index_file.exists()
+
+    def test_pending_content_still_deduplicated_after_restart(self, ingest_officer, tmp_path):
+        """Queued-but-unprocessed content keeps its fingerprint across a restart"""
+        content_id = ingest_officer.ingest_content("text", "queued note")
+
+        restarted = SantiagoMultimodalIngestOfficer(tmp_path, use_process_pool=False)
+
+        assert restarted.ingest_content("text", "queued note") == content_id
+        assert len(restarted.ingest_queue) == 1
+        assert restarted.get_fingerprint_record(content_id) == ("", None)
@@ -0,0 +1,120 @@
+"""
+Tests for the Productivity Monitor's deadline heap
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from santiago_core.services import productivity_monitor
+from santiago_core.services.kanban_events import KanbanChangeEvent
+from santiago_core.services.productivity_monitor import ProductivityMonitor
+
+START = datetime(2025, 1, 6, 9, 0, 0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable datetime.now() for the monitor module"""
+    now = [START]
+
+    class FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now[0]
+
+    monkeypatch.setattr(productivity_monitor, "datetime", FakeDatetime)
+    return now
+
+
+@pytest.fixture
+def monitor(tmp_path, clock):
+    """Monitor with one task in progress and a stubbed kanban service"""
+    monitor = ProductivityMonitor(tmp_path, {
+        'check_interval_seconds': 60,
+        'stuck_threshold_minutes': 5,
+        'escalation_threshold_minutes': 15,
+        'target_boards': ['board-1'],
+        'alert_channels': ['log'],
+    })
+    monitor.kanban_service.handle_tool_call = AsyncMock(return_value=SimpleNamespace(error=None, result={}))
+    monitor._start_task_timer('board-1', 'card-1', 'Write docs', 'alice')
+    return monitor
+
+
+def live_deadlines(monitor, kind=None):
+    """Live heap entries, optionally of one kind"""
+    return [entry for entry in monitor._deadlines
+            if monitor._is_live_deadline(entry) and (kind is None or entry[5] == kind)]
+
+
+def advance(clock, **delta):
+    clock[0] = clock[0] + timedelta(**delta)
+
+
+class TestDeadlineHeap:
+    """Test stuck detection driven by scheduled deadlines"""
+
+    @pytest.mark.asyncio
+    async def test_alert_then_escalation_then_nothing(self, monitor, clock):
+        """A stuck task is alerted once, escalated once, and then not rescheduled"""
+        advance(clock, minutes=6)
+        await monitor._check_productivity()
+        assert 'card-1' in monitor.alerted_tasks
+        assert monitor.task_timers['card-1']['alerts_sent'] == 1
+        assert live_deadlines(monitor, 'stuck')[0][0] == START + timedelta(minutes=15)
+
+        advance(clock, minutes=10)
+        await monitor._check_productivity()
+        assert monitor.task_timers['card-1']['escalated'] is True
+        assert live_deadlines(monitor, 'stuck') == []
+
+        advance(clock, minutes=30)
+        await monitor._check_productivity()
+        assert monitor.task_timers['card-1']['alerts_sent'] == 1
+        assert monitor.kanban_service.handle_tool_call.await_count == 1  # One escalation comment
+
+    @pytest.mark.asyncio
+    async def test_activity_invalidates_pending_deadline(self, monitor, clock):
+        """Recorded activity pushes the stuck deadline back"""
+        advance(clock, minutes=4)
+        monitor.record_activity('card-1')
+
+        advance(clock, minutes=2)
+        await monitor._check_productivity()
+        assert 'card-1' not in monitor.alerted_tasks
+
+        advance(clock, minutes=3)
+        await monitor._check_productivity()
+        assert 'card-1' in monitor.alerted_tasks
+
+    @pytest.mark.asyncio
+    async def test_leaving_watched_column_drops_timer(self, monitor, clock):
+        """Moving a card out of in_progress removes its timer and deadlines"""
+        monitor._apply_change_event(KanbanChangeEvent(
+            event_type='move', board_id='board-1', card_id='card-1', column='done', from_column='in_progress'
+        ))
+
+        advance(clock, hours=25)
+
+        assert 'card-1' not in monitor.task_timers
+        assert monitor._pop_due_deadlines(clock[0]) == []
+
+    @pytest.mark.asyncio
+    async def test_expire_removes_task_after_24_hours(self, monitor, clock):
+        """The 24h expire deadline cleans up the timer"""
+        advance(clock, hours=24, seconds=1)
+        await monitor._check_productivity()
+
+        assert 'card-1' not in monitor.task_timers
+        assert live_deadlines(monitor) == []
+
+    def test_stale_entries_are_compacted(self, monitor):
+        """Repeated activity does not grow the heap without bound"""
+        for _ in range(500):
+            monitor.record_activity('card-1')
+
+        assert len(monitor._deadlines) <= 4 * len(monitor.task_timers) + 64 + 1
+        assert [entry[5] for entry in sorted(live_deadlines(monitor))] == ['stuck', 'expire']
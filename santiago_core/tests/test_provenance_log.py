@@ -0,0 +1,150 @@
+"""
+Tests for the background provenance log writer
+"""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from santiago_core.agents._proxy.base_proxy import BaseProxyAgent, MCPManifest, MCPTool, ProxyConfig
+from santiago_core.services.provenance_log import ProvenanceLogWriter, get_provenance_log_writer
+
+
+@pytest.fixture
+def writer():
+    """Writer with a short flush interval"""
+    writer = ProvenanceLogWriter(flush_interval=0.01)
+    yield writer
+    writer.close()
+
+
+def read_entries(path: Path):
+    """Read JSONL entries from a log file"""
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestProvenanceLogWriter:
+    """Test queued, batched writes"""
+
+    def test_entries_written_after_flush(self, writer, tmp_path):
+        """Queued entries reach disk in order"""
+        log_file = tmp_path / "logs" / "proxy.jsonl"
+
+        for i in range(3):
+            writer.write(log_file, {"n": i})
+        assert writer.flush(timeout=5)
+
+        assert [entry["n"] for entry in read_entries(log_file)] == [0, 1, 2]
+        assert writer.get_metrics()["entries_written"] == 3
+
+    def test_file_visible_immediately(self, writer, tmp_path):
+        """A new log file exists as soon as write() returns"""
+        log_file = tmp_path / "proxy.jsonl"
+
+        writer.write(log_file, {"n": 1})
+
+        assert log_file.exists()
+
+    def test_burst_is_batched(self, writer, tmp_path):
+        """Bursts across files are written in few batches"""
+        files = [tmp_path / "a.jsonl", tmp_path / "b.jsonl"]
+
+        for i in range(1000):
+            writer.write(files[i % 2], {"n": i})
+        writer.flush(timeout=5)
+
+        assert len(read_entries(files[0])) == 500
+        assert len(read_entries(files[1])) == 500
+        assert writer.get_metrics()["batches_written"] < 1000
+
+    def test_size_rotation(self, tmp_path):
+        """Full files are rotated aside"""
+        writer = ProvenanceLogWriter(flush_interval=0.01, batch_size=1, max_bytes=50)
+        log_file = tmp_path / "proxy.jsonl"
+        try:
+            for i in range(4):
+                writer.write(log_file, {"payload": "x" * 40, "n": i})
+                writer.flush(timeout=5)
+        finally:
+            writer.close()
+
+        rotated = sorted(tmp_path.glob("proxy.*.jsonl"))
+        assert len(rotated) == 3
+        assert read_entries(log_file)[0]["n"] == 3
+        assert writer.get_metrics()["rotations"] == 3
+
+    def test_compressed_rotation(self, tmp_path):
+        """Rotated files can be gzipped"""
+        writer = ProvenanceLogWriter(flush_interval=0.01, batch_size=1, max_bytes=10, compress_rotated=True)
+        log_file = tmp_path / "proxy.jsonl"
+        try:
+            writer.write(log_file, {"n": 0, "payload": "first entry"})
+            writer.flush(timeout=5)
+            writer.write(log_file, {"n": 1})
+            writer.flush(timeout=5)
+        finally:
+            writer.close()
+
+        compressed = tmp_path / "proxy.1.jsonl.gz"
+        with gzip.open(compressed, "rt") as f:
+            assert json.loads(f.readline())["n"] == 0
+        assert not (tmp_path / "proxy.1.jsonl").exists()
+
+    def test_close_flushes(self, tmp_path):
+        """Closing drains the queue"""
+        writer = ProvenanceLogWriter(flush_interval=10)
+        log_file = tmp_path / "proxy.jsonl"
+        writer.write(log_file, {"n": 1})
+
+        writer.close()
+
+        assert read_entries(log_file) == [{"n": 1}]
+        with pytest.raises(RuntimeError):
+            writer.write(log_file, {"n": 2})
+
+    def test_singleton(self):
+        """The writer is shared process-wide"""
+        assert get_provenance_log_writer() is get_provenance_log_writer()
+
+
+class LoggingProxyAgent(BaseProxyAgent):
+    """Proxy with a fixed API response"""
+
+    async def _route_to_external_api(self, tool_name, params):
+        return {"status": "ok"}
+
+    async def handle_custom_message(self, message) -> None:
+        pass
+
+    async def start_working_on_task(self, task) -> None:
+        pass
+
+
+class TestProxyProvenance:
+    """Test proxies log through the shared writer"""
+
+    @pytest.mark.asyncio
+    async def test_tool_call_logged(self, tmp_path):
+        """Tool calls are logged in the background and visible after a flush"""
+        proxy = LoggingProxyAgent(
+            name="log-proxy",
+            workspace_path=Path(tmp_path),
+            config=ProxyConfig(role_name="pm_proxy", api_endpoint="http://test", api_key="test", log_dir="logs/"),
+            manifest=MCPManifest(
+                role="pm_proxy",
+                capabilities=["status"],
+                input_tools=[MCPTool(name="get_status", description="Get status")],
+                output_tools=[],
+                communication_tools=[],
+            ),
+        )
+
+        await proxy.invoke_tool("get_status", {"board": "main"})
+        assert await proxy.flush_provenance_log(timeout=5)
+
+        log_file = next((Path(tmp_path) / "logs").glob("log-proxy_*.jsonl"))
+        entry = read_entries(log_file)[0]
+        assert entry["tool"] == "get_status"
+        assert entry["result"] == {"status": "ok"}
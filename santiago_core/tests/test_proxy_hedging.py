@@ -0,0 +1,157 @@
+"""
+Tests for hedged requests and provider failover in BaseProxyAgent
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from santiago_core.agents._proxy.base_proxy import BaseProxyAgent, MCPManifest, MCPTool, ProxyConfig
+from santiago_core.services.llm_router import (
+    HedgePolicy,
+    LLMProvider,
+    LLMRouter,
+    ModelStatsTracker,
+    TaskComplexity,
+)
+from santiago_core.services.request_coalescer import RequestCoalescer
+
+
+class HedgingProxyAgent(BaseProxyAgent):
+    """Proxy whose provider calls are scripted per provider"""
+
+    def __init__(self, workspace: Path, behaviour):
+        super().__init__(
+            name="hedge-proxy",
+            workspace_path=workspace,
+            config=ProxyConfig(role_name="pm_proxy", api_endpoint="http://test", api_key="test"),
+            manifest=MCPManifest(
+                role="pm_proxy",
+                capabilities=["status"],
+                input_tools=[MCPTool(name="get_status", description="Get status")],
+                output_tools=[],
+                communication_tools=[],
+            ),
+        )
+        self.behaviour = behaviour  # provider -> (delay, result)
+        self.cancelled = []
+        self.request_coalescer = RequestCoalescer()
+
+    async def _call_provider_api(self, llm_config, tool_name, params):
+        delay, result = self.behaviour[llm_config.provider]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(llm_config.provider)
+            raise
+        return result
+
+    async def handle_custom_message(self, message) -> None:
+        pass
+
+    async def start_working_on_task(self, task) -> None:
+        pass
+
+
+@pytest.fixture
+def hedging_env(monkeypatch):
+    """Both providers configured; hedging enabled for simple tasks"""
+    monkeypatch.setenv("XAI_API_KEY", "xai-test")
+    monkeypatch.setenv("OPENAI_API_KEY", "openai-test")
+    monkeypatch.setenv("LLM_HEDGE_COMPLEXITIES", "simple")
+
+
+def make_proxy(tmp_path, behaviour, min_delay=0.01):
+    """Create a proxy with a fast hedge delay"""
+    proxy = HedgingProxyAgent(Path(tmp_path), behaviour)
+    proxy.llm_router = LLMRouter(stats=ModelStatsTracker())
+    proxy.llm_router.HEDGE_POLICIES = {
+        **LLMRouter.HEDGE_POLICIES,
+        TaskComplexity.SIMPLE: HedgePolicy(default_delay_seconds=min_delay, min_delay_seconds=min_delay),
+    }
+    return proxy
+
+
+class TestHedging:
+    """Test hedged backup requests"""
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged(self, hedging_env, tmp_path):
+        """The backup answers first and the primary is cancelled"""
+        proxy = make_proxy(tmp_path, {
+            LLMProvider.OPENAI: (1.0, {"result": "primary"}),
+            LLMProvider.XAI: (0.01, {"result": "backup"}),
+        })
+
+        result = await proxy._route_to_external_api("get_status", {})
+
+        assert result == {"result": "backup"}
+        assert proxy.cancelled == [LLMProvider.OPENAI]
+        assert proxy.get_metrics()["hedging"]["hedge_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_not_hedged(self, hedging_env, tmp_path):
+        """No backup request when the primary beats the hedge delay"""
+        proxy = make_proxy(tmp_path, {
+            LLMProvider.OPENAI: (0.0, {"result": "primary"}),
+            LLMProvider.XAI: (0.0, {"result": "backup"}),
+        }, min_delay=0.5)
+
+        result = await proxy._route_to_external_api("get_status", {})
+
+        assert result == {"result": "primary"}
+        assert proxy.hedge_stats["hedges_issued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_waits_for_primary(self, hedging_env, tmp_path):
+        """An erroring backup doesn't beat a slow but successful primary"""
+        proxy = make_proxy(tmp_path, {
+            LLMProvider.OPENAI: (0.05, {"result": "primary"}),
+            LLMProvider.XAI: (0.0, {"error": "boom"}),
+        })
+
+        result = await proxy._route_to_external_api("get_status", {})
+
+        assert result == {"result": "primary"}
+
+    @pytest.mark.asyncio
+    async def test_hedging_is_opt_in(self, monkeypatch, tmp_path):
+        """Complexities not listed are never hedged"""
+        monkeypatch.setenv("XAI_API_KEY", "xai-test")
+        monkeypatch.setenv("OPENAI_API_KEY", "openai-test")
+        monkeypatch.delenv("LLM_HEDGE_COMPLEXITIES", raising=False)
+        proxy = make_proxy(tmp_path, {
+            LLMProvider.OPENAI: (0.05, {"result": "primary"}),
+            LLMProvider.XAI: (0.0, {"result": "backup"}),
+        })
+
+        assert await proxy._route_to_external_api("get_status", {}) == {"result": "primary"}
+
+
+class TestFailover:
+    """Test failover on provider errors"""
+
+    @pytest.mark.asyncio
+    async def test_error_fails_over(self, hedging_env, tmp_path):
+        """An error from the primary is retried on the alternate"""
+        proxy = make_proxy(tmp_path, {
+            LLMProvider.OPENAI: (0.0, {"error": "upstream 500"}),
+            LLMProvider.XAI: (0.0, {"result": "backup"}),
+        }, min_delay=0.5)
+
+        result = await proxy._route_to_external_api("get_status", {})
+
+        assert result == {"result": "backup"}
+        assert proxy.hedge_stats["failovers"] == 1
+
+    @pytest.mark.asyncio
+    async def test_no_alternate_returns_error(self, monkeypatch, tmp_path):
+        """Without an alternate provider the error is returned as before"""
+        monkeypatch.setenv("OPENAI_API_KEY", "openai-test")
+        monkeypatch.setenv("XAI_API_KEY", "")
+        proxy = make_proxy(tmp_path, {
+            LLMProvider.OPENAI: (0.0, {"error": "upstream 500"}),
+        })
+
+        assert await proxy._route_to_external_api("get_status", {}) == {"error": "upstream 500"}
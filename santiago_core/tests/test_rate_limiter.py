@@ -0,0 +1,126 @@
+"""
+Tests for per-provider LLM rate limiting
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from santiago_core.services.rate_limiter import (
+    ProviderRateLimiter,
+    RateLimiterRegistry,
+    RateLimits,
+    TokenBucket,
+    get_rate_limiter_registry,
+)
+
+
+class RateLimitError(Exception):
+    """Stand-in for a provider 429 error"""
+    status_code = 429
+
+
+class TestTokenBucket:
+    """Test bucket accounting"""
+
+    def test_consume_and_wait(self):
+        """Empty buckets report how long until capacity returns"""
+        bucket = TokenBucket(capacity=2, refill_per_second=1)
+        bucket.consume(2)
+
+        assert 0 < bucket.wait_time(1) <= 1.0
+
+    def test_refund(self):
+        """Unused reservations are returned"""
+        bucket = TokenBucket(capacity=100, refill_per_second=0.001)
+        bucket.consume(80)
+        bucket.refund(50)
+
+        assert bucket.wait_time(70) == 0
+
+
+class TestProviderRateLimiter:
+    """Test concurrency limits and AIMD adaptation"""
+
+    @pytest.mark.asyncio
+    async def test_max_in_flight_enforced(self):
+        """No more than max_in_flight calls run at once"""
+        registry = RateLimiterRegistry()
+        registry.configure("openai", RateLimits(max_in_flight=2))
+        running = peak = 0
+
+        async def call():
+            nonlocal running, peak
+            async with registry.limit("openai", "gpt-5.1", 10):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert peak == 2
+        assert registry.get_metrics()["openai/gpt-5.1"]["requests"] == 6
+
+    @pytest.mark.asyncio
+    async def test_429_halves_concurrency(self):
+        """Rate limit errors multiplicatively decrease the in-flight limit"""
+        limiter = ProviderRateLimiter("xai", "grok-4-fast", RateLimits(max_in_flight=8))
+
+        await limiter.acquire(10)
+        limiter.release(0.1, 10, error=RateLimitError("Too many requests"))
+
+        metrics = limiter.get_metrics()
+        assert metrics["concurrency_limit"] == 4
+        assert metrics["throttled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_success_increases_concurrency(self):
+        """Fast successes additively grow the limit back"""
+        limiter = ProviderRateLimiter("xai", "grok-4-fast", RateLimits(max_in_flight=8))
+        limiter.concurrency_limit = 2.0
+
+        for _ in range(4):
+            await limiter.acquire(10)
+            limiter.release(0.1, 10)
+
+        assert limiter.get_metrics()["concurrency_limit"] == 3
+
+    @pytest.mark.asyncio
+    async def test_slow_responses_shrink_concurrency(self):
+        """Responses over the latency target back off"""
+        limiter = ProviderRateLimiter("vllm", "mistral", RateLimits(max_in_flight=10, latency_target_seconds=1.0))
+
+        await limiter.acquire(10)
+        limiter.release(5.0, 10)
+
+        assert limiter.get_metrics()["concurrency_limit"] == 9
+
+    @pytest.mark.asyncio
+    async def test_token_usage_reconciled(self):
+        """Actual usage replaces the estimate in the tokens/min bucket"""
+        registry = RateLimiterRegistry()
+        registry.configure("openai", RateLimits(tokens_per_minute=1000))
+
+        async with registry.limit("openai", "gpt-5.1", 900) as call:
+            call.record_usage(SimpleNamespace(usage=SimpleNamespace(total_tokens=100)))
+
+        limiter = registry.get("openai", "gpt-5.1")
+        assert limiter.get_metrics()["tokens_used"] == 100
+        assert limiter.token_bucket.wait_time(800) == 0
+
+    @pytest.mark.asyncio
+    async def test_429_exception_propagates(self):
+        """Errors inside the limited block still reach the caller"""
+        registry = RateLimiterRegistry()
+
+        with pytest.raises(RateLimitError):
+            async with registry.limit("xai", "grok-4-fast", 10):
+                raise RateLimitError("429")
+
+        assert registry.get_metrics()["xai/grok-4-fast"]["throttled"] == 1
+
+    def test_singleton(self):
+        """The registry is shared process-wide"""
+        assert get_rate_limiter_registry() is get_rate_limiter_registry()
@@ -0,0 +1,153 @@
+"""
+Tests for single-flight coalescing of identical LLM calls
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from santiago_core.agents._proxy.base_proxy import BaseProxyAgent, MCPManifest, MCPTool, ProxyConfig
+from santiago_core.services.llm_router import LLMConfig, LLMProvider
+from santiago_core.services.request_coalescer import RequestCoalescer, make_request_key
+
+
+class TestRequestCoalescer:
+    """Test sharing of in-flight calls"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_upstream(self):
+        """Only one upstream call is made for concurrent identical requests"""
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def upstream():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"status": "ok"}
+
+        results = await asyncio.gather(*(coalescer.run("key", upstream) for _ in range(3)))
+
+        assert calls == 1
+        assert results == [{"status": "ok"}] * 3
+        assert results[0] is not results[1]  # Waiters get their own copy
+        metrics = coalescer.get_metrics()
+        assert metrics["upstream_calls"] == 1
+        assert metrics["coalesced_calls"] == 2
+        assert metrics["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_coalesced(self):
+        """Finished requests are not cached"""
+        coalescer = RequestCoalescer()
+
+        async def upstream():
+            return {"status": "ok"}
+
+        await coalescer.run("key", upstream)
+        await coalescer.run("key", upstream)
+
+        assert coalescer.get_metrics()["upstream_calls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_waiters(self):
+        """Every waiter sees the upstream failure"""
+        coalescer = RequestCoalescer()
+
+        async def upstream():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            coalescer.run("key", upstream), coalescer.run("key", upstream), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert coalescer.get_metrics()["failed_calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_call(self):
+        """Other waiters still get the result when one gives up"""
+        coalescer = RequestCoalescer()
+
+        async def upstream():
+            await asyncio.sleep(0.02)
+            return {"status": "ok"}
+
+        first = asyncio.ensure_future(coalescer.run("key", upstream))
+        second = asyncio.ensure_future(coalescer.run("key", upstream))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == {"status": "ok"}
+
+    def test_key_normalization(self):
+        """Parameter order and instruction whitespace don't change the key; parameter whitespace does"""
+        key = make_request_key("openai", "gpt-5.1", "You are a PM.", "get_status", {"a": 1, "b": "x y"})
+
+        assert key == make_request_key("openai", "gpt-5.1", "You are a  PM.\n", "get_status", {"b": "x y", "a": 1})
+        assert key != make_request_key("openai", "o3", "You are a PM.", "get_status", {"a": 1, "b": "x y"})
+        assert make_request_key("openai", "gpt-5.1", "You are a dev.", "write_code", {"code": "if x:\n    y()\n        z()"}) \
+            != make_request_key("openai", "gpt-5.1", "You are a dev.", "write_code", {"code": "if x:\n    y()\n    z()"})
+
+
+class RoutingProxyAgent(BaseProxyAgent):
+    """Proxy that uses the base class routing"""
+
+    async def handle_custom_message(self, message) -> None:
+        pass
+
+    async def start_working_on_task(self, task) -> None:
+        pass
+
+
+def make_proxy(workspace: Path, name: str) -> RoutingProxyAgent:
+    """Create a proxy with a single tool"""
+    return RoutingProxyAgent(
+        name=name,
+        workspace_path=workspace,
+        config=ProxyConfig(role_name="pm_proxy", api_endpoint="http://test", api_key="test"),
+        manifest=MCPManifest(
+            role="pm_proxy",
+            capabilities=["status"],
+            input_tools=[MCPTool(name="get_status", description="Get status")],
+            output_tools=[],
+            communication_tools=[],
+        ),
+        role_instructions="You are a PM.",
+    )
+
+
+class TestProxyCoalescing:
+    """Test coalescing through BaseProxyAgent"""
+
+    @pytest.mark.asyncio
+    async def test_proxies_share_identical_calls(self, tmp_path):
+        """Concurrent identical tool calls from two proxies hit the API once"""
+        pm_a = make_proxy(Path(tmp_path), "pm-a")
+        pm_b = make_proxy(Path(tmp_path), "pm-b")
+        coalescer = RequestCoalescer()
+        pm_a.request_coalescer = pm_b.request_coalescer = coalescer
+        config = LLMConfig(provider=LLMProvider.OPENAI, model="gpt-5.1", api_key="test", api_base="http://test")
+        calls = 0
+
+        async def fake_openai(llm_config, tool_name, params):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"tool": tool_name, "result": "done"}
+
+        for proxy in (pm_a, pm_b):
+            proxy.llm_router.get_config = lambda *args, **kwargs: config
+            proxy._call_openai_api = fake_openai
+
+        results = await asyncio.gather(
+            pm_a._route_to_external_api("get_status", {"board": "main"}),
+            pm_b._route_to_external_api("get_status", {"board": "main"}),
+        )
+
+        assert calls == 1
+        assert results[0] == results[1]
+        assert pm_a.coalesced_calls + pm_b.coalesced_calls == 1
+        assert pm_a.get_metrics()["coalescing"]["coalesced_calls"] == 1
@@ -0,0 +1,189 @@
+"""
+Tests for streaming responses through proxies, VLLMClient and the API
+"""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from santiago_core.agents._proxy.base_proxy import BaseProxyAgent, MCPManifest, MCPTool, ProxyConfig
+from santiago_core.services.llm_router import LLMRouter, ModelStatsTracker
+from santiago_core.services.vllm_client import VLLMClient
+
+
+def make_chunk(content=None, total_tokens=None):
+    """Build an OpenAI-style stream chunk"""
+    choices = [SimpleNamespace(delta=SimpleNamespace(content=content))] if content is not None else []
+    usage = SimpleNamespace(total_tokens=total_tokens) if total_tokens else None
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class FakeCompletions:
+    """chat.completions stand-in that streams fixed chunks"""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.kwargs = None
+
+    async def create(self, **kwargs):
+        self.kwargs = kwargs
+
+        async def stream():
+            for piece in self.pieces:
+                yield make_chunk(piece)
+            yield make_chunk(total_tokens=42)
+
+        return stream()
+
+
+def fake_openai_client(completions):
+    """AsyncOpenAI stand-in"""
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+class StreamingProxyAgent(BaseProxyAgent):
+    """Proxy that uses the base class routing"""
+
+    def __init__(self, workspace: Path):
+        super().__init__(
+            name="stream-proxy",
+            workspace_path=workspace,
+            config=ProxyConfig(role_name="pm_proxy", api_endpoint="http://test", api_key="test"),
+            manifest=MCPManifest(
+                role="pm_proxy",
+                capabilities=["status"],
+                input_tools=[MCPTool(name="get_status", description="Get status")],
+                output_tools=[],
+                communication_tools=[],
+            ),
+        )
+        self.llm_router = LLMRouter(stats=ModelStatsTracker())
+
+    async def handle_custom_message(self, message) -> None:
+        pass
+
+    async def start_working_on_task(self, task) -> None:
+        pass
+
+
+class MockRoutedProxyAgent(StreamingProxyAgent):
+    """Proxy with its own non-streaming routing"""
+
+    async def _route_to_external_api(self, tool_name, params):
+        return {"status": "mocked", "tool": tool_name}
+
+
+class TestVLLMStreaming:
+    """Test VLLMClient.chat_stream"""
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_yields_deltas(self):
+        """Chunks are yielded as they arrive, followed by the full content"""
+        client = VLLMClient(base_url="http://localhost:9/v1", model="test-model")
+        completions = FakeCompletions(["Hel", "lo"])
+        client._client = fake_openai_client(completions)
+
+        events = [event async for event in client.chat_stream([{"role": "user", "content": "hi"}])]
+
+        assert [e["delta"] for e in events if "delta" in e] == ["Hel", "lo"]
+        assert events[-1]["done"] and events[-1]["content"] == "Hello"
+        assert completions.kwargs["stream"] is True
+
+
+class TestProxyStreaming:
+    """Test BaseProxyAgent.invoke_tool_stream"""
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_stream(self, monkeypatch, tmp_path):
+        """Deltas stream through and the final event carries the parsed result"""
+        monkeypatch.setenv("OPENAI_API_KEY", "openai-test")
+        proxy = StreamingProxyAgent(Path(tmp_path))
+        completions = FakeCompletions(['{"status": ', '"green"}'])
+
+        with patch("openai.AsyncOpenAI", return_value=fake_openai_client(completions)):
+            events = [event async for event in proxy.invoke_tool_stream("get_status", {"board": "main"})]
+
+        assert [e["content"] for e in events if e["type"] == "delta"] == ['{"status": ', '"green"}']
+        assert events[-1] == {"type": "result", "result": {"status": "green"}}
+        assert proxy.call_count == 1
+        assert completions.kwargs["stream_options"] == {"include_usage": True}
+
+    @pytest.mark.asyncio
+    async def test_mock_routing_streams_single_chunk(self, tmp_path):
+        """Proxies with custom routing stream their whole result at once"""
+        proxy = MockRoutedProxyAgent(Path(tmp_path))
+
+        events = [event async for event in proxy.invoke_tool_stream("get_status", {})]
+
+        assert len(events) == 2
+        assert events[-1]["result"] == {"status": "mocked", "tool": "get_status"}
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_rejected(self, tmp_path):
+        """Validation happens before streaming starts"""
+        proxy = MockRoutedProxyAgent(Path(tmp_path))
+
+        with pytest.raises(ValueError):
+            async for _ in proxy.invoke_tool_stream("missing_tool", {}):
+                pass
+
+
+class TestStreamingEndpoint:
+    """Test the Server-Sent Events endpoint"""
+
+    def parse_events(self, body):
+        """Split an SSE body into (event, data) pairs"""
+        events = []
+        for block in body.strip().split("\n\n"):
+            lines = dict(line.split(": ", 1) for line in block.splitlines())
+            events.append((lines["event"], json.loads(lines["data"])))
+        return events
+
+    def test_stream_endpoint(self, tmp_path):
+        """Proxy output is relayed as SSE events"""
+        from santiago_core import api
+
+        api.factory.attach_proxy("santiago-pm", MockRoutedProxyAgent(Path(tmp_path)), "get_status")
+        try:
+            client = TestClient(api.app)
+            response = client.post("/agents/santiago-pm/execute/stream", json={"task_description": "status"})
+        finally:
+            api.factory.streaming_proxies.clear()
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = self.parse_events(response.text)
+        assert [name for name, _ in events] == ["status", "delta", "result", "done"]
+        assert events[2][1]["result"]["status"] == "mocked"
+
+    def test_startup_attaches_role_proxies(self, tmp_path, monkeypatch):
+        """With a provider configured, every agent streams through its proxy"""
+        from santiago_core import api
+
+        monkeypatch.setenv("XAI_API_KEY", "xai-test")
+        monkeypatch.setenv("SANTIAGO_WORKSPACE", str(tmp_path))
+        try:
+            with TestClient(api.app) as client:
+                response = client.post("/agents/santiago-pm/execute/stream", json={"task_description": "status"})
+            attached = {name: tool for name, (_, tool) in api.factory.streaming_proxies.items()}
+        finally:
+            api.factory.streaming_proxies.clear()
+
+        assert attached == {
+            "santiago-pm": "create_feature",
+            "santiago-architect": "create_design",
+            "santiago-developer": "write_code",
+        }
+        events = self.parse_events(response.text)
+        assert [name for name, _ in events] == ["status", "delta", "result", "done"]
+
+    def test_stream_unknown_agent(self):
+        """Unknown agents are rejected before streaming"""
+        from santiago_core import api
+
+        response = TestClient(api.app).post("/agents/nobody/execute/stream", json={"task_description": "x"})
+
+        assert response.status_code == 404